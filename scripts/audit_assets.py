@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Asset Audit
+Checks every page against the files it references, before a build:
+  missing     references (img/srcset, <source>, CSS url(), preloads, posters,
+              scripts, downloads) that point at no file
+  unused      files in filez/ that no page, variant or guide photo uses
+  weight      bytes a visitor downloads per page at a desktop viewport, with
+              the file the browser would pick from each srcset/image-set
+  oversized   images much wider than they are drawn (a 160px avatar from a
+              1500px photo)
+Exits with status 1 when a page is heavier than --budget. Pages are scanned in
+parallel; the whole audit takes well under a second.
+
+Usage: python scripts/audit_assets.py [--budget 1.5MB] [--root dist] [--viewport 1366]
+"""
+
+import argparse
+import glob
+import os
+import re
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from optimize_images import VARIANT_NAME, image_size as read_image_size
+from pack_assets import load_manifest as load_asset_manifest
+from responsive_images import ATTR, _Tag, _sizes
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUIDE_CONTENT = os.path.join(REPO_ROOT, 'scripts', 'guide_content.json')
+
+VIEWPORT = 1366       # CSS pixels of the desktop the weight is estimated for
+OVERSIZE_FACTOR = 2   # an image wider than this many times its drawn width is flagged (2x covers retina)
+OVERSIZE_MIN_BYTES = 20 * 1024
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.jfif', '.png', '.webp', '.avif', '.gif')
+
+# Not site assets: build manifests, and the guide's fonts
+IGNORED = re.compile(r'^filez/(?:fonts/|[^/]*\.json$)')
+
+ATTRS = r"""(?P<attrs>(?:\s+[^\s=/>]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)*)\s*/?>"""
+TOKEN = re.compile(r"""
+    (?P<comment><!--.*?-->)
+  | (?P<picture><picture\b[^>]*>(?P<picture_body>.*?)</picture\s*>)
+  | (?P<style><style\b[^>]*>(?P<css>.*?)</style\s*>)
+  | (?P<script><script\b""" + ATTRS.replace('attrs', 'script_attrs') + r""".*?</script\s*>)
+  | (?P<tag><(?P<name>[a-zA-Z][\w-]*)""" + ATTRS + ")", re.S | re.I | re.X)
+INNER_TAG = re.compile(r"<(?P<name>source|img)" + ATTRS, re.I)
+CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+CSS_SUPPORTS = re.compile(r"@supports[^{]*")
+BG_VAR = re.compile(r"--bg-(\d+)\s*:\s*image-set\((.*?)\)\s*;")
+MEDIA_FEATURE = re.compile(r"\((min|max)-width:\s*(\d+)px\)")
+EXTERNAL = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//|#)', re.I)
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def _human(size):
+    return f"{size / 1024 / 1024:,.2f} MB" if size >= 1024 * 1024 else f"{size / 1024:,.1f} KB"
+
+def parse_size(text):
+    """Byte count from 1500000, 500KB or 1.5MB"""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([KMG]?)i?B?\s*', text, re.I)
+    if not match:
+        raise argparse.ArgumentTypeError(f"not a size: {text!r} (examples: 800KB, 1.5MB)")
+    return int(float(match.group(1)) * 1024 ** ' KMG'.index(match.group(2).upper() or ' '))
+
+def _media_matches(media, viewport):
+    """Whether a (min-width/max-width only) media query holds at the viewport width"""
+    for kind, px in MEDIA_FEATURE.findall(media or ''):
+        if (kind == 'min' and viewport < int(px)) or (kind == 'max' and viewport > int(px)):
+            return False
+    return True
+
+def _pick(candidates, slot):
+    """srcset candidate a browser fetches for a slot of `slot` CSS pixels at 1x"""
+    widths = sorted(candidates, key=lambda c: c[1])
+    return next((ref for ref, w in widths if w >= slot), widths[-1][0])
+
+def _srcset(value):
+    """(url, width) pairs of a srcset; density descriptors count as width 0"""
+    out = []
+    for item in (value or '').split(','):
+        parts = item.split()
+        if parts:
+            width = int(parts[1][:-1]) if len(parts) > 1 and parts[1].endswith('w') else 0
+            out.append((parts[0], width))
+    return out
+
+def _slot(tag, viewport, size=None):
+    """CSS width an image is drawn at, from sizes= or its Tailwind/inline size; None if it fills the viewport"""
+    sizes = tag.get('sizes')
+    if sizes and re.fullmatch(r'\s*\d+px\s*', sizes):
+        return int(sizes.strip()[:-2])
+    if size:
+        drawn = _sizes(tag, {'width': size[0], 'height': size[1]})
+        if drawn.endswith('px'):
+            return int(drawn[:-2])
+    return None
+
+# ===== PAGE SCAN =====
+
+class PageReport:
+    def __init__(self, path):
+        self.path = path
+        self.name = _relpath(path)
+        self.html_bytes = os.path.getsize(path)
+        self.loaded = {}        # file -> bytes, fetched when the page is viewed
+        self.referenced = set()  # every local file named, loaded or not
+        self.missing = []       # (what, reference)
+        self.oversized = []     # (file, intrinsic width, drawn width, bytes)
+        self.external = set()   # URLs on other hosts the page loads
+
+    @property
+    def weight(self):
+        return self.html_bytes + sum(self.loaded.values())
+
+class _Scanner:
+    """Resolves one page's references against the files on disk"""
+    def __init__(self, path, root, viewport, sizes):
+        self.report = PageReport(path)
+        self.dir = os.path.dirname(path)
+        self.root = root
+        self.viewport = viewport
+        self.sizes = sizes
+
+    def resolve(self, ref):
+        """Repo-relative file of a local reference, or None for external URLs"""
+        ref = ref.split('#')[0].split('?')[0].strip()
+        if not ref or EXTERNAL.match(ref):
+            return None
+        path = os.path.join(self.root, ref.lstrip('/')) if ref.startswith('/') else os.path.join(self.dir, ref)
+        return os.path.relpath(os.path.normpath(path), self.root).replace(os.sep, '/')
+
+    def refer(self, what, ref, load=False):
+        """Record a reference; returns its file when it exists"""
+        if ref and re.match(r'^(?:https?:)?//', ref):
+            if load:
+                self.report.external.add(ref)
+            return None
+        rel = self.resolve(ref or '')
+        if rel is None:
+            return None
+        self.report.referenced.add(rel)
+        path = os.path.join(self.root, rel)
+        if not os.path.isfile(path):
+            self.report.missing.append((what, ref))
+            return None
+        if load:
+            self.report.loaded[rel] = os.path.getsize(path)
+        return rel
+
+    def image(self, tag, what, ref, candidates=()):
+        """An image drawn by tag: all candidates are referenced, the chosen one loaded and size-checked"""
+        for candidate, _ in candidates:
+            self.refer(what, candidate)
+        chosen = ref
+        if candidates:
+            slot = _slot(tag, self.viewport) or self.viewport
+            chosen = _pick(candidates, slot)
+        rel = self.refer(what, chosen, load=True)
+        if rel and rel.lower().endswith(IMAGE_EXTENSIONS):
+            size = self.sizes(rel)
+            slot = _slot(tag, self.viewport, size)
+            nbytes = self.report.loaded[rel]
+            if size and slot and size[0] > OVERSIZE_FACTOR * slot and nbytes >= OVERSIZE_MIN_BYTES:
+                self.report.oversized.append((rel, size[0], slot, nbytes))
+
+    def css(self, text, what):
+        for _, ref in CSS_URL.findall(CSS_SUPPORTS.sub('', text)):
+            self.refer(what, ref, load=True)
+
+    def background(self, style, what):
+        """Inline style: the image-set variant for the viewport (as responsive_images.py writes it), else url()s"""
+        variants = {int(w): body for w, body in BG_VAR.findall(style)}
+        for body in variants.values():
+            for _, ref in CSS_URL.findall(body):
+                self.refer(what, ref)
+        if variants:
+            width = next((w for w in sorted(variants) if w >= self.viewport), max(variants))
+            first = CSS_URL.search(variants[width])
+            if first:
+                self.refer(what, first.group(2), load=True)
+            style = BG_VAR.sub('', style)
+        self.css(re.sub(r'--bg-\d+-jpg\s*:[^;]*;?', '', style), what)
+
+    def tag(self, name, tag):
+        get = tag.get
+        if get('style') and 'url(' in get('style'):
+            self.background(get('style'), f"<{name} style>")
+        if name == 'img':
+            self.image(tag, '<img>', get('src'), _srcset(get('srcset')))
+        elif name == 'link':
+            rel = (get('rel') or '').lower().split()
+            media_ok = _media_matches(get('media'), self.viewport)
+            if 'preload' in rel or 'stylesheet' in rel or 'icon' in rel:
+                self.refer(f"<link rel={get('rel')}>", get('href'), load=media_ok and 'apple-touch-icon' not in rel)
+            else:
+                self.refer(f"<link rel={get('rel')}>", get('href')) if rel and rel[0] in ('apple-touch-icon', 'manifest') else None
+        elif name == 'video':
+            if get('poster'):
+                self.refer('<video poster>', get('poster'), load=True)
+        elif name == 'source':  # video/audio sources: fetched on play only
+            self.refer('<source>', get('src'))
+        elif name == 'a' and get('href') and not re.search(r'\.html?$|^/?$', get('href').split('#')[0]):
+            self.refer('<a href>', get('href'))
+
+    def picture(self, body):
+        """The first <source> the browser supports (formats listed best first) or the <img>"""
+        chosen, img = None, None
+        for match in INNER_TAG.finditer(body):
+            tag = _Tag(match.group('name'), match.group('attrs'))
+            if match.group('name').lower() == 'img':
+                img = tag
+            elif chosen is None and _media_matches(tag.get('media'), self.viewport):
+                chosen = tag
+            for candidate, _ in _srcset(tag.get('srcset')):
+                self.refer('<picture>', candidate)
+        if img is None:
+            return
+        source = chosen or img
+        if source is not img:
+            # Size the chosen source with the <img>'s sizes/classes
+            img.set('srcset', source.get('srcset') or '')
+            if source.get('sizes'):
+                img.set('sizes', source.get('sizes'))
+        self.image(img, '<picture>', img.get('src') if source is img else None, _srcset(img.get('srcset')))
+
+    def scan(self, html):
+        for match in TOKEN.finditer(html):
+            kind = match.lastgroup
+            if kind in ('comment',):
+                continue
+            if kind == 'picture' or match.group('picture'):
+                self.picture(match.group('picture_body'))
+            elif match.group('style') is not None:
+                self.css(match.group('css'), '<style>')
+            elif match.group('script') is not None:
+                src = _Tag('script', match.group('script_attrs')).get('src')
+                if src:
+                    self.refer('<script src>', src, load=True)
+            elif match.group('tag') is not None:
+                self.tag(match.group('name').lower(), _Tag(match.group('name'), match.group('attrs')))
+        return self.report
+
+# ===== AUDIT =====
+
+def find_pages(root):
+    return [p for p in sorted(glob.glob(os.path.join(root, '*.html'))) if not os.path.basename(p).startswith('google')]
+
+def _guide_photos():
+    """filez/ files the guide PDF uses (its content file names them relative to scripts/)"""
+    try:
+        with open(GUIDE_CONTENT, encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return set()
+    return {ref.lstrip('./') for ref in re.findall(r'"(?:\.\./)?(filez/[^"]+)"', text)}
+
+def find_unused(root, used):
+    """Files in filez/ no page uses; an original counts as used when one of its variants is"""
+    stems = {VARIANT_NAME.split(rel)[0] if VARIANT_NAME.search(rel) else None for rel in used}
+    stems |= {re.sub(r'-(?:\d+p\.mp4|poster\.webp)$', '', rel) for rel in used}
+    unused = []
+    for dirpath, dirs, files in os.walk(os.path.join(root, 'filez')):
+        dirs.sort()
+        for name in sorted(files):
+            rel = os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, '/')
+            if rel in used or IGNORED.match(rel) or os.path.splitext(rel)[0] in stems:
+                continue
+            if VARIANT_NAME.search(rel) and VARIANT_NAME.split(rel)[0] in stems:
+                continue
+            unused.append((rel, os.path.getsize(os.path.join(dirpath, name))))
+    return unused
+
+def audit(root=REPO_ROOT, viewport=VIEWPORT, jobs=None):
+    """Scan every page in parallel; returns (page reports, unused files)"""
+    cache = {}
+
+    def image_size(rel):
+        if rel not in cache:
+            try:
+                cache[rel] = read_image_size(os.path.join(root, rel))
+            except (OSError, struct.error):
+                cache[rel] = None
+        return cache[rel]
+
+    def scan(path):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        return _Scanner(path, root, viewport, image_size).scan(html)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        reports = list(pool.map(scan, find_pages(root)))
+    used = set().union(*(r.referenced for r in reports)) | (_guide_photos() if root == REPO_ROOT else set())
+    # A built site references the fingerprinted copies under static/
+    used |= {rel for rel, entry in load_asset_manifest(root).items() if entry['file'] in used}
+    return reports, find_unused(root, used)
+
+def print_report(reports, unused, budget=None, viewport=VIEWPORT):
+    over = []
+    missing = [(r.name, what, ref) for r in reports for what, ref in r.missing]
+    if missing:
+        print(f"❌ {len(missing)} missing file(s):")
+        for page, what, ref in sorted(set(missing)):
+            print(f"   {page}: {what} {ref}")
+    else:
+        print("✅ Every referenced file exists")
+
+    oversized = sorted({item for r in reports for item in r.oversized}, key=lambda i: -i[3])
+    if oversized:
+        print(f"⚠️  {len(oversized)} image(s) much larger than drawn:")
+        for rel, width, slot, nbytes in oversized:
+            print(f"   {rel}: {width}px wide for {slot}px ({_human(nbytes)})")
+
+    if unused:
+        print(f"🗑️  {len(unused)} unused file(s) in filez/ ({_human(sum(size for _, size in unused))}):")
+        for rel, size in unused:
+            print(f"   {rel} ({_human(size)})")
+
+    print(f"📦 Page weight at {viewport}px (HTML + local files; external requests not counted):")
+    for r in sorted(reports, key=lambda r: -r.weight):
+        flag = ''
+        if budget and r.weight > budget:
+            over.append(r)
+            flag = f"  ❌ over the {_human(budget)} budget"
+        external = f", {len(r.external)} external request(s)" if r.external else ''
+        print(f"   {r.name}: {_human(r.weight)} in {len(r.loaded) + 1} file(s){external}{flag}")
+    return over
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit the pages' assets: missing, unused, oversized and page weight")
+    parser.add_argument('--budget', type=parse_size, help="fail when a page weighs more (e.g. 1.5MB)")
+    parser.add_argument('--root', default=REPO_ROOT, help="site to audit (default: the repository; dist/ after a build)")
+    parser.add_argument('--viewport', type=int, default=VIEWPORT, help=f"viewport width in CSS pixels (default: {VIEWPORT})")
+    parser.add_argument('-j', '--jobs', type=int, help="worker threads (default: automatic)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    reports, unused = audit(os.path.abspath(args.root), args.viewport, args.jobs)
+    over = print_report(reports, unused, args.budget, args.viewport)
+    print(f"⏱️  Audited {len(reports)} page(s) in {time.perf_counter() - start:.2f}s")
+    return 1 if over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
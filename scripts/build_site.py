@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Static Site Build
+Builds the deployable site into dist/ without any runtime CDN scripts:
+  Tailwind Play CDN     -> dist/assets/site.css with only the utilities the pages use
+  above-the-fold CSS    -> inlined in each page; the full stylesheet loads without blocking
+  Lucide <i data-lucide> -> inline <svg> icons, no icon script
+  HTML, inline JS/CSS   -> minified
+  filez/, favicon, ...  -> copied (hard-linked where possible)
+  filez/, site.css      -> content-hashed copies with .gz/.br siblings (pack_assets.py)
+Only pages and files that changed since the last build are processed again; the
+build manifest is dist/.build-manifest.json. The source pages are never modified.
+
+With --budget, the built pages are audited (audit_assets.py) and the build fails
+when one of them weighs more than the budget.
+
+Usage: python scripts/build_site.py [--force] [--out DIR] [--budget 6MB] [index.html ...]
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+import audit_assets
+import pack_assets
+import site_css
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIST_DIR = os.path.join(REPO_ROOT, 'dist')
+MANIFEST_NAME = '.build-manifest.json'
+CSS_PATH = 'assets/site.css'
+
+# Files deployed as they are (repo-relative names or patterns); pages matching them are not built
+STATIC_FILES = ('filez', 'favicon.ico', 'robots.txt', 'sitemap.xml', 'google*.html', '*.pdf', '*.docx')
+
+# Lucide icons (https://lucide.dev, ISC licence) used by the pages, as drawn by lucide.createIcons()
+ICON_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" '
+            'stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"{attrs}>{body}</svg>')
+ICONS = {
+    'arrow-right': '<path d="M5 12h14"/><path d="m12 5 7 7-7 7"/>',
+    'briefcase': '<path d="M16 20V4a2 2 0 0 0-2-2h-4a2 2 0 0 0-2 2v16"/><rect width="20" height="14" x="2" y="6" rx="2"/>',
+    'church': '<path d="m18 7 4 2v11a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V9l4-2"/>'
+              '<path d="M14 22v-4a2 2 0 0 0-2-2a2 2 0 0 0-2 2v4"/><path d="M18 22V5l-6-3-6 3v17"/>'
+              '<path d="M12 7v5"/><path d="M10 9h4"/>',
+    'graduation-cap': '<path d="M21.42 10.922a1 1 0 0 0-.019-1.838L12.83 5.18a2 2 0 0 0-1.66 0L2.6 9.08a1 1 0 0 0 0 '
+                      '1.832l8.57 3.908a2 2 0 0 0 1.66 0z"/><path d="M22 10v6"/><path d="M6 12.5V16a6 3 0 0 0 12 0v-3.5"/>',
+    'hand-heart': '<path d="M11 14h2a2 2 0 1 0 0-4h-3c-.6 0-1.1.2-1.4.6L3 16"/>'
+                  '<path d="m7 20 1.6-1.4c.3-.4.8-.6 1.4-.6h4c1.1 0 2.1-.4 2.8-1.2l4.6-4.4a2 2 0 0 0-2.75-2.91l-4.2 3.9"/>'
+                  '<path d="m2 15 6 6"/><path d="M19.5 8.5c.7-.7 1.5-1.6 1.5-2.7A2.73 2.73 0 0 0 16 4a2.78 2.78 0 0 0-5 '
+                  '1.8c0 1.2.8 2 1.5 2.8L16 12Z"/>',
+    'handshake': '<path d="m11 17 2 2a1 1 0 1 0 3-3"/><path d="m14 14 2.5 2.5a1 1 0 1 0 3-3l-3.88-3.88a3 3 0 0 0-4.24 '
+                 '0l-.88.88a1 1 0 1 1-3-3l2.81-2.81a5.79 5.79 0 0 1 7.06-.87l.47.28a2 2 0 0 0 1.42.25L21 4"/>'
+                 '<path d="m21 3 1 11h-2"/><path d="M3 3 2 14l6.5 6.5a1 1 0 1 0 3-3"/><path d="M3 4h8"/>',
+    'heart': '<path d="M19 14c1.49-1.46 3-3.21 3-5.5A5.5 5.5 0 0 0 16.5 3c-1.76 0-3 .5-4.5 2-1.5-1.5-2.74-2-4.5-2A5.5 '
+             '5.5 0 0 0 2 8.5c0 2.3 1.5 4.05 3 5.5l7 7Z"/>',
+    'link': '<path d="M10 13a5 5 0 0 0 7.54.54l3-3a5 5 0 0 0-7.07-7.07l-1.72 1.71"/>'
+            '<path d="M14 11a5 5 0 0 0-7.54-.54l-3 3a5 5 0 0 0 7.07 7.07l1.71-1.71"/>',
+    'link-2': '<path d="M9 17H7A5 5 0 0 1 7 7h2"/><path d="M15 7h2a5 5 0 1 1 0 10h-2"/>'
+              '<line x1="8" x2="16" y1="12" y2="12"/>',
+    'mail': '<rect width="20" height="16" x="2" y="4" rx="2"/><path d="m22 7-8.97 5.7a1.94 1.94 0 0 1-2.06 0L2 7"/>',
+    'map-pin': '<path d="M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 '
+               '1 16 0"/><circle cx="12" cy="10" r="3"/>',
+    'phone': '<path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 '
+             '1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 '
+             '16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"/>',
+    'share-2': '<circle cx="18" cy="5" r="3"/><circle cx="6" cy="12" r="3"/><circle cx="18" cy="19" r="3"/>'
+               '<line x1="8.59" x2="15.42" y1="13.51" y2="17.49"/><line x1="15.41" x2="8.59" y1="6.51" y2="10.49"/>',
+    'user': '<path d="M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2"/><circle cx="12" cy="7" r="4"/>',
+    'users': '<path d="M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2"/><circle cx="9" cy="7" r="4"/>'
+             '<path d="M22 21v-2a4 4 0 0 0-3-3.87"/><path d="M16 3.13a4 4 0 0 1 0 7.75"/>',
+}
+
+# Elements whose surrounding whitespace never renders
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'noscript', 'base',
+    'header', 'footer', 'main', 'nav', 'section', 'article', 'aside', 'div', 'form', 'fieldset',
+    'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'hr', 'br',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'blockquote', 'figure', 'figcaption',
+    'picture', 'source', 'video', 'audio', 'iframe', 'option', 'select',
+}
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def _display(path):
+    """Path as shown to the user: repo-relative inside the repo"""
+    rel = _relpath(path)
+    return path if rel.startswith('..') else rel
+
+def _build_hash():
+    """Identity of the build code: a change to it rebuilds every page"""
+    h = hashlib.sha256()
+    for module in (__file__, site_css.__file__):
+        with open(module, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# ===== MINIFY =====
+
+# Tokens of a page: kept verbatim, raw-text elements, comments, tags and the text between them
+HTML_TOKEN = re.compile(r"""
+    (?P<raw><(?P<raw_name>pre|textarea)\b.*?</(?P=raw_name)\s*>)
+  | (?P<script><script\b(?P<script_attrs>[^>]*)>(?P<script_body>.*?)</script\s*>)
+  | (?P<style><style\b(?P<style_attrs>[^>]*)>(?P<style_body>.*?)</style\s*>)
+  | (?P<comment><!--.*?-->)
+  | (?P<tag></?(?P<name>[a-zA-Z][\w-]*)(?:"[^"]*"|'[^']*'|[^'">])*>)
+  | (?P<text>[^<]+|<)""", re.S | re.I | re.X)
+QUOTED = re.compile(r"""("[^"]*"|'[^']*')""")
+
+# JavaScript: strings and template literals are copied, comments dropped, regexes told apart from division
+JS_TOKEN = re.compile(r"""
+    (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<space>\s+)
+  | (?P<word>[\w$]+)
+  | (?P<punct>.)""", re.S | re.X)
+JS_REGEX = re.compile(r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*")
+REGEX_AFTER_WORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case', 'do', 'else'}
+
+def minify_js(code):
+    """Inline script without comments and indentation; line breaks are kept so ASI still applies"""
+    tokens, pos, last = [], 0, ''
+    while pos < len(code):
+        if code[pos] == '/' and code[pos + 1:pos + 2] not in ('/', '*') and \
+                (not last or last in REGEX_AFTER_WORDS or not re.match(r'[\w$)\]]', last[-1])):
+            match = JS_REGEX.match(code, pos)
+            if match:
+                tokens.append(match.group(0))
+                last, pos = match.group(0), match.end()
+                continue
+        match = JS_TOKEN.match(code, pos)
+        pos = match.end()
+        kind, text = match.lastgroup, match.group(0)
+        if kind in ('comment', 'space'):
+            # A removed comment still separates the tokens around it
+            space = '\n' if '\n' in text or text.startswith('//') else ' '
+            if tokens and tokens[-1] in (' ', '\n'):
+                tokens[-1] = '\n' if '\n' in (space, tokens[-1]) else ' '
+            else:
+                tokens.append(space)
+            continue
+        tokens.append(text)
+        last = text
+
+    # Whitespace only matters between two word characters, between + + or - - (a + +b),
+    # and as a line break that may end a statement
+    out = []
+    for i, token in enumerate(tokens):
+        if token not in (' ', '\n'):
+            out.append(token)
+            continue
+        if not out or i + 1 == len(tokens):
+            continue
+        before, after = out[-1][-1], tokens[i + 1][0]
+        if re.match(r'[\w$]', before) and re.match(r'[\w$]', after) or before + after in ('++', '--', '+-', '-+'):
+            out.append(token)
+        elif token == '\n' and re.match(r'[\w$)\]}"\'`+-]', before) and re.match(r'[\w$(\[{"\'`+\-/!~]', after):
+            out.append(token)
+    return ''.join(out)
+
+def _collapse_tag(tag):
+    """A start or end tag with the whitespace between its attributes squeezed"""
+    parts = QUOTED.split(tag)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r'\s+', ' ', parts[i]).replace(' >', '>').replace(' />', '/>')
+    return ''.join(parts)
+
+def minify_html(html):
+    """Page without comments and insignificant whitespace; <pre>/<textarea> are copied as they are"""
+    tokens = []
+    for match in HTML_TOKEN.finditer(html):
+        kind = match.lastgroup
+        if kind == 'comment':
+            continue
+        if kind == 'script':
+            attrs, body = match.group('script_attrs'), match.group('script_body')
+            if 'application/ld+json' in attrs:
+                body = json.dumps(json.loads(body), ensure_ascii=False, separators=(',', ':'))
+            elif 'src=' not in attrs:
+                body = minify_js(body)
+            tokens.append(('block', f"<script{_collapse_tag(attrs + '>')}{body}</script>"))
+        elif kind == 'style':
+            tokens.append(('block', f"<style{_collapse_tag(match.group('style_attrs') + '>')}"
+                                    f"{site_css.minify_css(match.group('style_body'))}</style>"))
+        elif kind == 'tag':
+            block = match.group('name').lower() in BLOCK_TAGS
+            tokens.append(('block' if block else 'inline', _collapse_tag(match.group(0))))
+        elif kind == 'text':
+            tokens.append(('text', re.sub(r'\s+', ' ', match.group(0))))
+        else:
+            tokens.append(('inline', match.group(0)))
+
+    out = []
+    for i, (kind, text) in enumerate(tokens):
+        if kind == 'text':
+            if i == 0 or tokens[i - 1][0] == 'block':
+                text = text.lstrip()
+            if i + 1 == len(tokens) or tokens[i + 1][0] == 'block':
+                text = text.rstrip()
+        out.append(text)
+    return ''.join(out)
+
+# ===== PAGE =====
+
+ICON = re.compile(r"""<i\b(?P<attrs>[^>]*\bdata-lucide\s*=[^>]*)>\s*</i>""", re.I)
+ATTR = re.compile(r"""([^\s=/>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+CDN_SCRIPT = re.compile(r"""[ \t]*<script\s+src="https://(?:cdn\.tailwindcss\.com|unpkg\.com/lucide)[^"]*"[^>]*>\s*</script>\n?""")
+CREATE_ICONS = re.compile(r"""(?:if\s*\(\s*window\.lucide\s*\)\s*)?lucide\.createIcons\(\s*\);?""")
+EMPTY_SCRIPT = re.compile(r"""[ \t]*<script>\s*</script>\n?""")
+FOLD = re.compile(r"""</section\s*>""", re.I)
+CLASS_ATTR = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.I)
+
+def _icon(match):
+    """Inline SVG for one <i data-lucide="name">, keeping its other attributes"""
+    attrs = {}
+    for key, raw in ATTR.findall(match.group('attrs')):
+        attrs[key.lower()] = raw[1:-1] if raw[:1] in ('"', "'") else raw
+    name = attrs.pop('data-lucide')
+    if name not in ICONS:
+        raise ValueError(f"unknown Lucide icon {name!r}: add its SVG to ICONS in {os.path.basename(__file__)}")
+    attrs['class'] = ' '.join(filter(None, ['lucide', f'lucide-{name}', attrs.get('class', '')]))
+    return ICON_SVG.format(attrs=''.join(f' {key}="{value}"' for key, value in attrs.items()), body=ICONS[name])
+
+def above_the_fold(html):
+    """Class names of the header and first section, plus those the page scripts toggle"""
+    body = html[html.find('<body'):]
+    fold = FOLD.search(body)
+    fold_html = body[:fold.end()] if fold else body
+    classes = {name for m in CLASS_ATTR.finditer(fold_html) for name in (m.group(1) or m.group(2) or '').split()}
+    for script in re.findall(r'<script\b[^>]*>(.*?)</script>', html, re.S):
+        classes |= site_css.candidates(script)
+    return classes
+
+def build_page(html, assets=None):
+    """Deployable version of one page; assets maps files to their fingerprinted copies"""
+    html = CDN_SCRIPT.sub('', html)
+    html = CREATE_ICONS.sub('', html)
+    html = EMPTY_SCRIPT.sub('', html)
+    html = ICON.sub(_icon, html)
+
+    # Above-the-fold utilities inline; the whole stylesheet loads without blocking the first paint.
+    # Placed last in <head> so utilities win over the page's own styles, as with the CDN.
+    inline = site_css.minify_css(site_css.stylesheet(above_the_fold(html)))
+    head = (f'<style id="critical-css">{inline}</style>'
+            f'<link rel="preload" href="{CSS_PATH}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{CSS_PATH}"></noscript>\n')
+    html = minify_html(html.replace('</head>', head + '</head>', 1))
+    return pack_assets.rewrite_references(html, assets) if assets else html
+
+# ===== BUILD =====
+
+def find_pages():
+    return [path for path in sorted(glob.glob(os.path.join(REPO_ROOT, '*.html'))) if not _is_static(_relpath(path))]
+
+def _is_static(rel):
+    return any(fnmatch.fnmatch(rel.split('/')[0], pattern) for pattern in STATIC_FILES)
+
+def _static_files():
+    """Repo-relative files deployed without changes"""
+    found = []
+    for pattern in STATIC_FILES:
+        for path in sorted(glob.glob(os.path.join(REPO_ROOT, pattern))):
+            if os.path.isdir(path):
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    found += [_relpath(os.path.join(root, name)) for name in sorted(files)]
+            else:
+                found.append(_relpath(path))
+    return found
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _write(path, data):
+    """Write only when the content changed, so unchanged outputs keep their timestamps"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+    return True
+
+def _copy(src, dst):
+    """Hard-link (else copy) src to dst"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+def build_site(pages=None, out_dir=DIST_DIR, force=False, jobs=None):
+    """Bring out_dir up to date; returns the number of pages rebuilt"""
+    pages = [os.path.abspath(p) for p in pages] if pages else find_pages()
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {} if force else load_manifest(out_dir)
+    build = _build_hash()
+    if manifest.get('build') != build:
+        manifest = {'build': build}
+    manifest.setdefault('pages', {})
+    manifest.setdefault('files', {})
+
+    # The shared stylesheet covers every page, so it is checked on each run (it takes milliseconds)
+    classes, sources = set(), {}
+    for path in find_pages():
+        with open(path, encoding='utf-8') as f:
+            sources[path] = f.read()
+        classes |= site_css.candidates(sources[path])
+    css = site_css.minify_css(site_css.stylesheet(classes))
+    css_changed = _write(os.path.join(out_dir, CSS_PATH), css.encode('utf-8'))
+    print(f"🎨 {CSS_PATH}: {len(css) / 1024:,.1f} KB{' (updated)' if css_changed else ''}")
+
+    copied = 0
+    files = _static_files()
+    for rel in files:
+        stamp = _file_stamp(os.path.join(REPO_ROOT, rel))
+        target = os.path.join(out_dir, rel)
+        if manifest['files'].get(rel) == stamp and os.path.exists(target):
+            continue
+        _copy(os.path.join(REPO_ROOT, rel), target)
+        pack_assets.compress(target)
+        manifest['files'][rel] = stamp
+        copied += 1
+    # Remove files whose source is gone
+    for rel in set(manifest['files']) - set(files):
+        del manifest['files'][rel]
+        for path in [os.path.join(out_dir, rel)] + pack_assets.siblings(os.path.join(out_dir, rel)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # Pages refer to the fingerprinted assets, so a changed asset rebuilds them
+    assets = pack_assets.pack(out_dir, force=force, jobs=jobs)
+    assets_digest = hashlib.sha256(json.dumps(assets, sort_keys=True).encode('utf-8')).hexdigest()
+
+    rebuilt = 0
+    for path in pages:
+        rel = _relpath(path)
+        html = sources.get(path)
+        if html is None:
+            with open(path, encoding='utf-8') as f:
+                html = f.read()
+        digest = hashlib.sha256((assets_digest + html).encode('utf-8')).hexdigest()
+        target = os.path.join(out_dir, rel)
+        if manifest['pages'].get(rel) == digest and os.path.exists(target):
+            continue
+        result = build_page(html, assets)
+        _write(target, result.encode('utf-8'))
+        pack_assets.compress(target)
+        manifest['pages'][rel] = digest
+        rebuilt += 1
+        print(f"   ✓ {rel}: {len(html.encode('utf-8')) / 1024:,.1f} KB → {len(result.encode('utf-8')) / 1024:,.1f} KB")
+
+    _save_manifest(out_dir, manifest)
+    if pack_assets.update_vercel_config():
+        print("✅ Updated the Cache-Control headers in vercel.json: commit it")
+
+    print(f"✅ {rebuilt} of {len(pages)} page(s) rebuilt, {copied} of {len(files)} file(s) copied into {_display(out_dir)}/")
+    return rebuilt
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the static site (purged CSS, inline icons, minified pages)")
+    parser.add_argument('pages', nargs='*', help="pages to build (default: every .html page in the site root)")
+    parser.add_argument('--out', default=DIST_DIR, help="output directory (default: dist/)")
+    parser.add_argument('--force', action='store_true', help="rebuild everything, ignoring the build manifests")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes for asset hashing (default: CPU count)")
+    parser.add_argument('--budget', type=audit_assets.parse_size,
+                        help="fail when a built page weighs more (e.g. 6MB); see audit_assets.py")
+    args = parser.parse_args(argv)
+
+    for path in args.pages:
+        if not os.path.isfile(path):
+            parser.error(f"no such page: {path}")
+    try:
+        build_site(args.pages, out_dir=os.path.abspath(args.out), force=args.force, jobs=args.jobs)
+    except ValueError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    if args.budget:
+        reports, _ = audit_assets.audit(os.path.abspath(args.out), jobs=args.jobs)
+        over = [r for r in reports if r.weight > args.budget]
+        for r in over:
+            print(f"❌ {r.name} weighs {audit_assets._human(r.weight)}, over the "
+                  f"{audit_assets._human(args.budget)} budget (python scripts/audit_assets.py --root {args.out})",
+                  file=sys.stderr)
+        if over:
+            return 1
+        print(f"✅ Every page is within the {audit_assets._human(args.budget)} budget")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
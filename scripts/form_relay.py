@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Form Relay
+Small asyncio service that takes the contact form POSTs in place of Formspree
+and forwards them there, so a flaky connection or a burst after an event never
+loses a message:
+  - every submission is written to a SQLite queue (write-ahead log) before the
+    browser gets its answer, and is forwarded from there; a restart resumes
+    whatever was still queued
+  - a submission identical to one received in the last DEDUPE_SECONDS (double
+    clicks, resubmits after a timeout) is acknowledged but queued only once
+  - due submissions are forwarded in batches over a small pool of keep-alive
+    connections; failures are retried with exponential backoff, and a 429 or
+    Retry-After pauses forwarding as a whole
+  - a submission without the fields Formspree requires (REQUIRED_FIELDS, a
+    valid email) is answered 422 and never queued, so the form can show why;
+    any it still rejects (4xx) is kept in the queue with the error instead of
+    being retried
+Answers mimic Formspree ({"ok": true} or {"errors": [...]}), so the pages'
+scripts work unchanged once the form's data-relay attribute points here.
+Standard library only.
+
+Usage: python scripts/form_relay.py [--port 8787] [--queue form-queue.sqlite3] [--upstream https://formspree.io]
+       POST /f/<form id>       queue a submission (multipart, urlencoded or JSON)
+       GET  /health            queue counts as JSON
+       python scripts/form_relay.py --stand-in --port 8788 [--fail-rate 0.2]
+                               local stand-in for Formspree to test against
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import signal
+import sqlite3
+import ssl
+import sys
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+DEFAULT_UPSTREAM = "https://formspree.io"
+DEFAULT_QUEUE = "form-queue.sqlite3"
+FORM_IDS = ('mdkbzqvn',)          # forms the relay accepts; it is not an open relay
+
+MAX_BODY = 64 * 1024              # bytes of a submission (text fields only)
+MAX_HEADERS = 16 * 1024
+DEDUPE_SECONDS = 24 * 3600
+VOLATILE_FIELDS = {'g-recaptcha-response'}  # differ on every resubmit of the same message
+REQUIRED_FIELDS = ('email', 'message')       # Formspree refuses the contact form without them
+EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+BATCH_SIZE = 50                   # submissions taken from the queue per round
+BATCH_DELAY = 0.05                # seconds to let a burst gather into one batch
+POOL_SIZE = 4                     # keep-alive connections to the upstream
+TIMEOUT = 20                      # seconds per upstream request
+BACKOFF_BASE = 2                  # seconds before the first retry, doubled per attempt
+BACKOFF_MAX = 3600
+KEEP_DAYS = 30                    # forwarded submissions are deleted after this
+
+# ===== QUEUE =====
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    form TEXT NOT NULL,
+    fields TEXT NOT NULL,                   -- JSON list of [name, value] pairs, in the order they were posted
+    digest TEXT NOT NULL,
+    received REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',  -- queued, sent or rejected
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS submissions_due ON submissions (status, next_attempt);
+CREATE INDEX IF NOT EXISTS submissions_digest ON submissions (digest, received);
+"""
+
+class SubmissionQueue:
+    """Durable queue of submissions in a SQLite database in WAL mode
+
+    Only the event loop thread uses it. Each call is one short transaction:
+    with the write-ahead log and synchronous=NORMAL a commit is an append to
+    the log, so an accepted submission survives the relay crashing.
+    """
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def add(self, form, fields, now=None):
+        """Queue a submission; returns its id, or None when it duplicates a recent one"""
+        now = time.time() if now is None else now
+        kept = sorted((name, value) for name, value in fields if name not in VOLATILE_FIELDS)
+        digest = hashlib.sha256(json.dumps([form, kept], ensure_ascii=False).encode('utf-8')).hexdigest()
+        with self.db:
+            if self.db.execute("SELECT 1 FROM submissions WHERE digest = ? AND received > ?",
+                               (digest, now - DEDUPE_SECONDS)).fetchone():
+                return None
+            cursor = self.db.execute(
+                "INSERT INTO submissions (form, fields, digest, received, next_attempt) VALUES (?, ?, ?, ?, ?)",
+                (form, json.dumps(fields, ensure_ascii=False), digest, now, now))
+        return cursor.lastrowid
+
+    def due(self, limit, now=None):
+        """Oldest queued submissions whose next attempt is due: (id, form, fields, attempts)"""
+        now = time.time() if now is None else now
+        rows = self.db.execute("SELECT id, form, fields, attempts FROM submissions "
+                               "WHERE status = 'queued' AND next_attempt <= ? ORDER BY id LIMIT ?", (now, limit))
+        return [(row[0], row[1], json.loads(row[2]), row[3]) for row in rows]
+
+    def next_due(self):
+        """Time of the next queued attempt, or None when the queue is empty"""
+        return self.db.execute("SELECT MIN(next_attempt) FROM submissions WHERE status = 'queued'").fetchone()[0]
+
+    def record(self, results):
+        """Store the outcome of a batch: (id, status, attempts, next attempt, error) per submission"""
+        with self.db:
+            self.db.executemany("UPDATE submissions SET status = ?, attempts = ?, next_attempt = ?, error = ? "
+                                "WHERE id = ?", [(status, attempts, retry, error, submission_id)
+                                                 for submission_id, status, attempts, retry, error in results])
+
+    def purge(self, now=None):
+        """Delete forwarded submissions older than KEEP_DAYS"""
+        now = time.time() if now is None else now
+        with self.db:
+            self.db.execute("DELETE FROM submissions WHERE status = 'sent' AND received < ?",
+                            (now - KEEP_DAYS * 86400,))
+
+    def counts(self):
+        counts = dict(self.db.execute("SELECT status, COUNT(*) FROM submissions GROUP BY status").fetchall())
+        oldest = self.db.execute("SELECT MIN(received) FROM submissions WHERE status = 'queued'").fetchone()[0]
+        return {'queued': counts.get('queued', 0), 'sent': counts.get('sent', 0),
+                'rejected': counts.get('rejected', 0),
+                'oldest_queued_seconds': round(time.time() - oldest, 1) if oldest else None}
+
+    def close(self):
+        self.db.close()
+
+# ===== HTTP =====
+
+REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           408: 'Request Timeout', 413: 'Payload Too Large', 422: 'Unprocessable Entity', 429: 'Too Many Requests',
+           500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+class HTTPError(Exception):
+    """A request the relay answers with an error status"""
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+async def read_head(reader):
+    """Start line and lower-cased headers of an HTTP message; None at a clean end of the connection"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise HTTPError(400, "incomplete request") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(413, "headers too large") from None
+    lines = head.decode('latin-1').split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+async def read_body(reader, headers, limit=None):
+    """Body of an HTTP message with a Content-Length or chunked encoding; without either, up to the end"""
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        body = bytearray()
+        while True:
+            try:
+                line = await reader.readuntil(b"\r\n")
+            except asyncio.LimitOverrunError:
+                raise HTTPError(400, "chunk size line too long") from None
+            size = line.split(b';')[0].strip()
+            if not re.fullmatch(rb"[0-9a-fA-F]{1,8}", size):
+                raise HTTPError(400, "bad chunk size")
+            size = int(size, 16)
+            if limit is not None and len(body) + size > limit:
+                raise HTTPError(413, "submission too large")
+            body += await reader.readexactly(size)
+            if await reader.readexactly(2) != b"\r\n":  # after the chunk (trailers are not used)
+                raise HTTPError(400, "chunk not followed by CRLF")
+            if not size:
+                return bytes(body)
+    if 'content-length' in headers:
+        length = headers['content-length']
+        if not re.fullmatch(r"[0-9]{1,12}", length):
+            raise HTTPError(400, "bad Content-Length")
+        length = int(length)
+        if limit is not None and length > limit:
+            raise HTTPError(413, "submission too large")
+        return await reader.readexactly(length)
+    return await reader.read() if limit is None else b''
+
+BOUNDARY = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+DISPOSITION = re.compile(rb'^content-disposition:[^\r\n]*?\bname="([^"]*)"(?:[^\r\n]*?\bfilename=)?',
+                         re.IGNORECASE | re.MULTILINE)
+
+def _multipart(body, content_type):
+    """Text fields of a multipart/form-data body (the email package is ~100x slower for this)"""
+    match = BOUNDARY.search(content_type)
+    if not match:
+        raise ValueError("multipart body without a boundary")
+    fields = []
+    for part in body.split(b"--" + match.group(1).encode('latin-1'))[1:-1]:
+        head, sep, value = part.partition(b"\r\n\r\n")
+        disposition = DISPOSITION.search(head)
+        if not sep or not disposition or disposition.group(0).lower().endswith(b'filename='):
+            continue
+        fields.append([disposition.group(1).decode('utf-8'), value[:-2].decode('utf-8')])
+    return fields
+
+def parse_fields(body, content_type):
+    """[name, value] pairs of a multipart, urlencoded or JSON form body (uploaded files are dropped)"""
+    kind = content_type.split(';')[0].strip().lower()
+    try:
+        if kind == 'multipart/form-data':
+            return _multipart(body, content_type)
+        if kind == 'application/json':
+            data = json.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            return [[str(name), value if isinstance(value, str) else json.dumps(value)] for name, value in data.items()]
+        return [list(pair) for pair in parse_qsl(body.decode('utf-8'), keep_blank_values=True)]
+    except (ValueError, UnicodeDecodeError, LookupError) as exc:
+        raise HTTPError(400, f"unreadable form data: {exc}") from None
+
+def check_fields(fields):
+    """Formspree-style errors for a submission it would refuse; empty when it is complete"""
+    values = {}
+    for name, value in fields:
+        values.setdefault(name, value.strip())
+    errors = [{'field': name, 'code': 'REQUIRED_FIELD_MISSING', 'message': f"{name} is required"}
+              for name in REQUIRED_FIELDS if not values.get(name)]
+    if values.get('email') and not EMAIL.match(values['email']):
+        errors.append({'field': 'email', 'code': 'TYPE_EMAIL', 'message': "email should be an email address"})
+    return errors
+
+def response(status, body=b'', headers=(), keep_alive=True):
+    """Bytes of an HTTP/1.1 response"""
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}", f"Content-Length: {len(body)}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    lines += [f"{name}: {value}" for name, value in headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+def json_response(status, data, headers=(), keep_alive=True):
+    return response(status, json.dumps(data).encode('utf-8'),
+                    [('Content-Type', 'application/json')] + list(headers), keep_alive)
+
+async def serve_connection(reader, writer, handle, timeout=30):
+    """Answer the requests of one keep-alive connection with handle(method, path, headers, body)"""
+    try:
+        while True:
+            try:
+                head = await asyncio.wait_for(read_head(reader), timeout)
+                if head is None:
+                    break
+                start, headers = head
+                method, path, version = (start.split(' ') + ['', ''])[:3]
+                body = await asyncio.wait_for(read_body(reader, headers, MAX_BODY), timeout) \
+                    if method == 'POST' else b''
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(handle(method, path, headers, body, keep_alive))
+            except HTTPError as exc:
+                writer.write(json_response(exc.status, {'errors': [{'message': str(exc)}]}, keep_alive=False))
+                keep_alive = False
+            except asyncio.TimeoutError:
+                keep_alive = False
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    except asyncio.CancelledError:
+        pass  # the server shutting down with the connection still open
+    finally:
+        writer.close()
+
+class UpstreamPool:
+    """At most size keep-alive HTTP/1.1 connections to one origin, reused between requests"""
+    def __init__(self, url, size=POOL_SIZE, timeout=TIMEOUT):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.base = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _connect(self):
+        return await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout)
+
+    async def _exchange(self, connection, request):
+        reader, writer = connection
+        writer.write(request)
+        await writer.drain()
+        head = await read_head(reader)
+        if head is None:
+            raise ConnectionResetError("connection closed before the response")
+        start, headers = head
+        body = await read_body(reader, headers)
+        keep = start.startswith('HTTP/1.1') and headers.get('connection', '').lower() != 'close' and \
+            ('content-length' in headers or 'chunked' in headers.get('transfer-encoding', '').lower())
+        return int(start.split(' ')[1]), headers, body, keep
+
+    async def post(self, path, fields):
+        """POST fields urlencoded; returns (status, lower-cased headers, body). Raises OSError on network failure."""
+        body = urlencode([tuple(pair) for pair in fields]).encode('utf-8')
+        request = (f"POST {self.base}{path} HTTP/1.1\r\nHost: {self.host}\r\nAccept: application/json\r\n"
+                   f"Content-Type: application/x-www-form-urlencoded\r\nContent-Length: {len(body)}\r\n"
+                   f"User-Agent: angaza-form-relay\r\n\r\n").encode('latin-1') + body
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            reused = connection is not None
+            while True:
+                if connection is None:
+                    connection = await self._connect()
+                try:
+                    status, headers, data, keep = await asyncio.wait_for(self._exchange(connection, request),
+                                                                         self.timeout)
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, HTTPError, ValueError) as exc:
+                    connection[1].close()
+                    connection = None
+                    if reused and isinstance(exc, (ConnectionError, asyncio.IncompleteReadError)):
+                        # The upstream closed the idle connection: send again on a fresh one
+                        reused = False
+                        continue
+                    raise OSError(f"upstream request failed: {exc!r}") from None
+                if keep:
+                    self._idle.append(connection)
+                else:
+                    connection[1].close()
+                return status, headers, data
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+# ===== RELAY =====
+
+class Relay:
+    """Accepts submissions into the queue and forwards them upstream in the background"""
+    def __init__(self, queue, upstream, forms=FORM_IDS, allow_origin='*', log=sys.stdout):
+        self.queue = queue
+        self.pool = UpstreamPool(upstream)
+        self.forms = set(forms)
+        self.allow_origin = allow_origin
+        self.log = log
+        self.paused_until = 0.0
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def _cors(self, headers):
+        origin = headers.get('origin')
+        if self.allow_origin == '*' or origin == self.allow_origin:
+            return [('Access-Control-Allow-Origin', origin or '*'), ('Vary', 'Origin')]
+        return []
+
+    def handle(self, method, path, headers, body, keep_alive=True):
+        """Response bytes for one request"""
+        cors = self._cors(headers)
+        route = path.split('?')[0].rstrip('/')
+        if route == '/health' and method == 'GET':
+            return json_response(200, self.queue.counts(), cors, keep_alive)
+        form = route[len('/f/'):] if route.startswith('/f/') else None
+        if form not in self.forms:
+            return json_response(404, {'errors': [{'message': "unknown form"}]}, cors, keep_alive)
+        if method == 'OPTIONS':
+            return response(204, headers=cors + [('Access-Control-Allow-Methods', 'POST'),
+                                                 ('Access-Control-Allow-Headers', 'Accept, Content-Type'),
+                                                 ('Access-Control-Max-Age', '86400')], keep_alive=keep_alive)
+        if method != 'POST':
+            return json_response(405, {'errors': [{'message': "use POST"}]}, cors + [('Allow', 'POST')], keep_alive)
+        try:
+            fields = parse_fields(body, headers.get('content-type', ''))
+        except HTTPError as exc:
+            return json_response(exc.status, {'errors': [{'message': str(exc)}]}, cors, keep_alive)
+        if not fields:
+            return json_response(400, {'errors': [{'message': "empty submission"}]}, cors, keep_alive)
+        errors = check_fields(fields)
+        if errors:
+            # Refused here, while the visitor can still correct it, rather than by Formspree after queueing
+            return json_response(422, {'errors': errors}, cors, keep_alive)
+        submission_id = self.queue.add(form, fields)
+        if submission_id is not None:
+            self._wakeup.set()
+        return json_response(200, {'ok': True, 'queued': submission_id is not None}, cors, keep_alive)
+
+    async def _forward(self, submission):
+        """Send one submission; returns its queue record"""
+        submission_id, form, fields, attempts = submission
+        attempts += 1
+        try:
+            status, headers, body = await self.pool.post(f"/f/{form}", fields)
+        except OSError as exc:
+            return self._retry(submission_id, attempts, str(exc))
+        if 200 <= status < 300:
+            return submission_id, 'sent', attempts, time.time(), None
+        error = f"HTTP {status}: {body[:300].decode('utf-8', 'replace')}"
+        if status in (408, 429) or status >= 500:
+            retry_after = headers.get('retry-after', '')
+            if status == 429 or retry_after.isdigit():
+                # Rate limited: hold every submission back, not only this one
+                self.paused_until = max(self.paused_until, time.time() + (int(retry_after) if retry_after.isdigit()
+                                                                          else BACKOFF_BASE * 2 ** min(attempts, 10)))
+            return self._retry(submission_id, attempts, error)
+        return submission_id, 'rejected', attempts, time.time(), error
+
+    def _retry(self, submission_id, attempts, error):
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+        return submission_id, 'queued', attempts, max(time.time() + delay, self.paused_until), error
+
+    async def forward_forever(self):
+        """Forward due submissions batch by batch until stop() is called"""
+        purged = 0.0
+        while not self._stopping:
+            now = time.time()
+            if now - purged > 3600:
+                self.queue.purge(now)
+                purged = now
+            batch = self.queue.due(BATCH_SIZE, now) if now >= self.paused_until else []
+            if not batch:
+                # Sleep until the next retry is due, a new submission arrives or an hour has passed
+                next_due = self.queue.next_due()
+                wait = 3600 if next_due is None else max(next_due, self.paused_until) - now
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(wait, 0.01))
+                    await asyncio.sleep(BATCH_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            results = await asyncio.gather(*(self._forward(submission) for submission in batch))
+            self.queue.record(results)
+            sent = sum(1 for result in results if result[1] == 'sent')
+            failed = [result for result in results if result[1] != 'sent']
+            print(f"📨 Forwarded {sent}/{len(results)}" +
+                  (f"; {len(failed)} kept ({failed[0][4]})" if failed else ""), file=self.log, flush=True)
+
+    def stop(self):
+        self._stopping = True
+        self._wakeup.set()
+
+async def run_relay(host, port, queue_path, upstream, forms=FORM_IDS, allow_origin='*'):
+    """Serve the relay until SIGINT/SIGTERM; the forwarder finishes its current batch first"""
+    queue = SubmissionQueue(queue_path)
+    relay = Relay(queue, upstream, forms, allow_origin)
+    server = await asyncio.start_server(lambda r, w: serve_connection(r, w, relay.handle), host, port,
+                                        limit=MAX_HEADERS, backlog=1024)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+    counts = queue.counts()
+    print(f"📮 Relaying forms {', '.join(sorted(relay.forms))} on http://{host}:{port}/f/<form> → {upstream} "
+          f"({counts['queued']} queued)", flush=True)
+    forwarder = asyncio.create_task(relay.forward_forever())
+    # A forwarder that died must not leave the relay accepting what it can no longer send
+    forwarder.add_done_callback(lambda task: stopped.set())
+    async with server:
+        await stopped.wait()
+    relay.stop()
+    await forwarder
+    relay.pool.close()
+    queue.close()
+    print("👋 Relay stopped", flush=True)
+
+# ===== STAND-IN UPSTREAM =====
+
+async def run_stand_in(host, port, fail_rate=0.0, rate_limit=None):
+    """Local stand-in for Formspree: accepts any /f/<form> POST, failing a fraction of them
+
+    fail_rate answers that share of requests with 503; rate_limit answers 429 once
+    more than that many requests arrive in one second.
+    """
+    stats = {'accepted': 0, 'failed': 0, 'limited': 0}
+    window = [0, 0]  # second, requests in it
+
+    def handle(method, path, headers, body, keep_alive=True):
+        if method != 'POST' or not path.startswith('/f/'):
+            return json_response(404, {'errors': [{'message': "not found"}]}, keep_alive=keep_alive)
+        second = int(time.time())
+        window[:] = [second, window[1] + 1] if window[0] == second else [second, 1]
+        if rate_limit and window[1] > rate_limit:
+            stats['limited'] += 1
+            return json_response(429, {'errors': [{'message': "rate limited"}]}, [('Retry-After', '1')], keep_alive)
+        if random.random() < fail_rate:
+            stats['failed'] += 1
+            return json_response(503, {'errors': [{'message': "unavailable"}]}, keep_alive=keep_alive)
+        fields = parse_fields(body, headers.get('content-type', ''))
+        if not any(name == 'email' and value for name, value in fields):
+            return json_response(422, {'errors': [{'message': "email is required"}]}, keep_alive=keep_alive)
+        stats['accepted'] += 1
+        return json_response(200, {'ok': True, 'next': '/thanks'}, keep_alive=keep_alive)
+
+    server = await asyncio.start_server(lambda r, w: serve_connection(r, w, handle), host, port, backlog=1024)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+    print(f"🧪 Stand-in form endpoint on http://{host}:{port}/f/<form>", flush=True)
+    async with server:
+        await stopped.wait()
+    print(f"🧪 Stand-in: {stats['accepted']} accepted, {stats['failed']} failed, {stats['limited']} rate-limited",
+          flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Queue the website's form submissions and forward them to Formspree")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--queue', default=DEFAULT_QUEUE, help="SQLite queue database")
+    parser.add_argument('--upstream', default=DEFAULT_UPSTREAM, help="where submissions are forwarded")
+    parser.add_argument('--form', action='append', help=f"form id to accept (repeatable, default: {', '.join(FORM_IDS)})")
+    parser.add_argument('--allow-origin', default='*', help="site origin allowed to post (default: any)")
+    parser.add_argument('--stand-in', action='store_true', help="run a local stand-in for the upstream instead")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="stand-in: share of requests answered with 503")
+    parser.add_argument('--rate-limit', type=int, help="stand-in: requests per second before answering 429")
+    args = parser.parse_args(argv)
+
+    if args.stand_in:
+        asyncio.run(run_stand_in(args.host, args.port, args.fail_rate, args.rate_limit))
+    else:
+        asyncio.run(run_relay(args.host, args.port, args.queue, args.upstream, args.form or FORM_IDS, args.allow_origin))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
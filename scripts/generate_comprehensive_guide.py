@@ -4,16 +4,59 @@ Angaza Tumaini Mission Center - Complete Comprehensive Guide
 Single Document: User Manual + Documentation + FAQ + Billing
 Generated: November 29, 2025
 Style: Professional Modern & Classic with unified design
+Content: guide_content.json (validated by guide_content.py)
 """
 
+import argparse
+import functools
+import hashlib
+import html
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+# Process pools, archives and cProfile are imported where they are used: most
+# runs need none of them and every import adds to CLI start-up time
+
+if __name__ == "__main__":
+    # A run with nothing to build is answered from the cache manifest, before
+    # ReportLab (a good part of a second) is imported
+    from guide_cache import answer_up_to_date
+    if answer_up_to_date(sys.argv[1:]):
+        sys.exit(0)
+
+import reportlab
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, white, black
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image
+from reportlab.platypus import SimpleDocTemplate, Spacer, PageBreak, Table, TableStyle, Image
 from reportlab.platypus import KeepTogether
-from datetime import datetime
+from reportlab.platypus import Paragraph as PlatypusParagraph
+from reportlab.platypus.doctemplate import ActionFlowable
+from reportlab.platypus.flowables import ImageAndFlowables
+from reportlab.platypus.tableofcontents import TableOfContents
+from datetime import date, datetime
+
+import guide_fonts
+import guide_images
+import guide_ledger
+import guide_webpdf
+from guide_cache import (DEFAULT_CACHE_DIR, FONTS_DIR, IMAGES_DIR, PARTS_DIR, build_key, current, edition_dir, file_stamp,
+                         input_stamps, load_manifest, save_manifest)
+from guide_content import (DEFAULT_CONTENT_PATH, Content, ContentError, Recipient, TableBlock, chapter_titles,
+                           load_content, load_recipients)
+from guide_fonts import HELVETICA, load_fonts
+from guide_images import ImageCache, file_digest, shared_cache
+from guide_ledger import Ledger
+from guide_profile import BuildProfile, phase, write_report
+from guide_translations import DATE_LABELS, LOCALES, SOURCE_LOCALE, TranslationMemory, load_edition
 
 # Color Scheme (Modern & Classic)
 PRIMARY_COLOR = HexColor('#1D4ED8')        # Deep Blue
@@ -23,716 +66,1374 @@ DARK_COLOR = HexColor('#1F2937')           # Charcoal
 LIGHT_GRAY = HexColor('#F3F4F6')           # Light Gray
 TEXT_COLOR = HexColor('#374151')           # Medium Gray
 
+# Colour themes. primary/secondary/accent are the palette names usable from the
+# content file; every theme defines the same keys.
+THEMES = {
+    'default': {
+        'primary': PRIMARY_COLOR, 'secondary': SECONDARY_COLOR, 'accent': ACCENT_COLOR,
+        'dark': DARK_COLOR, 'light': LIGHT_GRAY, 'text': TEXT_COLOR,
+        'muted': HexColor('#6B7280'), 'grid': HexColor('#D1D5DB'),
+    },
+    # Print-friendly: no ink-heavy colour, distinctions kept by weight and tone
+    'grayscale': {
+        'primary': HexColor('#2B2B2B'), 'secondary': HexColor('#4D4D4D'), 'accent': HexColor('#A6A6A6'),
+        'dark': HexColor('#111111'), 'light': HexColor('#F2F2F2'), 'text': HexColor('#333333'),
+        'muted': HexColor('#666666'), 'grid': HexColor('#BFBFBF'),
+    },
+    # Low vision: near-black text, dark saturated headings, strong borders
+    'high-contrast': {
+        'primary': HexColor('#002A80'), 'secondary': HexColor('#005A32'), 'accent': HexColor('#FFC400'),
+        'dark': black, 'light': HexColor('#EDEDED'), 'text': black,
+        'muted': HexColor('#262626'), 'grid': black,
+    },
+}
+DEFAULT_THEME = 'default'
+
+# Incremental build cache (layout in guide_cache.py): bump CACHE_VERSION whenever the key layout changes
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Modules whose code decides what a build draws; a change to any of them invalidates the cached sections
+CODE_FILES = ('generate_comprehensive_guide.py', 'guide_content.py', 'guide_fonts.py', 'guide_images.py',
+              'guide_ledger.py', 'guide_translations.py')
+
+# Chunk size used when streaming a finished PDF to a file object
+STREAM_CHUNK = 64 * 1024
+CACHE_VERSION = 7
+
+# Drawn size of photos: square team portraits, full-width program photos
+PORTRAIT_SIZE = 1.1*inch
+CONTENT_WIDTH = letter[0] - 1.5*inch
+PROGRAM_PHOTO_HEIGHT = 2.2*inch
+
+# Form XObject holding the page total of the header, defined once the last page is known
+TOTAL_FORM = 'PageTotal'
+
+# Text the page template and ledgers draw themselves; other editions translate it like the content
+PAGE_LABEL = "Page {page} of "
+GENERATED_LABEL = "Generated: {date}"
+LABELS = (PAGE_LABEL, GENERATED_LABEL, guide_ledger.BROUGHT_FORWARD, guide_ledger.PAGE_TOTAL,
+          guide_ledger.TOTAL) + DATE_LABELS
+
+# Paragraphs in this style are the chapter headings: they feed the table of contents and PDF outline
+MAIN_HEADING_STYLE = 'MainHeading'
+
 class HeaderFooterCanvas(canvas.Canvas):
-    """Custom canvas with professional header and footer"""
+    """Custom canvas with professional header and footer
+    
+    The header reads "Page N of Y". The total is not known until the last page,
+    so every page draws a reference to one form XObject that save() fills in:
+    nothing is kept per page, however long the document. A canvas that renders
+    part of a document (parallel sections, personalized letters) is told how
+    many pages follow its own in pages_after, and the document's total in
+    expected_pages when it is known. A canvas that had to guess the total
+    leaves reserved_exactly False when a guess needed a different width.
+    """
+    header_title = "Angaza Tumaini Mission Center — Complete Guide"
+    page_label = PAGE_LABEL
+    generated_label = None  # footer text; today's date in English when not set, nothing when ''
+    first_page = 1
+    pages_after = 0
+    expected_pages = None  # total of the document (or of the previous layout pass), to size the space left for it
+    reserved_exactly = True
+    profile = None
+    colors = THEMES[DEFAULT_THEME]
+    fonts = SimpleNamespace(heading=HELVETICA, body=HELVETICA)
+    
     def __init__(self, *args, **kwargs):
         canvas.Canvas.__init__(self, *args, **kwargs)
-        self.page_num = 0
+        self.page_num = self.first_page - 1
+        self._reserved = set()  # widths left for the total, one per distinct guess
         
     def showPage(self):
         self.page_num += 1
+        start = time.perf_counter()
         self._drawHeader()
         self._drawFooter()
+        if self.profile is not None:
+            self.profile.page_drawn(time.perf_counter() - start)
         canvas.Canvas.showPage(self)
+    
+    def save(self):
+        with phase(self.profile, 'write'):
+            self._drawTotal()
+            canvas.Canvas.save(self)
         
     def _drawHeader(self):
         """Draw professional header"""
         self.saveState()
         # Header bar
-        self.setFillColor(PRIMARY_COLOR)
+        self.setFillColor(self.colors['primary'])
         self.rect(0, letter[1] - 0.5*inch, letter[0], 0.5*inch, fill=1, stroke=0)
         
-        # Header text
-        self.setFont("Helvetica-Bold", 10)
+        # Header text; the total is the TOTAL_FORM drawn at the right edge
+        font, right, y = self.fonts.heading['bold'], letter[0] - 0.5*inch, letter[1] - 0.25*inch
+        total = self.expected_pages or self.page_num + self.pages_after
+        reserved = stringWidth(str(total), font, 10)
+        self._reserved.add(reserved)
+        self.setFont(font, 10)
         self.setFillColor(white)
-        self.drawString(0.5*inch, letter[1] - 0.25*inch, "Angaza Tumaini Mission Center — Complete Guide")
-        self.drawRightString(letter[0] - 0.5*inch, letter[1] - 0.25*inch, f"Page {self.page_num}")
+        self.drawString(0.5*inch, y, self.header_title)
+        self.drawRightString(right - reserved, y, self.page_label.format(page=self.page_num))
+        self.translate(right, y)
+        self.doForm(TOTAL_FORM)
         self.restoreState()
+    
+    def _drawTotal(self):
+        """Define the form every header refers to: the page total, right-aligned at the form's origin"""
+        total = str(self.page_num + self.pages_after)
+        self.beginForm(TOTAL_FORM, lowerx=-letter[0], lowery=-0.5*inch, upperx=0, uppery=0.5*inch)
+        self.setFont(self.fonts.heading['bold'], 10)
+        self.setFillColor(white)
+        self.drawRightString(0, 0, total)
+        self.endForm()
+        type(self).reserved_exactly = self._reserved <= {stringWidth(total, self.fonts.heading['bold'], 10)}
         
     def _drawFooter(self):
         """Draw professional footer"""
         self.saveState()
         # Footer line
-        self.setStrokeColor(LIGHT_GRAY)
+        self.setStrokeColor(self.colors['light'])
         self.setLineWidth(1)
         self.line(0.5*inch, 0.4*inch, letter[0] - 0.5*inch, 0.4*inch)
         
         # Footer text
-        self.setFont("Helvetica", 8)
-        self.setFillColor(TEXT_COLOR)
+        self.setFont(self.fonts.body['normal'], 8)
+        self.setFillColor(self.colors['text'])
         self.drawString(0.5*inch, 0.2*inch, "© 2025 Angaza Tumaini Mission Center | Kibera, Nairobi, Kenya")
-        self.drawRightString(letter[0] - 0.5*inch, 0.2*inch, f"Generated: {datetime.now().strftime('%B %d, %Y')}")
+        if self.generated_label is None:
+            _draw_generated(self, GENERATED_LABEL.format(date=datetime.now().strftime('%B %d, %Y')), self.fonts)
+        elif self.generated_label:
+            _draw_generated(self, self.generated_label, self.fonts)
         self.restoreState()
 
-def create_comprehensive_guide():
-    """Generate single comprehensive document"""
-    filename = "Angaza-Tumaini-Comprehensive-Guide.pdf"
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch,
-        canvasmaker=HeaderFooterCanvas
-    )
+def _draw_generated(canv, label, fonts):
+    """The footer's "Generated: <date>", right-aligned (text colour and state set by the caller)"""
+    canv.setFont(fonts.body['normal'], 8)
+    canv.drawRightString(letter[0] - 0.5*inch, 0.2*inch, label)
+
+class Paragraph(PlatypusParagraph):
+    """Paragraph that keeps its line breaks between layout passes
     
-    styles = getSampleStyleSheet()
+    A table of contents needs the document laid out at least twice. Frames have
+    the same width on every pass, so breaking the text into lines again would
+    redo identical work; wrap() reuses the previous result for the same width.
+    Emoji and symbols the brand fonts lack are drawn in a fallback font.
+    """
+    def __init__(self, text, style=None, *args, **kwargs):
+        # split() builds the halves from already-parsed fragments and passes no text
+        PlatypusParagraph.__init__(self, text if text is None else load_fonts().markup(text), style, *args, **kwargs)
+    
+    def wrap(self, availWidth, availHeight):
+        wrapped = self.__dict__.get('_wrapped')
+        if wrapped and wrapped[0] == availWidth:
+            _, self.width, self._wrapWidths, self.blPara, self.height = wrapped
+            return self.width, self.height
+        size = PlatypusParagraph.wrap(self, availWidth, availHeight)
+        if 'blPara' in self.__dict__:
+            self._wrapped = (availWidth, self.width, self._wrapWidths, self.blPara, self.height)
+        return size
+
+def escape(text):
+    """Escape &, < and > for paragraph markup"""
+    return html.escape(text, quote=False)
+
+def _heading_key(text):
+    """Named destination for a chapter heading, stable across passes and section parts"""
+    return 'chapter-' + (re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'untitled')
+
+class GuideTableOfContents(TableOfContents):
+    """Table of contents filled from the chapter headings as they are laid out
+    
+    With entries given up front (a section rendered on its own in a parallel
+    build) it is not an indexing flowable and is laid out in a single pass.
+    """
+    def __init__(self, entries=None, **kwargs):
+        TableOfContents.__init__(self, **kwargs)
+        self._fixed = entries is not None
+        if self._fixed:
+            self._lastEntries = list(entries)
+    
+    def isIndexing(self):
+        return 0 if self._fixed else 1
+
+class GuideDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that draws with the canvasmaker given to the constructor
+    
+    ReportLab only honours canvasmaker as a build() argument, so passing it to the
+    constructor alone silently falls back to the plain canvas (no header/footer).
+    Every main heading is bookmarked, added to the PDF outline and reported to the
+    table of contents; layout() repeats the build until its page numbers settle.
+    """
+    def __init__(self, filename, canvasmaker=canvas.Canvas, profile=None, **kwargs):
+        SimpleDocTemplate.__init__(self, filename, **kwargs)
+        self.canvasmaker = canvasmaker
+        self.profile = profile
+    
+    def build(self, flowables, **kwargs):
+        kwargs.setdefault('canvasmaker', self.canvasmaker)
+        if self.profile is not None:
+            self.profile.begin_pass()
+        SimpleDocTemplate.build(self, flowables, **kwargs)
+        maker = kwargs['canvasmaker']
+        if isinstance(maker, type) and issubclass(maker, HeaderFooterCanvas):
+            # The next pass leaves exactly the room this total needs
+            maker.expected_pages = maker.first_page - 1 + self.page + maker.pages_after
+    
+    def layout(self, flowables):
+        """Build in as many passes as the table of contents needs (one without it)"""
+        return self.multiBuild(flowables)
+    
+    def reserved_exactly(self):
+        """Whether every header left exactly the room the final page total needs"""
+        maker = self.canvasmaker
+        return not (isinstance(maker, type) and issubclass(maker, HeaderFooterCanvas)) or maker.reserved_exactly
+    
+    def handle_flowable(self, flowables):
+        if self.profile is None:
+            return SimpleDocTemplate.handle_flowable(self, flowables)
+        flowable, page = flowables[0], self.page
+        start = time.perf_counter()
+        SimpleDocTemplate.handle_flowable(self, flowables)
+        # A break belongs to the page it ended, a flowable to the page it was drawn on;
+        # the page actions a break queues draw nothing and belong to no page
+        if isinstance(flowable, ActionFlowable):
+            page = None
+        else:
+            page = (page if isinstance(flowable, PageBreak) else self.page) + getattr(self.canv, 'first_page', 1) - 1
+        self.profile.flowable(flowable, time.perf_counter() - start, page)
+    
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, PlatypusParagraph) and flowable.style.name == MAIN_HEADING_STYLE:
+            text = flowable.getPlainText()
+            key = _heading_key(text)
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(text, key, level=0)
+            self.notify('TOCEntry', (0, load_fonts().markup(escape(text)), self.page + getattr(self.canv, 'first_page', 1) - 1, key))
+
+# ===== THEMES =====
+# Paragraph styles never change once built, so each theme is built on first use
+# and shared by every later build in the process (server requests, batch
+# documents, parallel section workers).
+
+_themes = {}
+
+def theme_styles(theme=DEFAULT_THEME):
+    """Paragraph styles and colours of a theme, built once per process"""
+    if theme not in _themes:
+        if theme not in THEMES:
+            raise ContentError(f"unknown theme {theme!r} (available: {', '.join(THEMES)})")
+        _themes[theme] = _make_theme(theme)
+    return _themes[theme]
+
+def _make_theme(theme):
+    colors = THEMES[theme]
+    fonts = load_fonts()
+    st = SimpleNamespace(theme=theme, colors=colors, fonts=fonts)
+    st.base = getSampleStyleSheet()
     
     # Title style
-    title_style = ParagraphStyle(
+    st.title = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Heading1'],
+        parent=st.base['Heading1'],
         fontSize=28,
-        textColor=PRIMARY_COLOR,
+        textColor=colors['primary'],
         spaceAfter=12,
         alignment=1,
-        fontName='Helvetica-Bold',
+        fontName=fonts.heading['bold'],
         letterSpacing=1
     )
     
     # Main heading
-    main_heading = ParagraphStyle(
-        'MainHeading',
-        parent=styles['Heading2'],
+    st.main_heading = ParagraphStyle(
+        MAIN_HEADING_STYLE,
+        parent=st.base['Heading2'],
         fontSize=16,
         textColor=white,
         spaceAfter=12,
         spaceBefore=12,
-        fontName='Helvetica-Bold',
-        backColor=PRIMARY_COLOR,
+        fontName=fonts.heading['bold'],
+        backColor=colors['primary'],
         borderPadding=12,
         alignment=0
     )
     
     # Section heading
-    heading_style = ParagraphStyle(
+    st.heading = ParagraphStyle(
         'SectionHeading',
-        parent=styles['Heading2'],
+        parent=st.base['Heading2'],
         fontSize=14,
-        textColor=PRIMARY_COLOR,
+        textColor=colors['primary'],
         spaceAfter=10,
         spaceBefore=10,
-        fontName='Helvetica-Bold',
-        borderColor=ACCENT_COLOR,
+        fontName=fonts.heading['bold'],
+        borderColor=colors['accent'],
         borderWidth=2,
         borderPadding=8,
-        backColor=LIGHT_GRAY
+        backColor=colors['light']
     )
     
     # Subsection
-    subheading_style = ParagraphStyle(
+    st.subheading = ParagraphStyle(
         'SubHeading',
-        parent=styles['Heading3'],
+        parent=st.base['Heading3'],
         fontSize=12,
-        textColor=SECONDARY_COLOR,
+        textColor=colors['secondary'],
         spaceAfter=8,
         spaceBefore=8,
-        fontName='Helvetica-Bold'
+        fontName=fonts.heading['bold']
     )
     
     # Body text
-    body_style = ParagraphStyle(
+    st.body = ParagraphStyle(
         'CustomBody',
-        parent=styles['BodyText'],
+        parent=st.base['BodyText'],
         fontSize=10,
-        textColor=TEXT_COLOR,
+        textColor=colors['text'],
         alignment=4,
         spaceAfter=8,
         leading=14,
-        fontName='Helvetica'
+        fontName=fonts.body['normal']
     )
     
     # Light body
-    light_body = ParagraphStyle(
+    st.light_body = ParagraphStyle(
         'LightBody',
-        parent=body_style,
+        parent=st.body,
         fontSize=9,
-        textColor=HexColor('#6B7280'),
+        textColor=colors['muted'],
         alignment=0
     )
     
-    story = []
+    # Table of contents line (page number and dot leader are drawn to the right)
+    st.toc = ParagraphStyle(
+        'TOCEntry',
+        parent=st.body,
+        alignment=0,
+        rightIndent=0.5*inch,
+        spaceAfter=0,
+        leading=20
+    )
     
-    # ===== COVER PAGE =====
-    story.append(Spacer(1, 1.5*inch))
-    story.append(Paragraph("Angaza Tumaini", title_style))
-    story.append(Paragraph("Mission Center", title_style))
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("Complete Comprehensive Guide", ParagraphStyle(
+    # Highlighted quotes, one per palette colour
+    st.quote = {name: ParagraphStyle('quote', parent=st.body, fontSize=10, italic=True, leftIndent=20,
+                                     textColor=colors[name])
+                for name in ('primary', 'secondary', 'accent')}
+    
+    # Cover subtitle and tagline, closing footer
+    st.subtitle = ParagraphStyle(
         'Subtitle',
-        parent=styles['Normal'],
+        parent=st.base['Normal'],
         fontSize=16,
-        textColor=SECONDARY_COLOR,
+        textColor=colors['secondary'],
         alignment=1,
         spaceAfter=30,
-        fontName='Helvetica-Bold'
-    )))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Shining the Hope of Christ", ParagraphStyle(
+        fontName=fonts.heading['bold']
+    )
+    st.tagline = ParagraphStyle(
         'Tagline',
-        parent=styles['Normal'],
+        parent=st.base['Normal'],
         fontSize=12,
-        textColor=TEXT_COLOR,
+        textColor=colors['text'],
         alignment=1,
         spaceAfter=12,
-        fontName='Helvetica-Oblique'
-    )))
-    story.append(Spacer(1, 0.6*inch))
-    
-    # Document info
-    doc_info = f"""
-    <b>Website Launch:</b> October 11, 2025<br/>
-    <b>Document Type:</b> Complete Organizational Guide<br/>
-    <b>Generated:</b> {datetime.now().strftime('%B %d, %Y')}<br/><br/>
-    <b>Location:</b> Olympic Estate, Kibera, Nairobi, Kenya<br/>
-    <b>Email:</b> AngazaTumaini.org@gmail.com<br/>
-    <b>Phone:</b> +254 716 475764<br/>
-    <b>WhatsApp:</b> https://wa.link/xjt1s4
-    """
-    story.append(Paragraph(doc_info, light_body))
-    
-    story.append(PageBreak())
-    
-    # ===== TABLE OF CONTENTS =====
-    story.append(Paragraph("📑 Table of Contents", heading_style))
-    story.append(Spacer(1, 0.15*inch))
-    
-    toc_items = [
-        "1. About Our Organization",
-        "2. Our Founders & Leadership Team",
-        "3. Mission, Vision & Values",
-        "4. Our Five Core Programs",
-        "5. How to Support Us",
-        "6. Website Pages & Navigation",
-        "7. Contact Information",
-        "8. Frequently Asked Questions",
-        "9. Project Details & Billing",
-        "10. Technical Information"
-    ]
-    
-    for item in toc_items:
-        story.append(Paragraph(f"• {item}", body_style))
-        story.append(Spacer(1, 0.08*inch))
-    
-    story.append(PageBreak())
+        fontName=fonts.body['italic']
+    )
+    st.footer = ParagraphStyle(
+        'Footer',
+        parent=st.base['Normal'],
+        fontSize=8,
+        textColor=colors['text'],
+        alignment=1,
+        fontName=fonts.body['italic']
+    )
     
-    # ===== 1. ABOUT ORGANIZATION =====
-    story.append(Paragraph("1. About Our Organization", main_heading))
-    story.append(Spacer(1, 0.15*inch))
+    return st
+
+def _use_caches(st, image_dir):
+    """Share the prepared-photo cache in image_dir and keep the fonts' glyph coverage next to it"""
+    st.images = shared_cache(image_dir)
+    if image_dir is not None:
+        st.fonts.use_cache(os.path.join(os.path.dirname(image_dir), FONTS_DIR))
+
+def _build_styles(generated=None, images=None, theme=DEFAULT_THEME, locale=SOURCE_LOCALE):
+    """Shared theme styles plus this build's date, prepared-photo cache and translations
     
-    story.append(Paragraph("<b>🏠 Who We Are</b>", subheading_style))
-    about_text = """
-    Angaza Tumaini Mission Center is a Christian community-based ministry located in the heart of Kibera slums, Nairobi, Kenya. 
-    Founded on the belief that every child has God-given potential and deserves hope, dignity, and opportunity, we are committed to 
-    manifesting the hope of Christ in tangible, practical ways. Our center serves as a beacon of light in one of the most underserved areas of Nairobi, 
-    providing safe spaces, spiritual guidance, educational support, and practical care to children, youth, and families.
+    st.tr translates the text the generator draws itself into the build's locale.
     """
-    story.append(Paragraph(about_text, body_style))
-    
-    story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("<b>💡 Our Tagline</b>", subheading_style))
-    story.append(Paragraph(
-        "Angaza Tumaini is committed to manifesting the hope of Christ in tangible, practical ways, restoring dignity and purpose to those we serve.",
-        ParagraphStyle('quote', parent=body_style, fontSize=10, italic=True, leftIndent=20, textColor=SECONDARY_COLOR)
-    ))
-    
-    story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("<b>📍 Location & Contact</b>", subheading_style))
-    
-    location_data = [
-        ['Information', 'Details'],
-        ['Address', 'Olympic Estate, Kibera, Nairobi, Kenya'],
-        ['Email', 'AngazaTumaini.org@gmail.com'],
-        ['Phone', '+254 716 475764'],
-        ['WhatsApp', 'https://wa.link/xjt1s4'],
-        ['Website', 'https://angaza-tumaini-o4nwg3zz9-calvin-wanyamas-projects.vercel.app'],
-        ['Founded', 'October 11, 2025']
-    ]
-    
-    loc_table = Table(location_data, colWidths=[2*inch, 3.5*inch])
-    loc_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+    translations = TranslationMemory(locale)
+    return SimpleNamespace(**vars(theme_styles(theme)), locale=locale, translations=translations,
+                           tr=translations.translate, generated=generated or translations.format_date(datetime.now()),
+                           images=images or ImageCache())
+
+
+# ===== BLOCK RENDERERS =====
+
+def _render_subheading(block, st):
+    return [Paragraph(f"<b>{block.text}</b>", st.subheading)]
+
+def _render_paragraph(block, st):
+    return [Paragraph(block.text, st.light_body if block.style == 'light' else st.body)]
+
+def _render_quote(block, st):
+    return [Paragraph(block.text, st.quote[block.color])]
+
+def _render_table(block, st):
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), st.colors[block.color]),
         ('TEXTCOLOR', (0, 0), (-1, 0), white),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ]
+    for col in block.align_right:
+        commands.append(('ALIGN', (col, 0), (col, -1), 'RIGHT'))
+    commands += [
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTNAME', (0, 0), (-1, 0), st.fonts.body['bold']),
+        ('FONTSIZE', (0, 0), (-1, 0), block.header_font_size),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
         ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), LIGHT_GRAY),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#D1D5DB')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, LIGHT_GRAY]),
+        ('BACKGROUND', (0, 1), (-1, -1), white),
+        ('GRID', (0, 0), (-1, -1), 1, st.colors['grid']),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -2 if block.total_row else -1), [white, st.colors['light']]),
         ('TOPPADDING', (0, 1), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-    ]))
-    story.append(loc_table)
-    
-    story.append(PageBreak())
-    
-    # ===== 2. LEADERSHIP TEAM =====
-    story.append(Paragraph("2. Our Founders & Leadership Team", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    team_members = [
-        ("Erick & Krista Baraza", "Founders & Missionaries", 
-         """Erick and Krista Baraza are passionate missionaries who founded Angaza Tumaini. Married for over five years, they share a deep love for God 
-         and a calling to bring hope to their community through Jesus Christ. Having been born and raised in Kibera, Erick understands the daily challenges 
-         children and families face. This birthed a vision to create a place where children find safety, joy, hope, and encounter Christ's love.
-         <br/><br/>Together, they are committed to raising a new generation grounded in God's word, equipped with education, and filled with hope for the future.
-         <br/><br/><i>"Let your light shine before others, that they may see your good deeds and glorify your Father in heaven." – Matthew 5:16</i>"""),
-        
-        ("Evans Wandera", "Programs Coordinator",
-         """Evans serves as Programs Coordinator, overseeing daily programs and ensuring every child receives care, mentorship, academic support, 
-         and encounters Christ's love. Born and raised in Nairobi with a strong background in education and ministry, Evans brings practical experience 
-         and a heart for discipleship. He creates programs that nurture faith, build character, and inspire hope, believing deeply that every child 
-         has God-given potential.
-         <br/><br/><i>"Train up a child in the way he should go, and when he is old, he will not depart from it." – Proverbs 22:6</i>"""),
-        
-        ("Jackline Mueni (Jay)", "Administrator & Programs Manager",
-         """Jackline plays a key role in ensuring smooth operations and program delivery. With a heart for service and passion for empowering children 
-         and families, Jackline combines organizational skills with deep love for God to create an environment where children thrive spiritually, 
-         academically, and emotionally.
-         <br/><br/><i>"Commit to the Lord whatever you do, and He will establish your plans." – Proverbs 16:3</i>"""),
-        
-        ("Felix Mito (Teacher Feloh)", "Tutor & Teacher",
-         """Felix is a dedicated tutor guiding children in academic and faith matters. With a heart for teaching, Felix combines patience, creativity, 
-         and Christ-centered approach to help children build strong academic foundations while encouraging spiritual and moral growth.
-         <br/><br/><i>"Let the wise hear and increase in learning, and the one who understands obtain guidance." – Proverbs 1:5</i>"""),
-        
-        ("Naureen Mugeni (Chief Chef)", "Cook",
-         """Naureen ensures every child receives nutritious and wholesome meals supporting their growth and well-being. With a heart for service and care, 
-         she provides not only physical nourishment but also a sense of love and warmth.
-         <br/><br/><i>"So, whether you eat or drink or whatever you do, do it all for the glory of God." – 1 Corinthians 10:31</i>"""),
-        
-        ("Benard Owira (Benah)", "Support Staff",
-         """Benard serves faithfully as support staff, ensuring the center runs smoothly and remains clean, safe, and welcoming. He reflects servant-leadership, 
-         serving out of love for God and others.
-         <br/><br/><i>"Whatever you do, work at it with all your heart, as working for the Lord, not for human masters." – Colossians 3:23</i>""")
+        ('FONTNAME', (0, 1), (-1, -1), st.fonts.body['normal']),
+        ('FONTSIZE', (0, 1), (-1, -1), block.font_size),
     ]
-    
-    for name, role, bio in team_members:
-        story.append(Paragraph(f"<b>{name}</b>", subheading_style))
-        story.append(Paragraph(f"<i>{role}</i>", light_body))
-        story.append(Paragraph(bio, body_style))
+    if block.total_row:
+        commands += [
+            ('BACKGROUND', (0, -1), (-1, -1), st.colors['accent']),
+            ('TEXTCOLOR', (0, -1), (-1, -1), st.colors['dark']),
+            ('FONTNAME', (0, -1), (-1, -1), st.fonts.body['bold']),
+        ]
+    table = Table([block.columns] + block.rows, colWidths=[w*inch for w in block.widths])
+    table.setStyle(TableStyle(commands))
+    return [table]
+
+def _render_ledger(block, st):
+    return [Ledger(block, st)]
+
+def _render_people(block, st):
+    story = []
+    for person in block.items:
+        details = [
+            Paragraph(f"<b>{person.name}</b>", st.subheading),
+            Paragraph(f"<i>{person.role}</i>", st.light_body),
+            Paragraph(person.bio, st.body),
+        ]
+        if person.photo:
+            portrait = st.images.flowable(person.photo, PORTRAIT_SIZE, PORTRAIT_SIZE)
+            story.append(ImageAndFlowables(portrait, details, imageLeftPadding=12, imageBottomPadding=6))
+        else:
+            story.extend(details)
         story.append(Spacer(1, 0.12*inch))
-    
-    story.append(PageBreak())
-    
-    # ===== 3. MISSION, VISION, VALUES =====
-    story.append(Paragraph("3. Mission, Vision & Core Values", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    story.append(Paragraph("<b>🎯 Our Mission</b>", subheading_style))
-    story.append(Paragraph(
-        "To bring the light and love of Jesus Christ to children and families of Kibera by providing a safe space for learning, nourishment, "
-        "discipleship, and spiritual growth, manifesting the hope of Christ in tangible, practical ways.",
-        ParagraphStyle('quote', parent=body_style, fontSize=10, italic=True, leftIndent=20, textColor=PRIMARY_COLOR)
-    ))
-    
-    story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("<b>🌟 Our Vision</b>", subheading_style))
-    story.append(Paragraph(
-        "Raising a new generation grounded in God's word, equipped with quality education, and filled with hope for the future. A community "
-        "where every child knows their worth in Christ and has tools to build purposeful, productive lives.",
-        ParagraphStyle('quote', parent=body_style, fontSize=10, italic=True, leftIndent=20, textColor=SECONDARY_COLOR)
-    ))
-    
-    story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("<b>💎 Our Core Values</b>", subheading_style))
-    
-    values = [
-        ("✝️ Faith-Centered", "Gospel of Jesus Christ is at the heart of all we do"),
-        ("💚 Community Empowerment", "Empowering individuals for self-sufficiency and hope"),
-        ("📚 Education Excellence", "Quality education transforming lives and futures"),
-        ("🤝 Dignity & Respect", "Recognizing inherent worth of every person"),
-        ("🌟 Hope & Purpose", "Restoring hope and discovering God-given potential"),
-        ("💪 Servant Leadership", "Leading by example with love and commitment")
-    ]
-    
-    for title, desc in values:
-        story.append(Paragraph(f"<b>{title}:</b> {desc}", body_style))
-        story.append(Spacer(1, 0.06*inch))
-    
-    story.append(PageBreak())
-    
-    # ===== 4. PROGRAMS =====
-    story.append(Paragraph("4. Our Five Core Programs", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    story.append(Paragraph(
-        "We deliver holistic support through five comprehensive programs addressing spiritual, educational, social, and economic needs.",
-        body_style
-    ))
-    story.append(Spacer(1, 0.12*inch))
-    
-    programs = [
-        ("1. FAITH Program", "Spiritual Formation & Discipleship",
-         "Bible study, Scripture memorization, discipleship mentorship, prayer and worship, character development, youth fellowship, and community service.",
-         "Children develop strong Christian foundation, learn biblical principles, and become future leaders grounded in Christ-centered values."),
-        
-        ("2. Education Program", "Academic Excellence & Literacy",
-         "After-school tutoring (Math, English, Science), literacy support, homework assistance, reading clubs, academic mentorship, and learning materials access.",
-         "Children improve academic performance, develop confident learning habits, and are empowered to pursue higher education and opportunities."),
-        
-        ("3. Life-Skills Program", "Practical & Soft Skills",
-         "Communication, public speaking, leadership, teamwork, decision-making, financial literacy, conflict resolution, health education, and career guidance.",
-         "Youth develop confidence, resilience, and practical skills needed for informed decisions, healthy relationships, and career navigation."),
-        
-        ("4. Socio-Economic Empowerment", "Skills Training & Entrepreneurship",
-         "Vocational skills (tailoring, hairdressing, welding, carpentry), entrepreneurship, microfinance, equipment support, market linkage, and job placement.",
-         "Families achieve economic self-sufficiency, youth gain marketable skills, and community experiences reduced poverty through sustainable livelihoods."),
-        
-        ("5. Community Outreach", "Practical Ministry & Care",
-         "Food distribution, medical clinics, health screening, clean water initiatives, school supplies, emergency relief, home visitation, and family support.",
-         "Families experience Christ's love, immediate needs are met, health outcomes improve, and community experiences transformation through compassionate service.")
-    ]
-    
-    for title, subtitle, activities, impact in programs:
-        story.append(Paragraph(f"<b>{title}</b>", subheading_style))
-        story.append(Paragraph(f"<i>{subtitle}</i>", light_body))
-        story.append(Paragraph(f"<b>Activities:</b> {activities}", body_style))
-        story.append(Paragraph(f"<b>Impact:</b> {impact}", body_style))
+    return story
+
+def _render_programs(block, st):
+    story = []
+    for program in block.items:
+        if program.photo:
+            story.append(st.images.flowable(program.photo, CONTENT_WIDTH, PROGRAM_PHOTO_HEIGHT))
+        story.append(Paragraph(f"<b>{program.title}</b>", st.subheading))
+        story.append(Paragraph(f"<i>{program.subtitle}</i>", st.light_body))
+        story.append(Paragraph(f"<b>Activities:</b> {program.activities}", st.body))
+        story.append(Paragraph(f"<b>Impact:</b> {program.impact}", st.body))
         story.append(Spacer(1, 0.12*inch))
-    
-    story.append(PageBreak())
-    
-    # ===== 5. HOW TO SUPPORT =====
-    story.append(Paragraph("5. How to Support Our Mission", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    support_methods = [
-        ("💰 Financial Donation", 
-         "Support programs through contributions for meals, education, vocational training, medical services, and program materials. "
-         "Use 'GIVE HOPE' button on website or contact for payment instructions."),
-        
-        ("🤝 Volunteer Your Time",
-         "Education tutoring, faith/discipleship mentoring, healthcare education, skills training, organizational support, community outreach. "
-         "Contact us to match your skills with volunteer opportunities."),
-        
-        ("🏢 Corporate Partnerships",
-         "In-kind donations, corporate volunteering, program sponsorship, internship and job placement opportunities. Contact for partnership options."),
-        
-        ("👦 Sponsor a Child",
-         "Provide education support, daily meals, school supplies, health services, and spiritual mentorship. Make long-term impact on a child's life."),
-        
-        ("📧 Stay Connected",
-         "Subscribe to newsletter, follow social media, share our story, pray for the mission, advocate for social justice and community development.")
-    ]
-    
-    for title, desc in support_methods:
-        story.append(Paragraph(f"<b>{title}</b>", subheading_style))
-        story.append(Paragraph(desc, body_style))
+    return story
+
+def _render_values(block, st):
+    story = []
+    for value in block.items:
+        story.append(Paragraph(f"<b>{value.title}:</b> {value.description}", st.body))
+        story.append(Spacer(1, 0.06*inch))
+    return story
+
+def _render_entries(block, st):
+    story = []
+    for entry in block.items:
+        story.append(Paragraph(f"<b>{entry.title}</b>", st.subheading))
+        story.append(Paragraph(entry.description, st.body))
         story.append(Spacer(1, 0.1*inch))
+    return story
+
+def _render_faq(block, st):
+    story = []
+    for i, faq in enumerate(block.items, 1):
+        story.append(Paragraph(f"<b>Q{i}: {faq.question}</b>", st.subheading))
+        story.append(Paragraph(f"<b>A:</b> {faq.answer}", st.body))
+        story.append(Spacer(1, 0.08*inch))
+    return story
+
+def _render_bullets(block, st):
+    story = []
+    for item in block.items:
+        story.append(Paragraph(item, st.body))
+        story.append(Spacer(1, 0.06*inch))
+    return story
+
+BLOCK_RENDERERS = {
+    'subheading': _render_subheading,
+    'paragraph': _render_paragraph,
+    'quote': _render_quote,
+    'table': _render_table,
+    'ledger': _render_ledger,
+    'people': _render_people,
+    'programs': _render_programs,
+    'values': _render_values,
+    'entries': _render_entries,
+    'faq': _render_faq,
+    'bullets': _render_bullets,
+}
+
+# ===== SECTION RENDERERS =====
+# Each renderer returns the flowables between two page breaks. ctx carries the
+# variant being built and the numbered chapter titles for the table of contents.
+
+def _render_cover(section, st, ctx):
+    story = []
     
-    story.append(PageBreak())
-    
-    # ===== 6. WEBSITE PAGES =====
-    story.append(Paragraph("6. Website Pages & Navigation", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    story.append(Paragraph("<b>🏠 Home Page (index.html)</b>", subheading_style))
-    home_desc = """
-    <b>Sections:</b> Hero with rotating images, About Us with team profiles, Our Programs (5 cards), Our Impact (animated counters), 
-    Get Involved (ways to support), Contact form, Footer with socials.<br/>
-    <b>Key Actions:</b> Learn about organization, view team, explore programs, see impact, contact, donate via GIVE HOPE button.
-    """
-    story.append(Paragraph(home_desc, body_style))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("<b>📞 Contact Page (contact.html)</b>", subheading_style))
-    contact_desc = """
-    <b>Features:</b> Contact form (email backend), direct channels (email, phone, WhatsApp), address, social media links.<br/>
-    <b>Best For:</b> General inquiries, partnership discussions, volunteer interest, donations, meeting the team.
-    """
-    story.append(Paragraph(contact_desc, body_style))
-    story.append(Spacer(1, 0.1*inch))
+    story.append(Spacer(1, 1.5*inch))
+    for line in section.title_lines:
+        story.append(Paragraph(line, st.title))
+    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph(ctx.variant.title, st.subtitle))
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(ctx.organization.tagline, st.tagline))
+    story.append(Spacer(1, 0.6*inch))
     
-    story.append(Paragraph("<b>📧 Newsletter Page (newsletter.html)</b>", subheading_style))
-    news_desc = """
-    <b>Features:</b> Newsletter signup, Follow Us section (social icons), share buttons, links to all social channels.<br/>
-    <b>Best For:</b> Stay updated, follow on social media, share content with your network.
-    """
-    story.append(Paragraph(news_desc, body_style))
+    # Document info
+    fields = {'generated': st.generated, 'document_type': ctx.variant.document_type}
+    lines = [f"<b>{label}:</b> {value.format(**fields)}" if label else "" for label, value in
+             ((row or (None, None)) for row in section.details)]
+    story.append(Paragraph("<br/>".join(lines), st.light_body))
     
-    story.append(PageBreak())
+    return story
+
+def _render_toc(section, st, ctx):
+    story = []
     
-    # ===== 7. CONTACT =====
-    story.append(Paragraph("7. Contact Information & Support", main_heading))
+    story.append(Paragraph(section.title, st.heading))
     story.append(Spacer(1, 0.15*inch))
     
-    contact_methods = [
-        ['Method', 'Details', 'Best For'],
-        ['Email', 'AngazaTumaini.org@gmail.com', 'Detailed inquiries, applications, feedback'],
-        ['Phone', '+254 716 475764', 'Urgent matters, immediate conversation'],
-        ['WhatsApp', 'https://wa.link/xjt1s4', 'Quick messages, group inquiries, updates'],
-        ['Facebook', 'https://www.facebook.com/profile.php?id=61552268876833', 'Updates, community engagement, sharing'],
-        ['Website Form', 'Contact page on site', 'General inquiries, feedback'],
-        ['In-Person', 'Olympic Estate, Kibera, Nairobi', 'Volunteer intake, center visits, meetings']
-    ]
+    story.append(GuideTableOfContents(ctx.toc_entries, levelStyles=[st.toc], dotsMinLevel=0))
     
-    contact_table = Table(contact_methods, colWidths=[1.3*inch, 2.2*inch, 1.8*inch])
-    contact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), SECONDARY_COLOR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), white),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#D1D5DB')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, LIGHT_GRAY]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-    ]))
-    story.append(contact_table)
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("<b>Response Time:</b> We aim to respond within 24-48 hours. For urgent matters, please call or use WhatsApp.", light_body))
-    
-    story.append(PageBreak())
+    return story
+
+def _render_chapter(section, st, ctx):
+    story = []
     
-    # ===== 8. FAQ =====
-    story.append(Paragraph("8. Frequently Asked Questions", main_heading))
+    story.append(Paragraph(ctx.chapters[section.id], st.main_heading))
     story.append(Spacer(1, 0.15*inch))
     
-    faqs = [
-        ("What is Angaza Tumaini?",
-         "A Christian community-based ministry in Kibera serving children and families through five programs: Faith, Education, Life-Skills, "
-         "Socio-economic Empowerment, and Community Outreach."),
-        
-        ("When was it founded?",
-         "Founded by Erick and Krista Baraza. Website launched October 11, 2025."),
-        
-        ("Where is it located?",
-         "Olympic Estate, Kibera, Nairobi, Kenya."),
-        
-        ("How can I support?",
-         "Financial donation, volunteer, become corporate partner, sponsor a child, subscribe to newsletter, or share our story."),
-        
-        ("How do I volunteer?",
-         "Contact AngazaTumaini.org@gmail.com, +254 716 475764, or WhatsApp https://wa.link/xjt1s4. We welcome volunteers in education, "
-         "mentoring, healthcare, skilled trades, and general support."),
-        
-        ("Can I sponsor a child?",
-         "Yes! Child sponsorship provides education, meals, and spiritual development. Contact us to discuss opportunities."),
-        
-        ("How is my donation used?",
-         "Donations support our five core programs: spiritual formation, academic tutoring, life-skills, livelihood support, and community outreach."),
-        
-        ("Is there a newsletter?",
-         "Yes! Visit the Newsletter page or click 'JOIN OUR NEWSLETTER' in footer to stay updated on programs, events, and impact stories."),
-        
-        ("What are operating hours?",
-         "Contact us directly at AngazaTumaini.org@gmail.com or +254 716 475764 for specific hours and program schedules."),
-        
-        ("How do I provide feedback?",
-         "Use the contact form, email us, or call directly. Your feedback helps us improve our services.")
-    ]
-    
-    for i, (q, a) in enumerate(faqs, 1):
-        story.append(Paragraph(f"<b>Q{i}: {q}</b>", subheading_style))
-        story.append(Paragraph(f"<b>A:</b> {a}", body_style))
-        story.append(Spacer(1, 0.08*inch))
+    for block in section.blocks:
+        if block.space_before:
+            story.append(Spacer(1, block.space_before*inch))
+        story.extend(BLOCK_RENDERERS[block.type](block, st))
     
-    story.append(PageBreak())
-    
-    # ===== 9. PROJECT DETAILS & BILLING =====
-    story.append(Paragraph("9. Project Details & Billing", main_heading))
-    story.append(Spacer(1, 0.15*inch))
-    
-    story.append(Paragraph("<b>💻 Website Project Overview</b>", subheading_style))
-    story.append(Paragraph(
-        "<b>Project Name:</b> Angaza Tumaini Mission Center Website<br/>"
-        "<b>Launch Date:</b> October 11, 2025<br/>"
-        "<b>Type:</b> Static responsive website with modern design<br/>"
-        "<b>Status:</b> Live and fully functional<br/>"
-        "<b>Live URL:</b> https://angaza-tumaini-o4nwg3zz9-calvin-wanyamas-projects.vercel.app",
-        body_style
-    ))
+    return story
+
+def _render_closing(section, st, ctx):
+    story = []
     
-    story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("<b>💳 Billing Information</b>", subheading_style))
-    
-    billing_data = [
-        ['Service', 'Description', 'Amount'],
-        ['Web Development', 'HTML5, CSS3, JavaScript, responsive design, color scheme', 'KES 15,000'],
-        ['Deployment', 'Vercel hosting, Git integration, auto-deployment', 'KES 4,000'],
-        ['Documentation', 'User manuals, guides, comprehensive documentation', 'KES 2,000'],
-        ['TOTAL', 'Complete website with documentation', 'KES 21,000']
-    ]
+    story.append(Spacer(1, 1*inch))
     
-    bill_table = Table(billing_data, colWidths=[1.5*inch, 2.8*inch, 1.3*inch])
-    bill_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, -1), (-1, -1), ACCENT_COLOR),
-        ('TEXTCOLOR', (0, -1), (-1, -1), DARK_COLOR),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#D1D5DB')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [white, LIGHT_GRAY]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-    ]))
-    story.append(bill_table)
+    story.append(Paragraph(section.title, st.title))
+    story.append(Spacer(1, 0.3*inch))
     
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(
-        "<b>Payment Method:</b> Mobile Money / Phone Transfer<br/>"
-        "<b>Payment Number:</b> 0759106034<br/>"
-        "<b>Reference:</b> Angaza-Tumaini-2025-Oct<br/>"
-        "<b>Payment Terms:</b> Upon project completion",
-        body_style
-    ))
+    story.append(Paragraph(section.text, st.body))
     
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("<b>📋 Deliverables Completed</b>", subheading_style))
-    
-    deliverables = [
-        "✅ Responsive website (desktop, tablet, mobile)",
-        "✅ Three main pages: Home, Contact, Newsletter",
-        "✅ Professional color scheme and modern design",
-        "✅ Integrated contact form (Formspree backend)",
-        "✅ Social media integration (5 platforms)",
-        "✅ Live deployment on Vercel",
-        "✅ GitHub repository with version control",
-        "✅ Comprehensive documentation and user manuals",
-        "✅ SEO optimization and accessibility features",
-        "✅ Email fallback for mailto: links"
-    ]
+    story.append(Spacer(1, 0.4*inch))
     
-    for item in deliverables:
-        story.append(Paragraph(item, body_style))
-        story.append(Spacer(1, 0.06*inch))
+    story.append(Paragraph(section.footer, st.footer))
     
-    story.append(PageBreak())
+    return story
+
+def _render_letter(section, st, ctx):
+    """Personal note for one donor or sponsor (see create_personalized_guides)"""
+    recipient = ctx.recipient or Recipient("Friend")
+    fields = {'name': escape(recipient.name), 'child': escape(recipient.sponsored_child)}
+    story = []
     
-    # ===== 10. TECHNICAL =====
-    story.append(Paragraph("10. Technical Information", main_heading))
+    story.append(Paragraph(section.title, st.main_heading))
     story.append(Spacer(1, 0.15*inch))
     
-    story.append(Paragraph("<b>🛠️ Technology Stack</b>", subheading_style))
-    
-    tech_data = [
-        ['Component', 'Technology', 'Purpose'],
-        ['Frontend', 'HTML5, CSS3, JavaScript', 'User interface and interactions'],
-        ['Styling', 'Tailwind CSS + Custom CSS', 'Responsive design and theming'],
-        ['Icons', 'Lucide Icons + PNG Images', 'Visual elements and branding'],
-        ['Fonts', 'Poppins, Inter', 'Professional typography'],
-        ['Form Backend', 'Formspree', 'Email form submissions'],
-        ['Hosting', 'Vercel', 'Fast, reliable static hosting'],
-        ['Version Control', 'GitHub', 'Source code management'],
-        ['Color Scheme', 'Blue #1D4ED8, Green #10B981, Gold #FBBF24', 'Brand colors']
-    ]
-    
-    tech_table = Table(tech_data, colWidths=[1.4*inch, 1.8*inch, 2.3*inch])
-    tech_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), white),
-        ('GRID', (0, 0), (-1, -1), 1, HexColor('#D1D5DB')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, LIGHT_GRAY]),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-    ]))
-    story.append(tech_table)
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("<b>♿ Accessibility Features</b>", subheading_style))
-    
-    a11y_features = [
-        "✓ Responsive design (works on all devices)",
-        "✓ Clear, intuitive navigation",
-        "✓ Readable typography with good contrast",
-        "✓ Alt text on all images",
-        "✓ WCAG accessibility standards",
-        "✓ Semantic HTML structure",
-        "✓ Mobile-friendly touch targets",
-        "✓ Keyboard navigation support"
-    ]
-    
-    for feature in a11y_features:
-        story.append(Paragraph(feature, body_style))
-        story.append(Spacer(1, 0.06*inch))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("<b>🌐 Browser Compatibility</b>", subheading_style))
-    story.append(Paragraph(
-        "Chrome/Chromium (latest), Firefox (latest), Safari (latest), Edge (latest), Mobile browsers (iOS Safari, Chrome Mobile). "
-        "For best experience, keep your browser updated.",
-        body_style
-    ))
+    story.append(Paragraph(section.greeting.format(**fields), st.body))
+    story.append(Paragraph(section.text.format(**fields), st.body))
+    if recipient.sponsored_child:
+        story.append(Paragraph(section.sponsorship.format(**fields), st.quote['secondary']))
+    
+    if recipient.giving:
+        story.append(Spacer(1, 0.15*inch))
+        story.append(Paragraph(f"<b>{section.giving_title}</b>", st.subheading))
+        rows = [[gift.date, gift.note or "Gift", f"KES {gift.amount:,.0f}"] for gift in recipient.giving]
+        rows.append(['TOTAL', '', f"KES {sum(gift.amount for gift in recipient.giving):,.0f}"])
+        story.extend(_render_table(TableBlock({
+            'type': 'table', 'columns': ['Date', 'Gift', 'Amount'], 'rows': rows,
+            'widths': [1.5, 2.8, 1.3], 'align_right': [2], 'total_row': True,
+        }, 'giving'), st))
     
-    story.append(PageBreak())
+    story.append(Spacer(1, 0.3*inch))
+    story.append(Paragraph(section.signature.format(**fields), st.body))
     
-    # ===== CLOSING =====
-    story.append(Spacer(1, 1*inch))
+    return story
+
+SECTION_RENDERERS = {
+    'cover': _render_cover,
+    'toc': _render_toc,
+    'chapter': _render_chapter,
+    'closing': _render_closing,
+    'letter': _render_letter,
+}
+
+def _build_context(content, variant, recipient=None):
+    """Per-variant data shared by the section renderers: numbered chapter titles in document order"""
+    sections = content.sections_for(variant)
+    return SimpleNamespace(content=content, organization=content.organization, variant=variant,
+                           sections=sections, chapters=chapter_titles(sections), recipient=recipient, toc_entries=None)
+
+# ===== INCREMENTAL BUILD CACHE =====
+
+def _style_fingerprint(st):
+    """Stable description of every paragraph style, used as part of the cache key"""
+    parts = [f"colors({', '.join(f'{name}={color.hexval()}' for name, color in sorted(st.colors.items()))})"]
+    styles = [(name, getattr(st, name)) for name in ('title', 'main_heading', 'heading', 'subheading', 'body',
+                                                     'light_body', 'toc', 'subtitle', 'tagline', 'footer')]
+    styles += [(f"quote-{name}", style) for name, style in sorted(st.quote.items())]
+    for name, style in styles:
+        attrs = ', '.join(f"{attr}={getattr(style, attr)!r}" for attr in sorted(ParagraphStyle.defaults))
+        parts.append(f"{name}({attrs})")
+    return '\n'.join(parts)
+
+@functools.lru_cache(maxsize=None)
+def _code_digest(*names):
+    """Hash of the bytes of scripts/ source files; the code a process runs never changes, so each is read once"""
+    h = hashlib.sha256()
+    for name in names:
+        with open(os.path.join(SCRIPTS_DIR, name), 'rb') as f:
+            h.update(f.read())
+        h.update(b'\0')
+    return h.hexdigest()
+
+def _section_hashes(st, ctx):
+    """Hash each section's source content together with the styles and fonts it is drawn with"""
+    fonts = sorted({getattr(st, name).fontName for name in ('title', 'main_heading', 'heading', 'subheading', 'body', 'light_body')})
+    variant = ctx.variant
+    shared = hashlib.sha256()
+    for part in (str(CACHE_VERSION), reportlab.Version, _style_fingerprint(st), ','.join(fonts), st.fonts.digest,
+                 _code_digest(*CODE_FILES), '\n'.join(map(st.tr, LABELS)),
+                 variant.title, variant.header, variant.document_type):
+        shared.update(part.encode('utf-8'))
+        shared.update(b'\0')
+    
+    hashes = {}
+    for section in ctx.sections:
+        h = shared.copy()
+        h.update(section.digest.encode('utf-8'))
+        # Only the parts that print them depend on the date and the chapter titles: the cover prints the
+        # date, a chapter its own numbered title, the contents every title. The footer date of the other
+        # pages is not part of a section (see _stamp_generated)
+        if section.kind == 'cover':
+            h.update(st.generated.encode('utf-8'))
+        if section.kind == 'toc':
+            h.update('\n'.join(ctx.chapters.values()).encode('utf-8'))
+        elif section.id in ctx.chapters:
+            h.update(ctx.chapters[section.id].encode('utf-8'))
+        for path in ctx.content.photos(section) + ctx.content.data_files(section):
+            h.update(file_digest(path).encode('utf-8'))
+        hashes[section.id] = h.hexdigest()
+    return hashes
+
+def _document_hash(section_hashes, generated):
+    """Combine the per-section hashes (in order, each covering the code) with the footer date into one document key"""
+    h = hashlib.sha256(f"{generated}\n".encode('utf-8'))
+    for key, value in section_hashes.items():
+        h.update(f"{key}={value}\n".encode('utf-8'))
+    return h.hexdigest()
+
+def _prune_parts(cache_dir, manifest):
+    """Drop section part PDFs that no variant's last parallel build used"""
+    parts_dir = os.path.join(cache_dir, PARTS_DIR)
+    if not os.path.isdir(parts_dir):
+        return
+    live = {name for entry in manifest.values() for name in entry.get('parts', [])}
+    for name in os.listdir(parts_dir):
+        if name not in live:
+            os.remove(os.path.join(parts_dir, name))
+
+def _input_files(st, ctx, web=False):
+    """Every file a build of the variant reads: code, content, translations, fonts, photos and ledgers"""
+    files = [os.path.join(SCRIPTS_DIR, name) for name in CODE_FILES + (('guide_webpdf.py',) if web else ())]
+    files += [reportlab.__file__, ctx.content.path, guide_fonts.FONT_DIRS[0]] + list(st.fonts.files)
+    if st.locale != SOURCE_LOCALE:
+        files.append(st.translations.path)
+    for section in ctx.sections:
+        files += ctx.content.photos(section) + ctx.content.data_files(section)
+    return sorted(set(files))
+
+def _record_inputs(entry, st, ctx, default_name, web=False):
+    """Store what guide_cache.current needs to call the next run up to date from file stamps alone"""
+    entry.update(inputs=input_stamps(_input_files(st, ctx, web)), day=date.today().isoformat(),
+                 content=ctx.content.path, filename=default_name, title=ctx.variant.title,
+                 variants=list(ctx.content.variants), warnings=_warnings(st))
+
+# ===== BUILD =====
+
+def _make_doc(filename, st, ctx, first_page=1, profile=None, pages_after=0, dated=True, total=None):
+    """Page template for a variant
     
-    story.append(Paragraph("Thank You", title_style))
-    story.append(Spacer(1, 0.3*inch))
+    A partial render starts its header page numbers at first_page and adds
+    pages_after (the pages of the document that follow it) to the page total;
+    total, when known, is the page count of the whole document. With
+    dated=False the footers leave the generation date out.
+    """
+    header = f"{ctx.organization.name} — {ctx.variant.header}"
+    canvasmaker = type('VariantCanvas', (HeaderFooterCanvas,),
+                       {'header_title': header, 'first_page': first_page, 'pages_after': pages_after,
+                        'expected_pages': total,
+                        'page_label': st.tr(PAGE_LABEL),
+                        'generated_label': st.tr(GENERATED_LABEL).format(date=st.generated) if dated else '',
+                        'profile': profile, 'colors': st.colors, 'fonts': st.fonts})
+    return GuideDocTemplate(
+        filename,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+        canvasmaker=canvasmaker,
+        profile=profile
+    )
+
+def _build_document(filename, st, ctx, section_hashes, profile=None):
+    """Lay out every section of the variant into the PDF at filename
     
-    closing = """
-    We are grateful for every person who takes time to learn about Angaza Tumaini's mission and considers how they might support our work. 
-    Whether through prayer, volunteering, donation, or sharing our story, your involvement makes a real difference in the lives of children 
-    and families in Kibera.<br/><br/>
+    Returns the page count and {section hash: characters no font could draw}.
+    """
+    doc = _make_doc(filename, st, ctx, profile=profile)
+    
+    story, dropped = [], {}
+    with phase(profile, 'story'):
+        for i, section in enumerate(ctx.sections):
+            st.fonts.dropped.clear()
+            if profile is None:
+                part = list(SECTION_RENDERERS[section.kind](section, st, ctx))
+            else:
+                with profile.section(section):
+                    part = list(SECTION_RENDERERS[section.kind](section, st, ctx))
+            # A break ends the page it is laid out on, so it belongs to the section before it
+            if i + 1 < len(ctx.sections):
+                part.append(PageBreak())
+            if profile is not None:
+                profile.add_story(section, part)
+            if st.fonts.dropped:
+                dropped[section_hashes[section.id]] = ''.join(sorted(st.fonts.dropped))
+            story.extend(part)
+    st.fonts.dropped.update(''.join(dropped.values()))
+    
+    with phase(profile, 'layout'):
+        doc.layout(story)
+    return doc.page, dropped
+
+# ===== PARALLEL BUILD =====
+# Sections are independent between page breaks, so each one can be laid out in
+# its own process and the part files merged afterwards. Header page numbers and
+# the table of contents are baked in at render time from the page counts of the
+# preceding sections.
+
+_worker_state = {}
+
+def _toc_entries(st, ctx, first_pages):
+    """Table of contents entries for chapters starting on the given pages
     
-    At Angaza Tumaini, we believe that every child has God-given potential and deserves hope, dignity, and opportunity. Together, 
-    we are shining the light of Christ in one of the most underserved areas of Nairobi.<br/><br/>
+    The headings live in other part files, so these entries carry no link target;
+    the merged PDF outline still jumps to every chapter.
+    """
+    entries = []
+    for section in ctx.sections:
+        if section.id in ctx.chapters:
+            text = Paragraph(ctx.chapters[section.id], st.main_heading).getPlainText()
+            entries.append((0, load_fonts().markup(escape(text)), first_pages[section.id], None))
+    return entries
+
+def _render_section(content_path, variant_id, theme, locale, section_id, generated, image_dir, first_page, pages_after,
+                    total, filename, toc_entries=None):
+    """Process pool task: render one section to filename; returns its page count and the characters left out"""
+    key = (content_path, variant_id, theme, locale, generated, image_dir)
+    if key not in _worker_state:
+        st = _build_styles(generated, theme=theme, locale=locale)
+        _use_caches(st, image_dir)
+        content = _edition(content_path, st)
+        _worker_state[key] = (_build_context(content, content.variant(variant_id)), st)
+    ctx, st = _worker_state[key]
+    ctx = SimpleNamespace(**{**vars(ctx), 'toc_entries': toc_entries})
+    
+    section = ctx.content.sections[section_id]
+    # Undated, so a cached part serves every day's build; the merged document gets the date stamped on
+    doc = _make_doc(filename, st, ctx, first_page, pages_after=pages_after, dated=False, total=total)
+    st.fonts.dropped.clear()
+    doc.layout(SECTION_RENDERERS[section.kind](section, st, ctx))
+    st.fonts.save_cache()
+    return doc.page, ''.join(sorted(st.fonts.dropped))
+
+def _stamp_generated(writer, st):
+    """Draw the footer date onto every page of a merged document whose parts were rendered undated"""
+    from pypdf import PdfReader
+    buf = io.BytesIO()
+    stamp = canvas.Canvas(buf, pagesize=letter)
+    stamp.setFillColor(st.colors['text'])
+    _draw_generated(stamp, st.tr(GENERATED_LABEL).format(date=st.generated), st.fonts)
+    stamp.showPage()
+    stamp.save()
+    page = PdfReader(buf).pages[0]
+    for target in writer.pages:
+        target.merge_page(page)
+        target.compress_content_streams()  # merging leaves the page content uncompressed
+
+def _build_document_parallel(filename, st, ctx, section_hashes, parts_dir, known_pages, jobs=None, known_dropped=None):
+    """Render sections concurrently and merge them
     
-    <b>Get Involved Today:</b><br/>
-    📧 Email: AngazaTumaini.org@gmail.com<br/>
-    📞 Phone: +254 716 475764<br/>
-    💬 WhatsApp: https://wa.link/xjt1s4<br/>
-    🌐 Website: https://angaza-tumaini-o4nwg3zz9-calvin-wanyamas-projects.vercel.app<br/><br/>
+    Returns ({section hash: page count}, [part file names used], {section hash:
+    characters no font could draw}); the characters of every section, reused
+    parts included, are added to st.fonts.dropped.
+    """
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        raise SystemExit("❌ Parallel builds need pypdf to merge the section PDFs: pip install pypdf") from None
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    pages, dropped = dict(known_pages), dict(known_dropped or {})
+    rendered = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while True:
+            # Plan first pages, the pages after each section and the total from
+            # known (or guessed) page counts; sections rendered at a different
+            # offset, document length or total (or, for the table of contents,
+            # with different entries) than planned are rendered again
+            plan, first = {}, 1
+            for section in ctx.sections:
+                plan[section.id] = first
+                first += pages.get(section_hashes[section.id], 1)
+            after = {section.id: first - plan[section.id] - pages.get(section_hashes[section.id], 1)
+                     for section in ctx.sections}
+            entries = _toc_entries(st, ctx, plan)
+            planned = {}
+            for section in ctx.sections:
+                digest = section_hashes[section.id]
+                if section.kind == 'toc':
+                    digest = hashlib.sha256(f"{digest}{entries!r}".encode('utf-8')).hexdigest()
+                planned[section.id] = os.path.join(parts_dir,
+                                                   f"{digest}-{plan[section.id]}-{after[section.id]}-{first - 1}.pdf")
+            todo = [section for section in ctx.sections if rendered.get(section.id) != planned[section.id]]
+            if not todo:
+                break
+            
+            futures = {}
+            for section in todo:
+                part = planned[section.id]
+                if section_hashes[section.id] in pages and os.path.exists(part):
+                    rendered[section.id] = part
+                    continue
+                future = pool.submit(_render_section, ctx.content.path, ctx.variant.id, st.theme, st.locale, section.id,
+                                     st.generated, st.images.directory, plan[section.id], after[section.id], first - 1, part,
+                                     entries if section.kind == 'toc' else None)
+                futures[future] = (section, part)
+            for future in as_completed(futures):
+                section, part = futures[future]
+                pages[section_hashes[section.id]], dropped[section_hashes[section.id]] = future.result()
+                rendered[section.id] = part
+    
+    # Each part carries the outline entries and named destinations of its headings
+    writer = PdfWriter()
+    for section in ctx.sections:
+        writer.append(rendered[section.id])
+    _stamp_generated(writer, st)
+    # Every part embeds its own copy of the images and fonts it uses; keep one of each
+    writer.compress_identical_objects()
+    if hasattr(filename, 'write'):
+        writer.write(filename)
+    else:
+        with open(filename, 'wb') as f:
+            writer.write(f)
+    counts = {section_hashes[section.id]: pages[section_hashes[section.id]] for section in ctx.sections}
+    dropped = {key: dropped[key] for key in counts if dropped.get(key)}
+    st.fonts.dropped.update(''.join(dropped.values()))
+    return counts, [os.path.basename(rendered[section.id]) for section in ctx.sections], dropped
+
+def _edition(content, st):
+    """The content (a Content or a content file path) in the language of the build"""
+    if not isinstance(content, Content):
+        content = load_content(content or DEFAULT_CONTENT_PATH)
+    return content if st.locale == SOURCE_LOCALE else load_edition(content.path, st.translations)
+
+def _plan(content, variant, profile=None, theme=DEFAULT_THEME, locale=SOURCE_LOCALE):
+    """Resolve a variant and compute its cache keys without laying anything out"""
+    with phase(profile, 'styles'):
+        st = _build_styles(theme=theme, locale=locale)
+    with phase(profile, 'content'):
+        content = _edition(content, st)
+        ctx = _build_context(content, content.variant(variant))
+    with phase(profile, 'hashing'):
+        section_hashes = _section_hashes(st, ctx)
+    return ctx, st, section_hashes, _document_hash(section_hashes, st.generated)
+
+def guide_version(variant='full', content=None, theme=DEFAULT_THEME):
+    """Content version of a variant: changes whenever its PDF would change"""
+    return _plan(content, variant, theme=theme)[3]
+
+def _emit(source, output):
+    """Copy a finished PDF to a path or stream it to a binary file object in bounded chunks"""
+    if hasattr(output, 'write'):
+        with open(source, 'rb') as f:
+            shutil.copyfileobj(f, output, STREAM_CHUNK)
+    else:
+        shutil.copyfile(source, output)
+
+def _web_optimize(built, target, scratch, build_seconds, profile):
+    """Write the web-optimized copy of the PDF laid out at built to target; returns both sizes and times"""
+    output = os.path.join(scratch, 'web.pdf') if hasattr(target, 'write') else target
+    with phase(profile, 'web'):
+        stats = guide_webpdf.optimize(built, output)
+    if output is not target:
+        _emit(output, target)
+    return dict(stats, build_seconds=build_seconds)
+
+def _warnings(st):
+    """Warnings about the build: strings of a language edition printed in English, characters no font could draw"""
+    warnings = []
+    missing = st.translations.missing
+    if missing:
+        warnings.append(f"   ⚠️  {len(missing)} string(s) of the content have no {LOCALES[st.locale]} translation yet and "
+                        f"stay in English; list them with: python scripts/guide_translations.py {st.locale}")
+    if st.fonts.dropped:
+        warnings.append(f"   ⚠️  Left out {' '.join(sorted(st.fonts.dropped))}: no installed font can draw them "
+                        f"(add {guide_fonts.FALLBACK_FONTS[0]} to filez/fonts/ for emoji)")
+    return warnings
+
+def create_comprehensive_guide(filename=None, variant='full', content=None, cache_dir=DEFAULT_CACHE_DIR, force=False,
+                               parallel=False, jobs=None, log=sys.stdout, profile=None, theme=DEFAULT_THEME, web=False,
+                               locale=SOURCE_LOCALE):
+    """Generate one document variant, skipping the build when nothing changed
+    
+    filename may be a path or any writable binary file object (BytesIO, socket file,
+    HTTP response, sys.stdout.buffer); streams receive the PDF in STREAM_CHUNK pieces.
+    With parallel=True each section is rendered in a worker process and the parts
+    are merged; unchanged sections reuse their cached part PDFs. theme picks one of
+    THEMES (colour, grayscale for print, high contrast). web=True writes a
+    linearized, compressed copy for download (guide_webpdf) to the same file and
+    reports it against the plain doc.build output. locale picks the language
+    edition (LOCALES); strings without a translation are printed in English and
+    reported. A BuildProfile given as profile forces a serial rebuild and
+    collects its timings.
+    """
+    if profile is not None:
+        force, parallel = True, False
+    say = (lambda msg: print(msg, file=log)) if log else (lambda msg: None)
+    streaming = hasattr(filename, 'write')
+    # Other themes, languages and the web copy get their own cache entry; each edition keeps its own
+    # manifest and parts (photos are shared), so editions can build concurrently
+    build_id = build_key(variant, theme, web)
+    edition_cache = None if cache_dir is None else edition_dir(cache_dir, locale)
+    if not force and edition_cache is not None and not streaming:
+        # Nothing touched since the last build: no fonts, styles or content need loading to tell
+        entry = load_manifest(edition_cache).get(build_id, {})
+        content_path = content.path if isinstance(content, Content) else os.path.abspath(content or DEFAULT_CONTENT_PATH)
+        output = current(entry, content_path, filename)
+        if output:
+            say(f"✅ {entry['title']} is up to date: {output}")
+            for line in entry.get('warnings', []):
+                say(line)
+            return output
+    
+    ctx, st, section_hashes, doc_hash = _plan(content, variant, profile, theme, locale)
+    _use_caches(st, None if cache_dir is None else os.path.join(cache_dir, IMAGES_DIR))
+    cache_dir = edition_cache
+    if web:
+        guide_webpdf.require()  # fail before the layout, not after it
+        # Same file name as the plain PDF: the web copy is a different PDF of the same pages
+        doc_hash = hashlib.sha256((doc_hash + _code_digest('guide_webpdf.py')).encode('utf-8')).hexdigest()
+    # Other themes and languages get their own output file next to the default one
+    default_name = ctx.variant.filename
+    suffix = ('' if theme == DEFAULT_THEME else f"-{theme}") + ('' if locale == SOURCE_LOCALE else f"-{locale}")
+    if suffix:
+        stem, ext = os.path.splitext(ctx.variant.filename)
+        default_name = f"{stem}{suffix}{ext}"
+    filename = filename or default_name
+    name = getattr(filename, 'name', '<stream>') if streaming else filename
+    
+    manifest = {} if cache_dir is None else load_manifest(cache_dir)
+    entry = manifest.get(build_id, {})
+    cached_pdf = None if cache_dir is None else os.path.join(cache_dir, f"{doc_hash}.pdf")
+    
+    if not force and entry.get('document') == doc_hash:
+        # Nothing changed: the output is either already in place or can be restored from the cache.
+        # Nothing is laid out either, so the characters left out are the ones the build recorded
+        st.fonts.dropped = set(''.join(entry.get('dropped', {}).values()))
+        if not streaming and os.path.exists(filename) and \
+                entry.get('output') == [os.path.abspath(filename)] + file_stamp(filename):
+            # Only stamps changed (say, a file saved without edits): remember them for the next run
+            _record_inputs(entry, st, ctx, default_name, web)
+            save_manifest(cache_dir, manifest)
+            say(f"✅ {ctx.variant.title} is up to date: {name}")
+            for line in _warnings(st):
+                say(line)
+            return filename
+        if os.path.exists(cached_pdf):
+            _emit(cached_pdf, filename)
+            if not streaming:
+                entry['output'] = [os.path.abspath(filename)] + file_stamp(filename)
+                _record_inputs(entry, st, ctx, default_name, web)
+                save_manifest(cache_dir, manifest)
+            say(f"✅ {ctx.variant.title} restored from cache: {name}")
+            for line in _warnings(st):
+                say(line)
+            return filename
+    
+    previous = entry.get('sections', {})
+    changed = [key for key, value in section_hashes.items() if previous.get(key) != value]
+    
+    # Build PDF: into the cache first when there is one, so streams are served from a finished file
+    target = filename
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        target = cached_pdf + '.tmp'
+    # A web build lays the plain PDF out in a scratch directory and writes only the optimized copy to target
+    built, scratch, web_stats = target, None, None
+    if web:
+        scratch = tempfile.mkdtemp(dir=cache_dir)
+        built = os.path.join(scratch, 'build.pdf')
+    started = time.perf_counter()
+    st.fonts.dropped.clear()
+    try:
+        pages, parts = entry.get('pages', {}), []
+        if not parallel:
+            page_count, dropped = _build_document(built, st, ctx, section_hashes, profile)
+        elif cache_dir is None:
+            with tempfile.TemporaryDirectory() as parts_dir:
+                pages, parts, dropped = _build_document_parallel(built, st, ctx, section_hashes, parts_dir, {}, jobs)
+        else:
+            parts_dir = os.path.join(cache_dir, PARTS_DIR)
+            os.makedirs(parts_dir, exist_ok=True)
+            pages, parts, dropped = _build_document_parallel(built, st, ctx, section_hashes, parts_dir,
+                                                             {} if force else pages, jobs, entry.get('dropped'))
+        if web:
+            web_stats = _web_optimize(built, target, scratch, time.perf_counter() - started, profile)
+    finally:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+    st.fonts.save_cache()
+    
+    if cache_dir is not None:
+        os.replace(target, cached_pdf)
+        with phase(profile, 'emit'):
+            _emit(cached_pdf, filename)
+        # Keep only the newest pre-rendered document of each variant
+        stale = entry.get('document')
+        if stale and stale != doc_hash and os.path.exists(os.path.join(cache_dir, f"{stale}.pdf")):
+            os.remove(os.path.join(cache_dir, f"{stale}.pdf"))
+        manifest[build_id] = {
+            'document': doc_hash,
+            'sections': section_hashes,
+            'pages': pages,
+            'parts': parts,
+            'dropped': dropped,
+            'output': None if streaming else [os.path.abspath(filename)] + file_stamp(filename),
+        }
+        _record_inputs(manifest[build_id], st, ctx, default_name, web)
+        save_manifest(cache_dir, manifest)
+        _prune_parts(cache_dir, manifest)
+    
+    if profile is not None:
+        written = cached_pdf if cache_dir is not None else None if streaming else filename
+        profile.finish(page_count, written and os.path.getsize(written), web_stats)
+    
+    say(f"✅ {ctx.variant.title} created: {name}")
+    say(f"   📄 Single document with all information")
+    say(f"   📋 {len(ctx.chapters)} major sections covering everything")
+    say(f"   🎨 Professional modern & classic theme throughout")
+    say(f"   📏 Consistent styling and unified design")
+    say(f"   🔤 Fonts: {st.fonts.summary}")
+    if previous and changed:
+        say(f"   ♻️  Changed sections: {', '.join(changed)}")
+    for line in _warnings(st):
+        say(line)
+    if web_stats:
+        before, after = web_stats['input_bytes'], web_stats['output_bytes']
+        say(f"   🌐 Web-optimized: doc.build {before / 1024:,.0f} KB in {web_stats['build_seconds']:.2f}s → "
+            f"linearized {after / 1024:,.0f} KB ({1 - after / before:.0%} smaller) in +{web_stats['seconds']:.2f}s")
+    return filename
+
+# ===== PERSONALIZED BATCH BUILD =====
+# Every personalized guide is the variant's cover, a one-off letter, then the
+# variant's remaining sections. The cover and the remaining sections are laid
+# out once per batch (per letter length, since that shifts page numbers and the
+# page total) and merged with each recipient's letter.
+
+LETTER_SECTION = 'letter'
+
+def _render_pdf(sections, st, ctx, first_page=1, pages_after=0, total=None):
+    """Lay out sections into an in-memory PDF; returns (pdf bytes, page count)
     
-    <i>"Let your light shine before others, that they may see your good deeds and glorify your Father in heaven." – Matthew 5:16</i>
+    Without a total, the headers guess it from pages_after; when a guess needed
+    a different width than the real total, the sections are laid out again
+    with it (flowables keep layout state, so from a fresh story).
     """
-    story.append(Paragraph(closing, body_style))
+    while True:
+        buf = io.BytesIO()
+        doc = _make_doc(buf, st, ctx, first_page, pages_after=pages_after, total=total)
+        story = []
+        for i, section in enumerate(sections):
+            if i:
+                story.append(PageBreak())
+            story.extend(SECTION_RENDERERS[section.kind](section, st, ctx))
+        doc.layout(story)
+        if doc.reserved_exactly():
+            return buf.getvalue(), doc.page
+        total = first_page - 1 + doc.page + pages_after
+
+class _PersonalizedRenderer:
+    """Styles, context and pre-rendered fixed parts shared by every recipient of a batch"""
+    def __init__(self, content_path, variant_id, generated, image_dir=None, theme=DEFAULT_THEME):
+        from pypdf import PdfReader
+        self._reader = PdfReader
+        content = load_content(content_path)
+        self.content = content
+        self.variant = content.variant(variant_id)
+        self.ctx = _build_context(content, self.variant)
+        self.st = _build_styles(generated, theme=theme)
+        _use_caches(self.st, image_dir)
+        self.letter = content.sections[LETTER_SECTION]
+        sections = [section for section in self.ctx.sections if section.id != LETTER_SECTION]
+        self.head, self.tail = sections[:1], sections[1:]
+        # Page counts of the fixed parts do not depend on where they start or the total
+        self._heads, self._tails = {}, {}
+        self.head_pages = len(self._head(0).pages)
+        self.tail_pages = len(self._tail(self.head_pages + 2).pages)
+    
+    def _head(self, pages_after):
+        if pages_after not in self._heads:
+            total = self.head_pages + pages_after if hasattr(self, 'head_pages') else None
+            data = _render_pdf(self.head, self.st, self.ctx, pages_after=pages_after, total=total)[0]
+            self._heads[pages_after] = self._reader(io.BytesIO(data))
+        return self._heads[pages_after]
+    
+    def _tail(self, first_page):
+        if first_page not in self._tails:
+            total = first_page - 1 + self.tail_pages if hasattr(self, 'tail_pages') else None
+            data = _render_pdf(self.tail, self.st, self.ctx, first_page, total=total)[0]
+            self._tails[first_page] = self._reader(io.BytesIO(data))
+        return self._tails[first_page]
+    
+    def render(self, recipient):
+        """Complete personalized guide for one recipient as PDF bytes"""
+        from pypdf import PdfWriter
+        ctx = _build_context(self.content, self.variant, recipient)
+        first = self.head_pages + 1
+        letter, pages = _render_pdf([self.letter], self.st, ctx, first, pages_after=self.tail_pages)
+        
+        writer = PdfWriter()
+        writer.append(self._head(pages + self.tail_pages))
+        writer.append(self._reader(io.BytesIO(letter)))
+        writer.append(self._tail(first + pages))
+        out = io.BytesIO()
+        writer.write(out)
+        self.st.fonts.save_cache()
+        return out.getvalue()
+
+_batch_renderer = None
+
+def _init_batch_worker(content_path, variant_id, generated, image_dir=None, theme=DEFAULT_THEME):
+    global _batch_renderer
+    _batch_renderer = _PersonalizedRenderer(content_path, variant_id, generated, image_dir, theme)
+
+def _render_personalized(recipient):
+    return _batch_renderer.render(recipient)
+
+def _batch_writer(output):
+    """Return write(name, data) and close() callables for a directory or .zip output"""
+    if str(output).lower().endswith('.zip'):
+        import zipfile
+        archive = zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_STORED)
+        return archive.writestr, archive.close
+    os.makedirs(output, exist_ok=True)
+    def write(name, data):
+        with open(os.path.join(output, name), 'wb') as f:
+            f.write(data)
+    return write, lambda: None
+
+def create_personalized_guides(recipients, output, variant='donor-brief', content=None, jobs=1,
+                               cache_dir=DEFAULT_CACHE_DIR, theme=DEFAULT_THEME):
+    """Generate one personalized guide per recipient into a directory or a .zip archive
     
-    story.append(Spacer(1, 0.4*inch))
+    recipients is an iterable of Recipient records or the path of a recipients CSV.
+    Shared styles and the fixed sections are prepared once per worker; only each
+    recipient's letter is laid out per document. Returns the number of guides written.
+    """
+    try:
+        import pypdf  # noqa: F401 - needed to merge the fixed parts with each letter
+    except ImportError:
+        raise SystemExit("❌ Personalized builds need pypdf to merge documents: pip install pypdf") from None
+    if not isinstance(content, Content):
+        content = load_content(content or DEFAULT_CONTENT_PATH)
+    content.variant(variant)
+    if LETTER_SECTION not in content.sections:
+        raise ContentError(f"personalized guides need a {LETTER_SECTION!r} section")
+    if isinstance(recipients, (str, os.PathLike)):
+        recipients = load_recipients(recipients)
+    generated = datetime.now().strftime('%B %d, %Y')
+    image_dir = None if cache_dir is None else os.path.join(cache_dir, IMAGES_DIR)
+    
+    write, close = _batch_writer(output)
+    count = 0
+    try:
+        if jobs == 1:
+            _init_batch_worker(content.path, variant, generated, image_dir, theme)
+            for recipient in recipients:
+                count += 1
+                write(f"{count:05d}-{recipient.slug}.pdf", _render_personalized(recipient))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            # Keep a bounded number of documents in flight so memory stays flat for large batches
+            jobs = jobs or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(content.path, variant, generated, image_dir, theme)) as pool:
+                window = []
+                for recipient in recipients:
+                    window.append((recipient, pool.submit(_render_personalized, recipient)))
+                    if len(window) >= 4 * jobs:
+                        recipient, future = window.pop(0)
+                        count += 1
+                        write(f"{count:05d}-{recipient.slug}.pdf", future.result())
+                for recipient, future in window:
+                    count += 1
+                    write(f"{count:05d}-{recipient.slug}.pdf", future.result())
+    finally:
+        close()
+    
+    print(f"✅ {count} personalized guide(s) written to {output}")
+    return count
+
+# ===== LANGUAGE EDITIONS =====
+# Every edition is built from the same content file in its own worker process.
+# Editions keep separate cache manifests, so each one rebuilds only when its
+# own strings (or the shared layout) changed.
+
+def _build_edition(locale, variants, content_path, cache_dir, force, theme, web):
+    """Process pool task: build the variants of one language edition; returns the build log"""
+    log = io.StringIO()
+    for variant in variants:
+        create_comprehensive_guide(variant=variant, content=content_path, cache_dir=cache_dir, force=force,
+                                   log=log, theme=theme, web=web, locale=locale)
+    return log.getvalue()
+
+def create_editions(locales, variants=('full',), content=None, cache_dir=DEFAULT_CACHE_DIR, force=False, jobs=None,
+                    log=sys.stdout, theme=DEFAULT_THEME, web=False):
+    """Build the given variants in every locale concurrently, next to each other
     
-    story.append(Paragraph(
-        "© 2025 Angaza Tumaini Mission Center. All rights reserved. Powered by faith, love, and the hope of Christ.",
-        ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=TEXT_COLOR,
-            alignment=1,
-            fontName='Helvetica-Oblique'
-        )
-    ))
-    
-    # Build PDF
-    doc.build(story)
-    print(f"✅ Complete Comprehensive Guide created: {filename}")
-    print(f"   📄 Single document with all information")
-    print(f"   📋 10 major sections covering everything")
-    print(f"   🎨 Professional modern & classic theme throughout")
-    print(f"   📏 Consistent styling and unified design")
+    An edition that fails is reported without stopping the others. Returns the
+    locales whose edition failed.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    if not isinstance(content, Content):
+        content = load_content(content or DEFAULT_CONTENT_PATH)
+    failed = []
+    with ProcessPoolExecutor(max_workers=jobs or len(locales)) as pool:
+        futures = {pool.submit(_build_edition, locale, list(variants), content.path, cache_dir, force, theme, web): locale
+                   for locale in locales}
+        for future in as_completed(futures):
+            locale = futures[future]
+            try:
+                print(f"🌍 {LOCALES[locale]} ({locale})\n{future.result()}", end='', file=log)
+            except (ContentError, OSError, ValueError, RuntimeError) as exc:
+                failed.append(locale)
+                print(f"❌ {LOCALES[locale]} ({locale}) edition failed: {exc}", file=log)
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the Angaza Tumaini comprehensive guide PDF")
+    parser.add_argument('-o', '--output', help="PDF file to write, or - for stdout (only with a single variant)")
+    parser.add_argument('--variant', action='append', help="document variant to build (repeatable, default: full)")
+    parser.add_argument('--all-variants', action='store_true', help="build every variant defined in the content file")
+    parser.add_argument('--content', default=DEFAULT_CONTENT_PATH, help="content file to build from")
+    parser.add_argument('--theme', choices=THEMES, default=DEFAULT_THEME,
+                        help="colour theme: default, grayscale (print-friendly) or high-contrast")
+    parser.add_argument('--locale', action='append', choices=LOCALES,
+                        help="language edition to build (repeatable, default: en); several are built concurrently")
+    parser.add_argument('--all-locales', action='store_true', help="build every language edition")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="directory holding the incremental build cache")
+    parser.add_argument('--no-cache', action='store_true', help="always rebuild and do not touch the cache")
+    parser.add_argument('--force', action='store_true', help="rebuild even if no section changed")
+    parser.add_argument('--parallel', action='store_true', help="render sections in a process pool and merge them (needs pypdf)")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes for --parallel/--recipients (default: CPU count)")
+    parser.add_argument('--recipients', help="CSV of donors/sponsors (name, email, sponsored_child, giving) to personalize for")
+    parser.add_argument('--batch-output', default="personalized-guides.zip",
+                        help="directory or .zip archive for --recipients output")
+    parser.add_argument('--web', action='store_true',
+                        help="write a linearized, compressed PDF for download from the website (needs pikepdf and pypdf)")
+    parser.add_argument('--profile', nargs='?', const="guide-profile.json", metavar='REPORT',
+                        help="rebuild serially and write per-section/per-flowable timings as JSON (default: guide-profile.json)")
+    parser.add_argument('--cprofile', metavar='STATS', help="also dump cProfile stats of the build (view with python -m pstats)")
+    args = parser.parse_args(argv)
+    if (args.profile or args.cprofile) and (args.parallel or args.recipients):
+        parser.error("--profile/--cprofile cannot be combined with --parallel or --recipients")
+    locales = list(LOCALES) if args.all_locales else (args.locale or [SOURCE_LOCALE])
+    if args.recipients and locales != [SOURCE_LOCALE]:
+        parser.error("--recipients builds English guides only")
+    if len(locales) > 1 and (args.output or args.parallel or args.profile or args.cprofile):
+        parser.error("several locales cannot be combined with --output, --parallel or --profile/--cprofile")
+    
+    # Load and validate everything before laying out any page
+    try:
+        content = load_content(args.content)
+        variants = list(content.variants) if args.all_variants else (args.variant or ['full'])
+        for variant in variants:
+            content.variant(variant)
+        recipients = load_recipients(args.recipients) if args.recipients else None
+    except ContentError as exc:
+        parser.exit(1, f"❌ Invalid guide content: {exc}\n")
+    
+    if recipients is not None:
+        variants = args.variant or ['donor-brief']
+        if args.all_variants or len(variants) > 1:
+            parser.error("--recipients takes a single --variant")
+        create_personalized_guides(recipients, args.batch_output, variant=variants[0], content=content,
+                                   jobs=args.jobs or os.cpu_count(), cache_dir=None if args.no_cache else args.cache_dir,
+                                   theme=args.theme)
+        return
+    if args.output and len(variants) > 1:
+        parser.error("--output can only be used with a single variant")
+    if len(locales) > 1:
+        failed = create_editions(locales, variants, content=content, cache_dir=None if args.no_cache else args.cache_dir,
+                                 force=args.force, jobs=args.jobs, log=sys.stdout, theme=args.theme, web=args.web)
+        if failed:
+            parser.exit(1, f"❌ Edition(s) failed: {', '.join(failed)}\n")
+        return
+    
+    output, log = args.output, sys.stdout
+    if output == '-':
+        output, log = sys.stdout.buffer, sys.stderr
+    profiler = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+    builds = []
+    for variant in variants:
+        profile = BuildProfile(variant) if args.profile else None
+        if profiler:
+            profiler.enable()
+        create_comprehensive_guide(output, variant=variant, content=content,
+                                   cache_dir=None if args.no_cache else args.cache_dir, force=args.force or bool(profiler),
+                                   parallel=args.parallel, jobs=args.jobs, log=log, profile=profile, theme=args.theme,
+                                   web=args.web, locale=locales[0])
+        if profiler:
+            profiler.disable()
+        if profile:
+            builds.append(profile.report)
+    
+    if args.profile:
+        write_report(builds, args.profile)
+        print(f"⏱️  Build profile written to {args.profile}", file=log)
+    if profiler:
+        profiler.dump_stats(args.cprofile)
+        print(f"⏱️  cProfile stats written to {args.cprofile}", file=log)
 
 if __name__ == "__main__":
-    create_comprehensive_guide()
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Sitemap & Structured Data Generator
+Reads every HTML page once and writes, from what it finds:
+  sitemap.xml    <url> per indexable page (its canonical URL) with the images it
+                 shows, as the largest filez/ variant of each (image sitemap).
+                 robots.txt keeps crawlers out of filez/, so an image points at
+                 the content-hashed static/ copy the site build makes of it
+                 (pack_assets.py); images robots.txt still disallows are left out
+  JSON-LD        the Organization block of each page, refreshed from the content
+                 model the guide PDF uses (scripts/guide_content.json) plus the
+                 social profiles the pages link to
+A page's <lastmod> only moves when its content hash changes; the hashes live in
+.sitemap-state.json. Files are written only when their content changed, so
+deploy caches stay valid.
+
+Usage: python scripts/generate_sitemap.py [--check]
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date, datetime
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+from xml.sax.saxutils import escape
+
+from guide_content import ContentError, load_content
+from pack_assets import PACKED_DIRS, file_digest, fingerprinted_name
+from responsive_images import ATTR, _Page, load_variants
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITEMAP_PATH = os.path.join(REPO_ROOT, 'sitemap.xml')
+STATE_PATH = os.path.join(REPO_ROOT, '.sitemap-state.json')
+ROBOTS_PATH = os.path.join(REPO_ROOT, 'robots.txt')
+
+# Search engine verification files and the like are not pages
+SKIP_PAGES = ('google*.html',)
+
+# For pages not yet in the sitemap; an existing entry keeps its values
+DEFAULT_CHANGEFREQ = 'monthly'
+DEFAULT_PRIORITY = {'index.html': '1.0'}
+DEFAULT_PRIORITY_OTHER = '0.5'
+
+# Links to these hosts are the organization's profiles (share buttons excluded)
+SOCIAL_HOSTS = ('facebook.com', 'instagram.com', 'tiktok.com', 'youtube.com', 'x.com', 'twitter.com', 'linkedin.com')
+TRACKING_PARAMS = re.compile(r'^(?:utm_\w+|igsh|igshid|_r|_t|fbclid|si)$')
+
+# One scan per page: start tags with the attributes we read, and JSON-LD blocks
+TAG = re.compile(r"""<(?P<name>[a-zA-Z][\w-]*)(?P<attrs>(?:\s+[^\s=/>]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)*)\s*/?>""")
+JSON_LD = re.compile(r"""(?P<open><script\s+type="application/ld\+json"\s*>)(?P<body>.*?)(?P<close>\n?[ \t]*</script>)""", re.S)
+STYLE_URL = re.compile(r"""url\((['"]?)([^'")]+)\1\)""")
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def find_pages():
+    return [path for path in sorted(glob.glob(os.path.join(REPO_ROOT, '*.html')))
+            if not any(fnmatch.fnmatch(os.path.basename(path), pattern) for pattern in SKIP_PAGES)]
+
+def _attrs(raw):
+    return {key.lower(): (value[1:-1] if value[:1] in ('"', "'") else value or '') for key, value in ATTR.findall(raw)}
+
+# ===== PAGE SCAN =====
+
+class PageInfo:
+    """What one page contributes to the sitemap and the structured data"""
+    def __init__(self, path):
+        self.path = path
+        self.name = _relpath(path)
+        self.canonical = None
+        self.indexable = True
+        self.logo = None
+        self.images = []    # image references in page order
+        self.profiles = []  # social profile URLs
+
+def scan_page(path, html):
+    """Collect canonical URL, robots directive, images and social links of one page"""
+    page = PageInfo(path)
+    for match in TAG.finditer(html):
+        name = match.group('name').lower()
+        attrs = _attrs(match.group('attrs'))
+        if name == 'link' and attrs.get('rel', '').lower() == 'canonical':
+            page.canonical = attrs.get('href')
+        elif name == 'meta' and attrs.get('name', '').lower() == 'robots':
+            page.indexable = 'noindex' not in attrs.get('content', '').lower()
+        elif name == 'meta' and attrs.get('property', '').lower() == 'og:image':
+            page.logo = attrs.get('content')
+        elif name == 'link' and attrs.get('rel', '').lower() == 'apple-touch-icon' and not page.logo:
+            page.logo = attrs.get('href')
+        elif name in ('img', 'source'):
+            page.images.append(attrs.get('src'))
+            page.images += [item.split()[0] for item in attrs.get('srcset', '').split(',') if item.strip()]
+        elif name == 'video' and attrs.get('poster'):
+            page.images.append(attrs['poster'])
+        elif name == 'a' and attrs.get('href', '').startswith('http'):
+            host = urlsplit(attrs['href']).hostname or ''
+            if any(host == h or host.endswith('.' + h) for h in SOCIAL_HOSTS) and 'share' not in attrs['href']:
+                page.profiles.append(_clean_url(attrs['href']))
+        if attrs.get('data-responsive-bg'):
+            page.images.append(attrs['data-responsive-bg'])
+        elif 'url(' in attrs.get('style', ''):
+            page.images += [m.group(2) for m in STYLE_URL.finditer(attrs['style'])]
+    page.images = [ref for ref in page.images if ref]
+    return page
+
+def _clean_url(url):
+    """Profile URL without share-tracking parameters"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not TRACKING_PARAMS.match(k)]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=''))
+
+def static_file(file, digests):
+    """The fingerprinted static/ copy the site build makes of a repository file (itself if none)
+
+    digests caches the file hashes across pages.
+    """
+    if file.split('/', 1)[0] not in PACKED_DIRS:
+        return file
+    if file not in digests:
+        digests[file] = file_digest(os.path.join(REPO_ROOT, file))
+    return fingerprinted_name(file, digests[file])
+
+def page_images(page, variants, site_url, digests, rules=()):
+    """Absolute URLs of the distinct local images a page shows, as their largest JPG variant
+
+    Each points at the file's static/ copy; images the robots rules keep crawlers
+    away from are left out.
+    """
+    resolver = _Page(page.path, variants)
+    urls = []
+    for ref in page.images:
+        entry = resolver.lookup(ref)
+        if entry:
+            file = entry['variants'][max(entry['variants'])]['files']['jpg']
+        else:
+            file = resolver.resolve(ref)
+            if file is None or not os.path.isfile(os.path.join(REPO_ROOT, file)):
+                continue
+        file = static_file(file, digests)
+        if not crawlable('/' + file, rules):
+            continue
+        url = f"{site_url}/{quote(file)}"
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+# ===== STRUCTURED DATA =====
+
+def organization_ld(content, site_url, logo, profiles):
+    """schema.org Organization from the guide's content model"""
+    org = content.organization
+    about = content.sections.get('about')
+    paragraph = next((block.text for block in (about.blocks if about else ())
+                      if getattr(block, 'type', None) == 'paragraph'), None)
+    description = re.split(r'(?<=\.)\s', paragraph, maxsplit=1)[0] if paragraph else org.tagline
+    address = [part.strip() for part in org.address.split(',')]
+    data = {
+        "@context": "https://schema.org",
+        "@type": "Organization",
+        "name": org.name,
+        "alternateName": org.short_name,
+        "slogan": org.tagline,
+        "description": description,
+        "url": site_url,
+    }
+    if logo:
+        data["logo"] = logo
+    data["email"] = org.email
+    data["telephone"] = org.phone.replace(' ', '-')
+    data["address"] = {
+        "@type": "PostalAddress",
+        "streetAddress": ", ".join(address[:-2]),
+        "addressLocality": address[-2] if len(address) > 1 else address[0],
+        "addressCountry": address[-1],
+    }
+    try:
+        data["foundingDate"] = datetime.strptime(org.launched, '%B %d, %Y').date().isoformat()
+    except ValueError:
+        pass
+    same_as = []
+    for url in [org.facebook] + profiles:
+        if url not in same_as:
+            same_as.append(url)
+    data["sameAs"] = same_as
+    data["contactPoint"] = {
+        "@type": "ContactPoint",
+        "contactType": "Customer Service",
+        "email": org.email,
+        "telephone": org.phone.replace(' ', '-'),
+    }
+    return data
+
+def refresh_json_ld(html, data):
+    """Replace the Organization JSON-LD blocks of a page, keeping their indentation"""
+    def replace(match):
+        try:
+            current = json.loads(match.group('body'))
+        except ValueError:
+            return match.group(0)
+        if not isinstance(current, dict) or current.get('@type') != 'Organization':
+            return match.group(0)
+        indent = re.search(r'\n([ \t]*)$', html[:match.start()])
+        indent = indent.group(1) if indent else ''
+        body = json.dumps(data, indent=2, ensure_ascii=False).replace('\n', '\n' + indent)
+        return f"{match.group('open')}\n{indent}{body}{match.group('close')}"
+    return JSON_LD.sub(replace, html)
+
+# ===== SITEMAP =====
+
+def _existing_entries(path=SITEMAP_PATH):
+    """loc -> {lastmod, changefreq, priority} of the current sitemap, read leniently"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return {}
+    entries = {}
+    for block in re.findall(r'<url>(.*?)</url>', text, re.S):
+        fields = dict(re.findall(r'<(loc|lastmod|changefreq|priority)>\s*([^<]*?)\s*</\1>', block))
+        if 'loc' in fields:
+            entries[fields['loc']] = fields
+    return entries
+
+def render_sitemap(urls):
+    """sitemap.xml for [(loc, lastmod, changefreq, priority, images)]"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+             ' xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">']
+    for loc, lastmod, changefreq, priority, images in urls:
+        lines += ['  <url>', f'    <loc>{escape(loc)}</loc>', f'    <lastmod>{lastmod}</lastmod>',
+                  f'    <changefreq>{changefreq}</changefreq>', f'    <priority>{priority}</priority>']
+        for image in images[:1000]:  # the image sitemap limit per page
+            lines += ['    <image:image>', f'      <image:loc>{escape(image)}</image:loc>', '    </image:image>']
+        lines.append('  </url>')
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+def _load_state():
+    try:
+        with open(STATE_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_if_changed(path, text, check):
+    """Write text unless the file already holds it; returns whether it differed"""
+    try:
+        with open(path, encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    if not check:
+        with open(path + '.tmp', 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        os.replace(path + '.tmp', path)
+    return True
+
+def generate(pages=None, check=False, today=None):
+    """Refresh the JSON-LD of the pages, then the sitemap; returns the files that changed"""
+    pages = pages or find_pages()
+    today = (today or date.today()).isoformat()
+    content = load_content()
+    variants = load_variants()
+    rules, digests = robots_rules(), {}
+    state = _load_state()
+    existing = _existing_entries()
+
+    sources, infos = {}, []
+    for path in pages:
+        with open(path, encoding='utf-8', newline='') as f:
+            sources[path] = f.read()
+        infos.append(scan_page(path, sources[path]))
+    infos.sort(key=lambda info: info.name != 'index.html')  # the home page leads the sitemap
+    home = next((info for info in infos if info.name == 'index.html' and info.canonical), None)
+    if home is None:
+        raise ValueError("index.html needs a <link rel=\"canonical\"> with the site URL")
+    site_url = home.canonical.rstrip('/')
+    profiles = []
+    for info in infos:
+        profiles += [url for url in info.profiles if url not in profiles]
+    logo = home.logo if home.logo is None or home.logo.startswith('http') else f"{site_url}/{home.logo.lstrip('/')}"
+    organization = organization_ld(content, site_url, logo, profiles)
+
+    changed, urls, new_state = [], [], {}
+    for info in infos:
+        html = refresh_json_ld(sources[info.path], organization)
+        if _write_if_changed(info.path, html, check):
+            changed.append(info.path)
+        if not info.indexable:
+            continue
+        loc = info.canonical or f"{site_url}/{quote(info.name)}"
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        previous = state.get(info.name)
+        known = existing.get(loc, {})
+        if previous and previous['hash'] == digest:
+            lastmod = previous['lastmod']
+        elif previous is None and known.get('lastmod'):
+            lastmod = known['lastmod']  # first run: trust the hand-kept date
+        else:
+            lastmod = today
+        new_state[info.name] = {'hash': digest, 'lastmod': lastmod}
+        priority = known.get('priority') or DEFAULT_PRIORITY.get(info.name, DEFAULT_PRIORITY_OTHER)
+        urls.append((loc, lastmod, known.get('changefreq') or DEFAULT_CHANGEFREQ, priority,
+                     page_images(info, variants, site_url, digests, rules)))
+
+    if _write_if_changed(SITEMAP_PATH, render_sitemap(urls), check):
+        changed.append(SITEMAP_PATH)
+    if _write_if_changed(STATE_PATH, json.dumps(new_state, indent=2, sort_keys=True) + '\n', check):
+        changed.append(STATE_PATH)
+    return changed
+
+# ===== ROBOTS =====
+
+def robots_rules(path=ROBOTS_PATH):
+    """Allow/Disallow rules of robots.txt for every crawler, as [(path prefix, allowed)]"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rules, agents, in_rules = [], [], False
+    for line in lines:
+        field, _, value = line.split('#', 1)[0].partition(':')
+        field, value = field.strip().lower(), value.strip()
+        if field == 'user-agent':
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value)
+        elif field in ('allow', 'disallow'):
+            in_rules = True
+            if '*' in agents and value:
+                rules.append((value, field == 'allow'))
+    return rules
+
+def crawlable(path, rules):
+    """Whether robots rules let crawlers fetch a site path: the longest matching rule wins"""
+    matches = [(len(prefix), allowed) for prefix, allowed in rules if path.startswith(prefix)]
+    return max(matches)[1] if matches else True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate sitemap.xml and the JSON-LD of the pages")
+    parser.add_argument('--check', action='store_true', help="only report files that would change (exit 1 if any)")
+    args = parser.parse_args(argv)
+
+    try:
+        changed = generate(check=args.check)
+    except (ContentError, ValueError) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    for path in changed:
+        print(f"{'✗ Out of date' if args.check else '✅ Wrote'}: {_relpath(path)}")
+    if not changed:
+        print("✅ sitemap.xml and structured data are up to date")
+    return 1 if args.check and changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
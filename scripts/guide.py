@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Fast Guide CLI
+Same options as generate_comprehensive_guide.py, without paying for ReportLab's
+import (and the first build's font, style and photo loading) on every run.
+
+  python scripts/guide.py --serve &          start the warm generator daemon
+  python scripts/guide.py --variant ...      build; handled by the daemon when it runs
+  python scripts/guide.py --stop             stop the daemon
+
+The daemon listens on a Unix socket only the current user can open. When no
+daemon is running (or on platforms without Unix sockets) the command runs in
+this process, importing the generator only when the cache manifest cannot
+already tell that every requested PDF is up to date. The daemon restarts itself
+when the generator's source files change so it never serves stale code.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or '/tmp', f"angaza-guide-{os.getuid()}.sock") \
+    if hasattr(os, 'getuid') else None
+
+# Response frames: one byte channel (stdout, stderr, exit status, restart), 4-byte length, payload
+FRAME = struct.Struct('!cI')
+
+# Modules whose code the daemon keeps loaded; a change to any of them restarts it
+SOURCES = ('generate_comprehensive_guide.py', 'guide_cache.py', 'guide_content.py', 'guide_fonts.py', 'guide_images.py',
+           'guide_ledger.py', 'guide_profile.py', 'guide_translations.py', 'guide_webpdf.py')
+
+def _run_locally(argv):
+    sys.path.insert(0, SCRIPTS_DIR)
+    from guide_cache import answer_up_to_date
+    if answer_up_to_date(argv):
+        return 0
+    from generate_comprehensive_guide import main
+    main(argv)
+    return 0
+
+# ===== CLIENT =====
+
+def _recv_exact(conn, size):
+    data = b''
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("daemon closed the connection")
+        data += chunk
+    return data
+
+def _request(path, request):
+    """Send one request; yields (channel, payload) frames. Raises OSError when no daemon listens."""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(path)
+        conn.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        while True:
+            channel, size = FRAME.unpack(_recv_exact(conn, FRAME.size))
+            yield channel, _recv_exact(conn, size)
+            if channel in (b'x', b'r'):
+                return
+    finally:
+        conn.close()
+
+def forward(argv, path=DEFAULT_SOCKET):
+    """Run the generator with argv in the daemon; None when no (current) daemon could take it"""
+    if path is None or not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None  # someone else's socket: never hand them our arguments
+        for channel, payload in _request(path, {'argv': argv, 'cwd': os.getcwd()}):
+            if channel == b'o':
+                sys.stdout.buffer.write(payload)
+                sys.stdout.buffer.flush()
+            elif channel == b'e':
+                sys.stderr.buffer.write(payload)
+                sys.stderr.buffer.flush()
+            elif channel == b'x':
+                return int(payload)
+            else:  # the daemon's code is out of date; it restarts, this run goes local
+                return None
+    except (OSError, ConnectionError):
+        return None
+    return None
+
+# ===== DAEMON =====
+
+class _FrameWriter(io.RawIOBase):
+    """Binary stream that sends everything written as frames of one channel"""
+    def __init__(self, conn, channel):
+        super().__init__()
+        self.conn = conn
+        self.channel = channel
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if data:
+            self.conn.sendall(FRAME.pack(self.channel, len(data)) + bytes(data))
+        return len(data)
+
+def _stream(conn, channel):
+    """Text stream over a frame channel, with .buffer for binary output such as -o -"""
+    return io.TextIOWrapper(io.BufferedWriter(_FrameWriter(conn, channel)), encoding='utf-8', write_through=True)
+
+def _source_stamps():
+    stamps = {}
+    for name in SOURCES:
+        path = os.path.join(SCRIPTS_DIR, name)
+        try:
+            stat = os.stat(path)
+            stamps[name] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stamps[name] = None
+    return stamps
+
+def _warm_up(generator):
+    """Load fonts, styles, content, code hashes and photos once, before the first request"""
+    content = generator.load_content(generator.DEFAULT_CONTENT_PATH)
+    for variant in content.variants:
+        generator.guide_version(variant, content)
+    generator.create_comprehensive_guide(io.BytesIO(), content=content, cache_dir=None, log=None)
+
+def _handle(conn, request, generator):
+    """Run one generator command with the client's working directory and output streams"""
+    import contextlib
+    import traceback
+
+    out, err = _stream(conn, b'o'), _stream(conn, b'e')
+    status, cwd = 0, os.getcwd()
+    try:
+        os.chdir(request['cwd'])
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                generator.main(request['argv'])
+            except SystemExit as exc:
+                if isinstance(exc.code, str):
+                    print(exc.code, file=sys.stderr)
+                status = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                status = 1
+            sys.stdout.flush()
+            sys.stderr.flush()
+    finally:
+        os.chdir(cwd)
+    conn.sendall(FRAME.pack(b'x', len(str(status))) + str(status).encode('ascii'))
+
+def serve(path=DEFAULT_SOCKET):
+    """Run the daemon in the foreground until --stop (or Ctrl+C)"""
+    # Refuse to start twice; clear a socket left behind by a daemon that died
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            print(f"❌ A guide daemon is already running on {path}", file=sys.stderr)
+            return 1
+        except OSError:
+            os.unlink(path)
+        finally:
+            probe.close()
+
+    sys.path.insert(0, SCRIPTS_DIR)
+    import generate_comprehensive_guide as generator
+    stamps = _source_stamps()
+    _warm_up(generator)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o077)  # socket usable by this user only: requests write files as this user
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(umask)
+    listener.listen()
+    print(f"🔥 Guide daemon ready on {path}")
+    sys.stdout.flush()
+
+    restart = False
+    try:
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                try:
+                    request = json.loads(conn.makefile('rb').readline() or b'{}')
+                    if request.get('command') == 'stop':
+                        conn.sendall(FRAME.pack(b'x', 1) + b'0')
+                        break
+                    if _source_stamps() != stamps:
+                        conn.sendall(FRAME.pack(b'r', 0))
+                        restart = True
+                        break
+                    _handle(conn, request, generator)
+                except (OSError, ValueError, KeyError):
+                    pass  # client went away (e.g. output piped into head) or sent garbage
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        os.unlink(path)
+
+    if restart:
+        print("♻️  Generator code changed, restarting the daemon")
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable, os.path.abspath(__file__), '--serve', '--socket', path])
+    print("👋 Guide daemon stopped")
+    return 0
+
+def stop(path=DEFAULT_SOCKET):
+    try:
+        for _ in _request(path, {'command': 'stop'}):
+            pass
+    except (OSError, ConnectionError):
+        print("ℹ️  No guide daemon is running")
+        return 1
+    print("✅ Guide daemon stopped")
+    return 0
+
+# ===== CLI =====
+
+def main(argv=None):
+    # Parsed by hand: argparse alone would cost a noticeable part of a warm run
+    argv = list(sys.argv[1:] if argv is None else argv)
+    path = DEFAULT_SOCKET
+    if '--socket' in argv:
+        i = argv.index('--socket')
+        if i + 1 == len(argv):
+            print("❌ --socket needs a path", file=sys.stderr)
+            return 2
+        path = argv[i + 1]
+        del argv[i:i + 2]
+
+    if argv[:1] in (['--serve'], ['--stop']):
+        if path is None or not hasattr(socket, 'AF_UNIX'):
+            print("❌ The guide daemon needs Unix sockets (Linux, macOS or WSL)", file=sys.stderr)
+            return 1
+        return serve(path) if argv[0] == '--serve' else stop(path)
+
+    status = forward(argv, path)
+    return _run_locally(argv) if status is None else status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Benchmark
+Measures how PDF generation scales with content. Each scale multiplies the team
+members, programs, values, FAQ entries, bullet lists, table rows and photos of
+guide_content.json (10x = ten times as many of each; extra photos are generated
+so every portrait is a distinct image), adds a donation ledger of LEDGER_ROWS
+rows per scale to the billing chapter and builds the result in a fresh process:
+
+  serial    create_comprehensive_guide, cold cache
+  parallel  create_comprehensive_guide(parallel=True), cold cache (needs pypdf)
+  batch     create_personalized_guides for --recipients synthetic donors (needs pypdf)
+
+Wall time, peak RSS (of the build process and of its largest worker) and output
+size are appended to benchmarks/guide-history.jsonl, one JSON object per case.
+Each case is compared with the last matching run on the same machine and a
+slowdown beyond --threshold is reported.
+
+Usage: python scripts/guide_benchmark.py [--scales 1 10 100] [--modes serial batch] [--repeat 3]
+"""
+
+import argparse
+import copy
+import csv
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+import reportlab
+from PIL import Image
+
+from generate_comprehensive_guide import create_comprehensive_guide, create_personalized_guides
+from guide_content import DEFAULT_CONTENT_PATH, Recipient, load_content
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY = os.path.join(REPO_ROOT, "benchmarks", "guide-history.jsonl")
+
+SCALES = (1, 10, 100)
+MODES = ('serial', 'parallel', 'batch')
+DEFAULT_VARIANT = {'serial': 'full', 'parallel': 'full', 'batch': 'donor-brief'}
+
+# Size of the generated stand-in photos (a typical phone photo after export)
+PHOTO_SIZE = (1600, 1200)
+
+# Rows of the synthetic donation ledger per unit of scale, and the chapter it is added to
+LEDGER_ROWS = 200
+LEDGER_SECTION = 'billing'
+
+# Field that tells the copies of a list item apart
+ITEM_LABEL = {'people': 'name', 'programs': 'title', 'values': 'title', 'entries': 'title', 'faq': 'question'}
+
+# ===== SYNTHETIC CONTENT =====
+
+def _synthetic_photo(path, seed):
+    """Deterministic photo-like JPEG: smooth colour noise, so it neither compresses to nothing nor is pure noise"""
+    rng = random.Random(seed)
+    small = (PHOTO_SIZE[0] // 8, PHOTO_SIZE[1] // 8)
+    bands = [Image.frombytes('L', small, rng.randbytes(small[0] * small[1])).resize(PHOTO_SIZE, Image.BICUBIC)
+             for _ in range(3)]
+    Image.merge('RGB', bands).save(path, 'JPEG', quality=90)
+
+def _scale_items(block, factor, photos):
+    label = ITEM_LABEL.get(block['type'])
+    items = []
+    for copy_number in range(factor):
+        for item in block['items']:
+            if copy_number == 0:
+                items.append(item)
+                continue
+            if label is None:
+                items.append(f"{item} ({copy_number + 1})")
+                continue
+            item = dict(item, **{label: f"{item[label]} ({copy_number + 1})"})
+            if 'photo' in item:
+                item['photo'] = photos()
+            items.append(item)
+    block['items'] = items
+
+def _scale_table(block, factor):
+    rows = block['rows']
+    body, total = (rows[:-1], rows[-1:]) if block.get('total_row') else (rows, [])
+    block['rows'] = body * factor + total
+
+def _synthetic_ledger(path, rows):
+    """Deterministic donation ledger CSV: date, donor, fund, amount"""
+    rng = random.Random(rows)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['date', 'donor', 'fund', 'amount'])
+        for i in range(1, rows + 1):
+            writer.writerow([f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", f"Donor {i:06d}",
+                             rng.choice(('General', 'Education', 'Outreach', 'Feeding')), rng.randint(100, 50000)])
+
+def scale_content(data, factor, photo_dir):
+    """Copy of a content document with factor times as many list items, table rows and photos"""
+    data = copy.deepcopy(data)
+    counter = iter(range(1, sys.maxsize))
+
+    def photos():
+        path = os.path.join(photo_dir, f"photo-{next(counter):05d}.jpg")
+        _synthetic_photo(path, os.path.basename(path))
+        return path
+
+    os.makedirs(photo_dir, exist_ok=True)
+    for section in data['sections']:
+        for block in section.get('blocks', []):
+            if block['type'] == 'table':
+                _scale_table(block, factor)
+            elif 'items' in block:
+                _scale_items(block, factor, photos)
+    return data
+
+def write_scaled_content(factor, directory, source=DEFAULT_CONTENT_PATH):
+    """Write the scaled content file into directory; returns its path and a count of what it contains"""
+    with open(source, encoding='utf-8') as f:
+        data = json.load(f)
+    # Photo paths are relative to the content file, which is about to move
+    for section in data['sections']:
+        for block in section.get('blocks', []):
+            for item in block.get('items', []):
+                if isinstance(item, dict) and 'photo' in item:
+                    item['photo'] = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(source)), item['photo']))
+
+    data = scale_content(data, factor, os.path.join(directory, 'photos'))
+    for section in data['sections']:
+        if section['id'] == LEDGER_SECTION:
+            _synthetic_ledger(os.path.join(directory, 'ledger.csv'), LEDGER_ROWS * factor)
+            section['blocks'] += [
+                {'type': 'subheading', 'text': "Donation Ledger"},
+                {'type': 'ledger', 'source': 'ledger.csv', 'columns': ['Date', 'Donor', 'Fund', 'Amount (KES)'],
+                 'sum_columns': [3], 'number_format': '{:,.0f}'},
+            ]
+    path = os.path.join(directory, 'guide_content.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    content = load_content(path)
+    blocks = [block for section in content.sections.values() for block in section.blocks]
+    counts = {
+        'team_members': sum(len(b.items) for b in blocks if b.type == 'people'),
+        'faq_entries': sum(len(b.items) for b in blocks if b.type == 'faq'),
+        'table_rows': sum(len(b.rows) for b in blocks if b.type == 'table'),
+        'ledger_rows': LEDGER_ROWS * factor if any(b.type == 'ledger' for b in blocks) else 0,
+        'list_items': sum(len(b.items) for b in blocks if hasattr(b, 'items')),
+        'images': sum(len(content.photos(section)) for section in content.sections.values()),
+    }
+    return path, counts
+
+def synthetic_recipients(count):
+    """Donors with a sponsored child and a year of monthly gifts"""
+    giving = ';'.join(f"2025-{month:02d}-01:5000:Monthly gift" for month in range(1, 13))
+    return [Recipient(f"Donor {i:04d}", f"donor{i}@example.org", f"Child {i:04d}", giving)
+            for i in range(1, count + 1)]
+
+# ===== MEASUREMENT =====
+
+def _peak_rss(children=False):
+    """Peak resident set size in bytes of this process or its largest child (None where unknown)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+def _page_count(path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    return len(PdfReader(path).pages)
+
+def run_case(mode, content_path, variant, workdir, jobs, recipients):
+    """Benchmark process task: one cold build; returns its measurements"""
+    cache_dir = os.path.join(workdir, 'cache')
+    output = os.path.join(workdir, 'guide.zip' if mode == 'batch' else 'guide.pdf')
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        if mode == 'batch':
+            documents = create_personalized_guides(synthetic_recipients(recipients), output, variant=variant,
+                                                   content=content_path, jobs=jobs, cache_dir=cache_dir)
+        else:
+            create_comprehensive_guide(output, variant=variant, content=content_path, cache_dir=cache_dir,
+                                       force=True, parallel=mode == 'parallel', jobs=jobs, log=None)
+            documents = 1
+        wall = time.perf_counter() - start
+    return {
+        'wall_seconds': round(wall, 4),
+        'peak_rss_bytes': _peak_rss(),
+        'worker_peak_rss_bytes': _peak_rss(children=True) or None,
+        'output_bytes': os.path.getsize(output),
+        'documents': documents,
+        'pages': None if mode == 'batch' else _page_count(output),
+    }
+
+def measure(mode, content_path, variant, workdir, jobs, recipients):
+    """Run one case in a fresh interpreter so its peak RSS is its own"""
+    os.makedirs(workdir)
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(run_case, mode, content_path, variant, workdir, jobs, recipients).result()
+
+# ===== HISTORY =====
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_history(path):
+    """Every recorded run, oldest first (a missing file is an empty history)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+def _append_history(path, records):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+
+def _previous(history, record):
+    """Last run of the same case on the same machine"""
+    same = ('case', 'variant', 'host', 'cpus', 'jobs', 'recipients')
+    for old in reversed(history):
+        if all(old.get(key) == record.get(key) for key in same):
+            return old
+    return None
+
+def _change(new, old):
+    return f"{(new - old) / old:+.0%}" if old else "n/a"
+
+# ===== CLI =====
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark guide generation at scaled content sizes")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES), help="content multipliers (default: 1 10 100)")
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES), help="build modes to measure (default: all)")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per case; the median is recorded")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="worker processes for parallel and batch")
+    parser.add_argument('--recipients', type=int, default=20, help="personalized guides per batch case")
+    parser.add_argument('--content', default=DEFAULT_CONTENT_PATH, help="content file to scale")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSON Lines file the results are appended to")
+    parser.add_argument('--no-history', action='store_true', help="print the results without recording them")
+    parser.add_argument('--threshold', type=float, default=0.15, help="slowdown reported as a regression (default: 0.15)")
+    parser.add_argument('--fail-on-regression', action='store_true', help="exit with status 1 when a case regressed")
+    args = parser.parse_args(argv)
+    if min(args.scales) < 1 or args.repeat < 1:
+        parser.error("--scales and --repeat must be at least 1")
+
+    try:
+        import pypdf  # noqa: F401 - parallel and batch builds merge PDFs with it
+    except ImportError:
+        skipped = [mode for mode in args.modes if mode != 'serial']
+        if skipped:
+            print(f"⚠️  Skipping {', '.join(skipped)} (needs pypdf: pip install pypdf)")
+        args.modes = [mode for mode in args.modes if mode == 'serial']
+
+    history = load_history(args.history)
+    common = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'host': platform.node(),
+        'platform': sys.platform,
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'reportlab': reportlab.Version,
+    }
+    records, regressions = [], []
+    with tempfile.TemporaryDirectory(prefix='guide-benchmark-') as tmp:
+        for scale in args.scales:
+            print(f"📦 Generating {scale}x content...")
+            content_path, counts = write_scaled_content(scale, os.path.join(tmp, f"{scale}x"), args.content)
+            for mode in args.modes:
+                case = f"{mode}-{scale}x"
+                runs = [measure(mode, content_path, DEFAULT_VARIANT[mode], os.path.join(tmp, f"{case}-{i}"),
+                                args.jobs, args.recipients) for i in range(args.repeat)]
+                result = dict(runs[0], wall_seconds=round(statistics.median(r['wall_seconds'] for r in runs), 4),
+                              runs=[r['wall_seconds'] for r in runs])
+                record = dict(common, case=case, mode=mode, scale=scale, variant=DEFAULT_VARIANT[mode],
+                              jobs=None if mode == 'serial' else args.jobs,
+                              recipients=args.recipients if mode == 'batch' else None,
+                              content=counts, **result)
+                records.append(record)
+
+                rss = record['peak_rss_bytes']
+                line = (f"   ⏱️  {case:<14} {record['wall_seconds']:8.2f} s  "
+                        f"{'n/a' if rss is None else f'{rss / 2**20:,.0f} MB':>8} RSS  "
+                        f"{record['output_bytes'] / 1024:10,.0f} KB")
+                old = _previous(history, record)
+                if old:
+                    line += f"  (time {_change(record['wall_seconds'], old['wall_seconds'])}, " \
+                            f"size {_change(record['output_bytes'], old['output_bytes'])} vs {old['commit'] or old['timestamp']})"
+                    if record['wall_seconds'] > old['wall_seconds'] * (1 + args.threshold):
+                        regressions.append(case)
+                        line += "  ⚠️ slower"
+                print(line)
+
+    if not args.no_history:
+        _append_history(args.history, records)
+        print(f"✅ {len(records)} result(s) appended to {os.path.relpath(args.history)}")
+    if regressions:
+        print(f"⚠️  Slower than the previous run by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
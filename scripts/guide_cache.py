@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Build Cache
+Manifest of the incremental guide build (.guide-cache/manifest.json, one per
+language edition). Besides its content hashes, every built variant records the
+files its build read by size and modification time, the day it was built and
+where it was written. A run that changes nothing is answered from those stamps
+alone, before the generator imports ReportLab, loads fonts or reads the
+content; any differing stamp falls through to the full, hash-checked build.
+Standard library only: this module is imported on that fast path.
+"""
+
+import json
+import os
+import sys
+from datetime import date
+
+DEFAULT_CACHE_DIR = ".guide-cache"
+MANIFEST_NAME = "manifest.json"
+PARTS_DIR = "sections"
+IMAGES_DIR = "images"
+FONTS_DIR = "fonts"
+LOCALES_DIR = "locales"
+
+# Defaults of generate_comprehensive_guide.py (THEMES), guide_translations.py
+# (LOCALES) and guide_content.py, repeated here so the fast path imports none of them
+DEFAULT_THEME = 'default'
+SOURCE_LOCALE = 'en'
+DEFAULT_CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "guide_content.json")
+
+def load_manifest(cache_dir):
+    """Read the cache manifest, treating a missing or corrupt file as an empty cache"""
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(cache_dir, manifest):
+    """Write the cache manifest atomically so an interrupted build never leaves it half-written"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+def file_stamp(path):
+    """Cheap identity of a file (size + mtime) to detect edits without re-hashing it"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def input_stamps(paths):
+    """Stamp of each input file (None for one that does not exist)"""
+    stamps = {}
+    for path in paths:
+        try:
+            stamps[path] = file_stamp(path)
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+def build_key(variant, theme=DEFAULT_THEME, web=False):
+    """Manifest entry of a variant: other themes and the web copy get their own entry"""
+    return (variant if theme == DEFAULT_THEME else f"{variant}@{theme}") + ('+web' if web else '')
+
+def edition_dir(cache_dir, locale=SOURCE_LOCALE):
+    """Cache directory of a language edition: each keeps its own manifest and parts"""
+    return cache_dir if locale == SOURCE_LOCALE else os.path.join(cache_dir, LOCALES_DIR, locale)
+
+def current(entry, content_path, filename=None):
+    """The output file of a manifest entry if it is up to date without a rebuild, else None
+
+    Up to date means built today from the same content file, with every input
+    and the output itself untouched since. filename defaults to the variant's
+    own file name.
+    """
+    if not entry.get('inputs') or entry.get('day') != date.today().isoformat() or entry.get('content') != content_path:
+        return None
+    filename = filename or entry.get('filename')
+    if not filename or not os.path.exists(filename):
+        return None
+    if entry.get('output') != [os.path.abspath(filename)] + file_stamp(filename):
+        return None
+    if any(input_stamps([path])[path] != stamp for path, stamp in entry['inputs'].items()):
+        return None
+    return filename
+
+# Options of generate_comprehensive_guide.py the fast path understands; any other
+# (--force, --recipients, --profile, ...) needs the generator
+_VALUE_OPTIONS = {'-o': 'output', '--output': 'output', '--variant': 'variant', '--content': 'content',
+                  '--theme': 'theme', '--locale': 'locale', '--cache-dir': 'cache_dir', '-j': None, '--jobs': None}
+_FLAG_OPTIONS = {'--all-variants': 'all_variants', '--web': 'web', '--parallel': None}
+
+def _parse(argv):
+    """The generator options of argv, or None when they need more than a manifest lookup"""
+    args = {'variant': [], 'locale': []}
+    argv = list(argv)
+    while argv:
+        arg = argv.pop(0)
+        option, _, value = arg.partition('=') if arg.startswith('--') else (arg, '', '')
+        if option in _FLAG_OPTIONS and not value:
+            if _FLAG_OPTIONS[option]:
+                args[_FLAG_OPTIONS[option]] = True
+        elif option in _VALUE_OPTIONS:
+            if not value:
+                if not argv:
+                    return None
+                value = argv.pop(0)
+            name = _VALUE_OPTIONS[option]
+            if name in ('variant', 'locale'):
+                args[name].append(value)
+            elif name:
+                args[name] = value
+        else:
+            return None
+    if len(args['locale']) > 1 or args.get('output') == '-':
+        return None
+    return args
+
+def answer_up_to_date(argv, out=sys.stdout):
+    """Report every output argv asks for as up to date and return True, if each one is
+
+    Returns False (having printed nothing) as soon as one output might need building.
+    """
+    args = _parse(argv)
+    if args is None:
+        return False
+    cache_dir = edition_dir(args.get('cache_dir', DEFAULT_CACHE_DIR), (args['locale'] or [SOURCE_LOCALE])[0])
+    manifest = load_manifest(cache_dir)
+    content = os.path.abspath(args.get('content', DEFAULT_CONTENT_PATH))
+    theme, web = args.get('theme', DEFAULT_THEME), args.get('web', False)
+    variants = args['variant'] or ['full']
+    if args.get('all_variants'):
+        # Every entry built from this content file lists the content's variants
+        variants = next((entry.get('variants') for entry in manifest.values() if entry.get('content') == content), None)
+    if not variants or (args.get('output') and len(variants) > 1):
+        return False
+
+    lines = []
+    for variant in variants:
+        entry = manifest.get(build_key(variant, theme, web), {})
+        filename = current(entry, content, args.get('output'))
+        if filename is None:
+            return False
+        lines.append(f"✅ {entry['title']} is up to date: {filename}")
+        lines.extend(entry.get('warnings', []))
+    for line in lines:
+        print(line, file=out)
+    return True
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Content Model
+Loads guide_content.json into compact records shared by every document variant.
+All content is validated up front so a bad entry fails before any layout starts.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from datetime import date
+from html.parser import HTMLParser
+
+DEFAULT_CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "guide_content.json")
+
+COLORS = ('primary', 'secondary', 'accent')
+TEXT_STYLES = ('body', 'light')
+
+class ContentError(ValueError):
+    """Raised when the content file is malformed; the message names the offending entry"""
+
+def _digest(data):
+    """Stable hash of a JSON-compatible value"""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+# ===== VALIDATION HELPERS =====
+
+# Inline markup tags the PDF's paragraph parser understands (others are ignored
+# there); the empty ones must be written self-closed, like <br/>
+MARKUP_TAGS = {'a', 'b', 'bullet', 'em', 'font', 'greek', 'i', 'link', 'nobr', 'span', 'strike', 'strong', 'sub',
+               'sup', 'super', 'u'}
+EMPTY_MARKUP_TAGS = {'br', 'img', 'index', 'ondraw', 'seq', 'seqchain', 'seqdefault', 'seqformat', 'seqreset',
+                     'unichar'}
+
+class _MarkupChecker(HTMLParser):
+    """Finds the first unbalanced tag of a text's inline markup"""
+
+    def __init__(self):
+        super().__init__()
+        self.open = []
+        self.error = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in EMPTY_MARKUP_TAGS:
+            self.error = self.error or f"<{tag}> must be written <{tag}/>"
+        elif tag in MARKUP_TAGS:
+            self.open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_endtag(self, tag):
+        if tag not in MARKUP_TAGS:
+            return
+        if not self.open or self.open[-1] != tag:
+            expected = f"</{self.open[-1]}>" if self.open else "no closing tag"
+            self.error = self.error or f"</{tag}> where {expected} was expected"
+        else:
+            self.open.pop()
+
+def _markup(value, path):
+    """Raise ContentError unless value's inline markup (<b>, <i>, <br/>, ...) is well formed"""
+    checker = _MarkupChecker()
+    checker.feed(value)
+    checker.close()
+    if not checker.error and checker.open:
+        checker.error = f"<{checker.open[-1]}> is never closed"
+    if checker.error:
+        raise ContentError(f"{path}: bad markup: {checker.error}")
+    return value
+
+def _expect_object(data, path, required, optional=()):
+    if not isinstance(data, dict):
+        raise ContentError(f"{path}: expected an object, got {type(data).__name__}")
+    missing = [key for key in required if key not in data]
+    if missing:
+        raise ContentError(f"{path}: missing {', '.join(repr(k) for k in missing)}")
+    unknown = sorted(set(data) - set(required) - set(optional))
+    if unknown:
+        raise ContentError(f"{path}: unknown field(s) {', '.join(repr(k) for k in unknown)}")
+    return data
+
+def _text(data, key, path, default=None, markup=True):
+    value = data.get(key, default)
+    if not isinstance(value, str) or not value.strip():
+        raise ContentError(f"{path}.{key}: expected non-empty text")
+    return _markup(value, f"{path}.{key}") if markup else value
+
+def _number(data, key, path, default):
+    value = data.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ContentError(f"{path}.{key}: expected a non-negative number")
+    return value
+
+def _choice(data, key, path, choices, default):
+    value = data.get(key, default)
+    if value not in choices:
+        raise ContentError(f"{path}.{key}: expected one of {', '.join(choices)}, got {value!r}")
+    return value
+
+def _text_list(data, key, path):
+    value = data.get(key)
+    if not isinstance(value, list) or not value:
+        raise ContentError(f"{path}.{key}: expected a non-empty list")
+    for i, item in enumerate(value):
+        if not isinstance(item, str) or not item.strip():
+            raise ContentError(f"{path}.{key}[{i}]: expected non-empty text")
+        _markup(item, f"{path}.{key}[{i}]")
+    return value
+
+# ===== RECORDS =====
+
+class Organization:
+    __slots__ = ('name', 'short_name', 'tagline', 'address', 'email', 'phone', 'whatsapp', 'facebook', 'website', 'launched')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, self.__slots__)
+        for key in self.__slots__:
+            setattr(self, key, _text(data, key, path))
+
+class Variant:
+    __slots__ = ('id', 'title', 'header', 'document_type', 'filename', 'sections')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, self.__slots__)
+        self.id = _text(data, 'id', path, markup=False)
+        self.filename = _text(data, 'filename', path, markup=False)
+        for key in ('title', 'header', 'document_type'):
+            setattr(self, key, _text(data, key, path))
+        self.sections = _text_list(data, 'sections', path)
+
+class Person:
+    __slots__ = ('name', 'role', 'bio', 'photo')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('name', 'role', 'bio'), ('photo',))
+        for key in ('name', 'role', 'bio'):
+            setattr(self, key, _text(data, key, path))
+        self.photo = _text(data, 'photo', path, markup=False) if 'photo' in data else None
+
+class Program:
+    __slots__ = ('title', 'subtitle', 'activities', 'impact', 'photo')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('title', 'subtitle', 'activities', 'impact'), ('photo',))
+        for key in ('title', 'subtitle', 'activities', 'impact'):
+            setattr(self, key, _text(data, key, path))
+        self.photo = _text(data, 'photo', path, markup=False) if 'photo' in data else None
+
+class Entry:
+    """Titled description, used for core values and ways to support"""
+    __slots__ = ('title', 'description')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, self.__slots__)
+        for key in self.__slots__:
+            setattr(self, key, _text(data, key, path))
+
+class Faq:
+    __slots__ = ('question', 'answer')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, self.__slots__)
+        for key in self.__slots__:
+            setattr(self, key, _text(data, key, path))
+
+class TextBlock:
+    """Subheading, paragraph or highlighted quote"""
+    __slots__ = ('type', 'text', 'style', 'color', 'space_before')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('type', 'text'), ('style', 'color', 'space_before'))
+        self.type = data['type']
+        self.text = _text(data, 'text', path)
+        self.style = _choice(data, 'style', path, TEXT_STYLES, 'body')
+        self.color = _choice(data, 'color', path, COLORS, 'secondary')
+        self.space_before = _number(data, 'space_before', path, 0)
+
+class TableBlock:
+    __slots__ = ('type', 'columns', 'rows', 'widths', 'color', 'header_font_size', 'font_size',
+                 'align_right', 'total_row', 'space_before')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('type', 'columns', 'rows', 'widths'),
+                       ('color', 'header_font_size', 'font_size', 'align_right', 'total_row', 'space_before'))
+        self.type = data['type']
+        self.columns = _text_list(data, 'columns', path)
+        ncols = len(self.columns)
+
+        rows = data['rows']
+        if not isinstance(rows, list) or not rows:
+            raise ContentError(f"{path}.rows: expected a non-empty list")
+        for i, row in enumerate(rows):
+            if not isinstance(row, list) or len(row) != ncols or not all(isinstance(cell, str) for cell in row):
+                raise ContentError(f"{path}.rows[{i}]: expected {ncols} text cells")
+            for j, cell in enumerate(row):
+                _markup(cell, f"{path}.rows[{i}][{j}]")
+        self.rows = rows
+
+        widths = data['widths']
+        if not isinstance(widths, list) or len(widths) != ncols or \
+                not all(isinstance(w, (int, float)) and not isinstance(w, bool) and w > 0 for w in widths):
+            raise ContentError(f"{path}.widths: expected {ncols} positive widths in inches")
+        self.widths = widths
+
+        align_right = data.get('align_right', [])
+        if not isinstance(align_right, list) or not all(isinstance(c, int) and 0 <= c < ncols for c in align_right):
+            raise ContentError(f"{path}.align_right: expected column indexes below {ncols}")
+        self.align_right = align_right
+
+        total_row = data.get('total_row', False)
+        if not isinstance(total_row, bool):
+            raise ContentError(f"{path}.total_row: expected true or false")
+        self.total_row = total_row
+
+        self.color = _choice(data, 'color', path, COLORS, 'primary')
+        self.header_font_size = _number(data, 'header_font_size', path, 10)
+        self.font_size = _number(data, 'font_size', path, 9)
+        self.space_before = _number(data, 'space_before', path, 0)
+
+class LedgerBlock:
+    """Long table streamed from a CSV file or an SQLite query at render time (see guide_ledger.py)"""
+    __slots__ = ('type', 'source', 'query', 'columns', 'widths', 'sum_columns', 'align_right', 'color',
+                 'header_font_size', 'font_size', 'number_format', 'space_before')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('type', 'source', 'columns'),
+                       ('query', 'widths', 'sum_columns', 'align_right', 'color', 'header_font_size', 'font_size',
+                        'number_format', 'space_before'))
+        self.type = data['type']
+        self.source = _text(data, 'source', path, markup=False)
+        self.columns = _text_list(data, 'columns', path)
+        ncols = len(self.columns)
+
+        extension = os.path.splitext(self.source)[1].lower()
+        if extension not in LEDGER_SOURCES:
+            raise ContentError(f"{path}.source: expected a {', '.join(LEDGER_SOURCES)} file")
+        if LEDGER_SOURCES[extension] == 'sqlite':
+            self.query = _text(data, 'query', path, markup=False)
+        elif 'query' in data:
+            raise ContentError(f"{path}.query: only SQLite sources take a query")
+        else:
+            self.query = None
+
+        widths = data.get('widths')
+        if widths is not None and (not isinstance(widths, list) or len(widths) != ncols or
+                                   not all(isinstance(w, (int, float)) and not isinstance(w, bool) and w > 0
+                                           for w in widths)):
+            raise ContentError(f"{path}.widths: expected {ncols} positive widths in inches")
+        self.widths = widths
+
+        for key in ('sum_columns', 'align_right'):
+            value = data.get(key, [])
+            if not isinstance(value, list) or not all(isinstance(c, int) and 0 <= c < ncols for c in value):
+                raise ContentError(f"{path}.{key}: expected column indexes below {ncols}")
+        self.sum_columns = data.get('sum_columns', [])
+        self.align_right = sorted(set(data.get('align_right', [])) | set(self.sum_columns))
+        if self.sum_columns and len(self.sum_columns) == ncols:
+            raise ContentError(f"{path}.sum_columns: at least one column must be left for the total labels")
+
+        self.number_format = _text(data, 'number_format', path, '{:,.2f}', markup=False)
+        try:
+            self.number_format.format(1234.5)
+        except (IndexError, KeyError, ValueError) as exc:
+            raise ContentError(f"{path}.number_format: cannot format a number: {exc}") from None
+
+        self.color = _choice(data, 'color', path, COLORS, 'primary')
+        self.header_font_size = _number(data, 'header_font_size', path, 9)
+        self.font_size = _number(data, 'font_size', path, 8)
+        self.space_before = _number(data, 'space_before', path, 0)
+
+# Ledger source file extensions and how they are read
+LEDGER_SOURCES = {'.csv': 'csv', '.sqlite': 'sqlite', '.sqlite3': 'sqlite', '.db': 'sqlite'}
+
+class ItemsBlock:
+    """Repeated records (people, programs, FAQ pairs, ...) or a plain bullet list"""
+    __slots__ = ('type', 'items', 'space_before')
+
+    def __init__(self, data, path):
+        _expect_object(data, path, ('type', 'items'), ('space_before',))
+        self.type = data['type']
+        self.space_before = _number(data, 'space_before', path, 0)
+        record = ITEM_RECORDS[self.type]
+        if record is None:
+            self.items = _text_list(data, 'items', path)
+            return
+        items = data['items']
+        if not isinstance(items, list) or not items:
+            raise ContentError(f"{path}.items: expected a non-empty list")
+        self.items = [record(item, f"{path}.items[{i}]") for i, item in enumerate(items)]
+
+# Item record for each list block type (None: plain strings)
+ITEM_RECORDS = {
+    'people': Person,
+    'programs': Program,
+    'values': Entry,
+    'entries': Entry,
+    'faq': Faq,
+    'bullets': None,
+}
+
+BLOCK_RECORDS = {
+    'subheading': TextBlock,
+    'paragraph': TextBlock,
+    'quote': TextBlock,
+    'table': TableBlock,
+    'ledger': LedgerBlock,
+}
+BLOCK_RECORDS.update((name, ItemsBlock) for name in ITEM_RECORDS)
+
+def _block(data, path):
+    kind = data.get('type') if isinstance(data, dict) else None
+    if kind not in BLOCK_RECORDS:
+        raise ContentError(f"{path}.type: unknown block type {kind!r}")
+    return BLOCK_RECORDS[kind](data, path)
+
+# Placeholders available to personalized (letter) text and to the cover's detail values
+LETTER_FIELDS = {'name': '', 'child': ''}
+COVER_FIELDS = {'generated': '', 'document_type': ''}
+
+def _placeholders(value, path, fields):
+    """Raise ContentError unless every {placeholder} in value is one of fields"""
+    try:
+        value.format(**fields)
+    except (KeyError, IndexError, ValueError) as exc:
+        raise ContentError(f"{path}: bad placeholder {exc} (available: {', '.join(fields)})") from None
+    return value
+
+class Section:
+    """One page-break delimited part of a document; fields beyond id/kind depend on the kind"""
+    __slots__ = ('id', 'kind', 'title', 'title_lines', 'details', 'blocks', 'text', 'footer',
+                 'greeting', 'sponsorship', 'giving_title', 'signature', 'digest')
+
+    def __init__(self, data, path):
+        kind = data.get('kind') if isinstance(data, dict) else None
+        if kind not in SECTION_FIELDS:
+            raise ContentError(f"{path}.kind: unknown section kind {kind!r}")
+        _expect_object(data, path, ('id', 'kind') + SECTION_FIELDS[kind])
+        self.id = _text(data, 'id', path, markup=False)
+        self.kind = kind
+        self.digest = _digest(data)
+        self.title = self.title_lines = self.details = self.text = self.footer = None
+        self.greeting = self.sponsorship = self.giving_title = self.signature = None
+        self.blocks = ()
+
+        if kind == 'cover':
+            self.title_lines = _text_list(data, 'title_lines', path)
+            details = data['details']
+            if not isinstance(details, list):
+                raise ContentError(f"{path}.details: expected a list")
+            for i, row in enumerate(details):
+                if row is None:
+                    continue
+                if not (isinstance(row, list) and len(row) == 2 and all(isinstance(v, str) for v in row)):
+                    raise ContentError(f"{path}.details[{i}]: expected [label, value] or null")
+                _markup(row[0], f"{path}.details[{i}][0]")
+                _markup(_placeholders(row[1], f"{path}.details[{i}][1]", COVER_FIELDS), f"{path}.details[{i}][1]")
+            self.details = details
+        else:
+            self.title = _text(data, 'title', path)
+
+        if kind == 'chapter':
+            blocks = data['blocks']
+            if not isinstance(blocks, list) or not blocks:
+                raise ContentError(f"{path}.blocks: expected a non-empty list")
+            self.blocks = [_block(block, f"{path}.blocks[{i}]") for i, block in enumerate(blocks)]
+        elif kind == 'closing':
+            self.text = _text(data, 'text', path)
+            self.footer = _text(data, 'footer', path)
+        elif kind == 'letter':
+            for key in ('greeting', 'text', 'sponsorship', 'giving_title', 'signature'):
+                setattr(self, key, _placeholders(_text(data, key, path), f"{path}.{key}", LETTER_FIELDS))
+
+# Required fields (besides id and kind) for each section kind
+SECTION_FIELDS = {
+    'cover': ('title_lines', 'details'),
+    'toc': ('title',),
+    'chapter': ('title', 'blocks'),
+    'closing': ('title', 'text', 'footer'),
+    'letter': ('title', 'greeting', 'text', 'sponsorship', 'giving_title', 'signature'),
+}
+
+class Content:
+    """Parsed and validated content file"""
+    __slots__ = ('path', 'organization', 'variants', 'sections', 'digest')
+
+    def __init__(self, data, path):
+        _expect_object(data, 'content', ('organization', 'variants', 'sections'))
+        self.path = path
+        self.digest = _digest(data)
+        self.organization = Organization(data['organization'], 'organization')
+
+        self.sections = {}
+        if not isinstance(data['sections'], list):
+            raise ContentError("sections: expected a list")
+        for i, item in enumerate(data['sections']):
+            section = Section(item, f"sections[{i}]")
+            if section.id in self.sections:
+                raise ContentError(f"sections[{i}].id: duplicate section id {section.id!r}")
+            self.sections[section.id] = section
+            self._resolve_files(section, f"sections[{i}]")
+
+        self.variants = {}
+        if not isinstance(data['variants'], list) or not data['variants']:
+            raise ContentError("variants: expected a non-empty list")
+        for i, item in enumerate(data['variants']):
+            variant = Variant(item, f"variants[{i}]")
+            if variant.id in self.variants:
+                raise ContentError(f"variants[{i}].id: duplicate variant id {variant.id!r}")
+            for j, section_id in enumerate(variant.sections):
+                if section_id not in self.sections:
+                    raise ContentError(f"variants[{i}].sections[{j}]: unknown section {section_id!r}")
+            self.variants[variant.id] = variant
+
+    def _resolve_files(self, section, path):
+        """Make photo and ledger paths (relative to the content file) absolute and check they exist"""
+        for i, block in enumerate(section.blocks):
+            if block.type == 'ledger':
+                source = os.path.normpath(os.path.join(os.path.dirname(self.path), block.source))
+                if not os.path.isfile(source):
+                    raise ContentError(f"{path}.blocks[{i}].source: no such file {block.source!r}")
+                block.source = source
+            for j, item in enumerate(getattr(block, 'items', ())):
+                if getattr(item, 'photo', None):
+                    photo = os.path.normpath(os.path.join(os.path.dirname(self.path), item.photo))
+                    if not os.path.isfile(photo):
+                        raise ContentError(f"{path}.blocks[{i}].items[{j}].photo: no such image {item.photo!r}")
+                    item.photo = photo
+
+    def photos(self, section):
+        """Absolute paths of the photos drawn in a section"""
+        return [item.photo for block in section.blocks for item in getattr(block, 'items', ())
+                if getattr(item, 'photo', None)]
+
+    def data_files(self, section):
+        """Absolute paths of the ledger sources read by a section"""
+        return [block.source for block in section.blocks if block.type == 'ledger']
+
+    def variant(self, variant_id):
+        """Variant by id"""
+        try:
+            return self.variants[variant_id]
+        except KeyError:
+            raise ContentError(f"unknown variant {variant_id!r} (available: {', '.join(self.variants)})") from None
+
+    def sections_for(self, variant):
+        """Sections of a variant in document order"""
+        return [self.sections[section_id] for section_id in variant.sections]
+
+def chapter_titles(sections):
+    """Numbered chapter titles ("3. Our Programs") by section id, in document order"""
+    chapters = {}
+    for section in sections:
+        if section.kind == 'chapter':
+            chapters[section.id] = f"{len(chapters) + 1}. {section.title}"
+    return chapters
+
+# ===== RECIPIENTS (personalized guides) =====
+
+class Gift:
+    __slots__ = ('date', 'amount', 'note')
+
+    def __init__(self, date, amount, note=''):
+        self.date = date
+        self.amount = amount
+        self.note = note
+
+class Recipient:
+    """Donor or sponsor a personalized guide is generated for"""
+    __slots__ = ('name', 'email', 'sponsored_child', 'giving')
+
+    def __init__(self, name, email='', sponsored_child='', giving=(), path='recipient'):
+        if not isinstance(name, str) or not name.strip():
+            raise ContentError(f"{path}.name: expected non-empty text")
+        self.name = name.strip()
+        self.email = (email or '').strip()
+        self.sponsored_child = (sponsored_child or '').strip()
+        self.giving = parse_giving(giving, f"{path}.giving") if isinstance(giving, str) else list(giving)
+
+    @property
+    def slug(self):
+        """File-name friendly form of the recipient's name"""
+        return re.sub(r'[^A-Za-z0-9]+', '-', self.name).strip('-') or 'recipient'
+
+def parse_giving(text, path='giving'):
+    """Parse 'YYYY-MM-DD:amount[:note]' entries separated by ';' into Gift records"""
+    gifts = []
+    for i, item in enumerate(part.strip() for part in text.split(';')):
+        if not item:
+            continue
+        fields = item.split(':', 2)
+        try:
+            date.fromisoformat(fields[0].strip())
+            amount = float(fields[1].replace(',', ''))
+        except (IndexError, ValueError):
+            raise ContentError(f"{path}[{i}]: expected 'YYYY-MM-DD:amount[:note]', got {item!r}") from None
+        gifts.append(Gift(fields[0].strip(), amount, fields[2].strip() if len(fields) > 2 else ''))
+    return gifts
+
+def load_recipients(path):
+    """Read and validate every row of a recipients CSV (name, email, sponsored_child, giving)"""
+    try:
+        f = open(path, newline='', encoding='utf-8-sig')
+    except OSError as exc:
+        raise ContentError(f"cannot read recipients file: {exc}") from None
+    with f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or 'name' not in reader.fieldnames:
+            raise ContentError(f"{os.path.basename(path)}: missing 'name' column")
+        return [Recipient(row.get('name'), row.get('email'), row.get('sponsored_child'), row.get('giving') or '',
+                          path=f"{os.path.basename(path)}:{line}")
+                for line, row in enumerate(reader, 2)]
+
+# ===== LEDGERS =====
+# Ledger rows are read at render time, never held in the content model: a
+# ledger may have tens of thousands of them.
+
+FETCH_ROWS = 1000  # rows fetched from SQLite per round trip
+NUMBER = re.compile(r'[^\d.\-]')
+
+def _source_rows(block):
+    ncols = len(block.columns)
+    if LEDGER_SOURCES[os.path.splitext(block.source)[1].lower()] == 'csv':
+        with open(block.source, newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header line
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != ncols:
+                    raise ContentError(f"{os.path.basename(block.source)}:{reader.line_num}: "
+                                       f"expected {ncols} columns, got {len(row)}")
+                yield row
+        return
+    connection = sqlite3.connect(f"file:{block.source}?mode=ro", uri=True)
+    try:
+        cursor = connection.execute(block.query)
+        if len(cursor.description) != ncols:
+            raise ContentError(f"{os.path.basename(block.source)}: the query returns {len(cursor.description)} "
+                               f"columns, the ledger has {ncols}")
+        for rows in iter(lambda: cursor.fetchmany(FETCH_ROWS), []):
+            for row in rows:
+                yield ['' if value is None else str(value) for value in row]
+    except sqlite3.Error as exc:
+        raise ContentError(f"{os.path.basename(block.source)}: {exc}") from None
+    finally:
+        connection.close()
+
+def read_ledger(block):
+    """Stream (cells, summed values) for each row of a ledger, summed cells formatted with its number_format"""
+    for number, row in enumerate(_source_rows(block), 1):
+        values = []
+        for column in block.sum_columns:
+            text = NUMBER.sub('', row[column])
+            try:
+                value = float(text) if text else 0.0
+            except ValueError:
+                raise ContentError(f"{os.path.basename(block.source)}: row {number}: {row[column]!r} in column "
+                                   f"{block.columns[column]!r} is not a number") from None
+            row[column] = block.number_format.format(value)
+            values.append(value)
+        yield row, values
+
+def ledger_total_row(block, label, totals):
+    """Row with label in the first column that is not summed and the formatted totals in the others"""
+    row = [''] * len(block.columns)
+    row[next(i for i in range(len(row)) if i not in block.sum_columns)] = label
+    for column, value in zip(block.sum_columns, totals):
+        row[column] = block.number_format.format(value)
+    return row
+
+_loaded = {}
+
+def load_content(path=DEFAULT_CONTENT_PATH):
+    """Parse and validate the content file once; later calls reuse it until the file changes"""
+    path = os.path.abspath(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError as exc:
+        raise ContentError(f"cannot read content file: {exc}") from None
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except ValueError as exc:
+        raise ContentError(f"{os.path.basename(path)}: invalid JSON: {exc}") from None
+    content = Content(data, path)
+    _loaded[path] = (mtime, content)
+    return content
+
+if __name__ == "__main__":
+    import sys
+    try:
+        content = load_content(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CONTENT_PATH)
+    except ContentError as exc:
+        sys.exit(f"❌ {exc}")
+    print(f"✅ Content is valid: {len(content.sections)} sections, {len(content.variants)} variants")
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Fonts
+Brand fonts for the guide PDF: Poppins for headings and Inter for body text, as
+on the website, plus fallback fonts for the emoji and symbols neither covers.
+Drop the static TTF files into filez/fonts/ (system font folders are searched
+too); a family that is not found falls back to Helvetica. TrueType fonts are
+embedded as per-document subsets, so only the glyphs a PDF uses are shipped.
+Fonts are parsed and registered once per process and shared by every build;
+which font draws each character is remembered on disk across builds. No emoji
+font ships with the repo: without one (NotoEmoji-Regular.ttf in filez/fonts/),
+characters no font can draw are left out and reported instead of printed as boxes.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFError
+
+from guide_images import file_digest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_DIRS = [
+    os.path.join(REPO_ROOT, 'filez', 'fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+    os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/Library/Fonts'),
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '/Library/Fonts',
+    os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+]
+
+# Static TTFs of each family by face; a family needs its regular and bold faces
+FAMILIES = {
+    'Poppins': {'normal': 'Poppins-Regular.ttf', 'bold': 'Poppins-Bold.ttf',
+                'italic': 'Poppins-Italic.ttf', 'boldItalic': 'Poppins-BoldItalic.ttf'},
+    'Inter': {'normal': 'Inter-Regular.ttf', 'bold': 'Inter-Bold.ttf',
+              'italic': 'Inter-Italic.ttf', 'boldItalic': 'Inter-BoldItalic.ttf'},
+}
+
+# Built-in faces used when a family is missing
+HELVETICA = {'normal': 'Helvetica', 'bold': 'Helvetica-Bold',
+             'italic': 'Helvetica-Oblique', 'boldItalic': 'Helvetica-BoldOblique'}
+
+# Fonts tried, in order, for characters the brand fonts lack. Outline fonts only:
+# ReportLab cannot draw the bitmap glyphs of colour emoji fonts.
+FALLBACK_FONTS = ('NotoEmoji-Regular.ttf', 'NotoSansSymbols2-Regular.ttf', 'Symbola.ttf',
+                  'seguisym.ttf', 'DejaVuSans.ttf')
+
+# Invisible emoji modifiers (variation selectors, zero-width joiner) no fallback draws
+INVISIBLE = re.compile('[\u200d\ufe0e\ufe0f]')
+
+class FontSet:
+    """Registered font names for the guide styles, and the fallback markup for other characters"""
+    def __init__(self, heading, body, fallbacks, files):
+        self.heading = heading
+        self.body = body
+        self.fallbacks = fallbacks
+        self.files = files
+        self.missing = [family for family, faces in (('Poppins', heading), ('Inter', body)) if faces is HELVETICA]
+        self.dropped = set()  # characters left out because no font can draw them
+        self._faces = sorted({heading['normal'], heading['bold'], body['normal'], body['bold']})
+        self._coverage = {}  # character -> font drawing it ('' the styles' own, None none)
+        self._coverage_path = None
+        self._saved = 0
+        families = ', '.join(faces['normal'] for faces in (heading, body) if faces is not HELVETICA)
+        self.summary = ' + '.join(filter(None, [families] + fallbacks)) or 'Helvetica'
+        if self.missing:
+            self.summary += f" (add the {'/'.join(self.missing)} TTFs to filez/fonts/ for the brand fonts)"
+        # Batch runs mark up the same texts over and over; keep the recent results
+        self._marked_up = functools.lru_cache(maxsize=4096)(self._markup)
+
+    @property
+    def digest(self):
+        """Identity of the font files in use, for cache keys"""
+        h = hashlib.sha256()
+        for path in self.files:
+            h.update(f"{os.path.basename(path)}={file_digest(path)}\n".encode('utf-8'))
+        return h.hexdigest()
+
+    def use_cache(self, directory):
+        """Keep the glyph coverage of this font set in directory, shared by every build"""
+        path = os.path.join(directory, f"coverage-{self.digest[:16]}.json")
+        if path == self._coverage_path:
+            return
+        self._coverage_path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                self._coverage.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        self._saved = len(self._coverage)
+
+    def save_cache(self):
+        """Write the coverage learned since use_cache() or the last save (atomically: workers share the file)"""
+        if self._coverage_path is None or len(self._coverage) == self._saved:
+            return
+        os.makedirs(os.path.dirname(self._coverage_path), exist_ok=True)
+        tmp = f"{self._coverage_path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._coverage, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self._coverage_path)
+        self._saved = len(self._coverage)
+
+    def font_for(self, char):
+        """Font drawing char: '' when every face of the styles can, else the first fallback that can (None: none)"""
+        if char not in self._coverage:
+            if all(can_draw(name, char) for name in self._faces):
+                self._coverage[char] = ''
+            else:
+                self._coverage[char] = next((name for name in self.fallbacks if can_draw(name, char)), None)
+        return self._coverage[char]
+
+    def covers(self, char):
+        """Whether every face of the styles can draw char"""
+        return self.font_for(char) == ''
+
+    def markup(self, text):
+        """Paragraph markup drawing the characters the styles' fonts lack in a fallback font
+        
+        Characters no font can draw are left out (and collected in dropped) rather
+        than printed as boxes.
+        """
+        text, dropped = self._marked_up(text)
+        self.dropped.update(dropped)
+        return text
+
+    def _markup(self, text):
+        """(markup, characters left out) of text"""
+        if text.isascii():
+            return text, ''
+        text = INVISIBLE.sub('', text)
+        out, run, run_font, dropped = [], [], None, ''
+        for char in text:
+            font = self.font_for(char)
+            if font is None:
+                dropped += char
+                continue
+            font = font or None
+            if font != run_font and run:
+                out.append(f'<font face="{run_font}">{"".join(run)}</font>' if run_font else ''.join(run))
+                run = []
+            run_font = font
+            run.append(char)
+        if run:
+            out.append(f'<font face="{run_font}">{"".join(run)}</font>' if run_font else ''.join(run))
+        return ''.join(out), dropped
+
+def can_draw(name, char):
+    """Whether the registered font name has a glyph for char"""
+    font = pdfmetrics.getFont(name)
+    if isinstance(font, TTFont):
+        return ord(char) in font.face.charToGlyph
+    # Built-in fonts borrow symbols from Symbol and ZapfDingbats
+    for candidate in [font] + getattr(font, 'substitutionFonts', []):
+        try:
+            char.encode(candidate.encName)
+            return True
+        except UnicodeEncodeError:
+            continue
+    return False
+
+def _find_files(names):
+    """First path of each file name in FONT_DIRS (searched recursively)"""
+    found = {}
+    wanted = set(names)
+    for root_dir in FONT_DIRS:
+        if not os.path.isdir(root_dir):
+            continue
+        for root, _, files in os.walk(root_dir):
+            for name in wanted.intersection(files):
+                found.setdefault(name, os.path.join(root, name))
+            if len(found) == len(wanted):
+                return found
+    return found
+
+def _register(name, path):
+    """Register one TTF under name; False when the file cannot be used"""
+    if name not in pdfmetrics.getRegisteredFontNames():
+        try:
+            pdfmetrics.registerFont(TTFont(name, path))
+        except (TTFError, OSError) as exc:
+            print(f"⚠️  Skipping font {path}: {exc}", file=sys.stderr)
+            return False
+    return True
+
+def _register_family(family, files, used):
+    """Register a family's faces (missing italics use the upright ones); HELVETICA if unusable"""
+    paths = {face: files.get(name) for face, name in FAMILIES[family].items()}
+    if not (paths['normal'] and paths['bold']):
+        return HELVETICA
+    faces = {'normal': family, 'bold': f"{family}-Bold"}
+    if not (_register(faces['normal'], paths['normal']) and _register(faces['bold'], paths['bold'])):
+        return HELVETICA
+    used += [paths['normal'], paths['bold']]
+    for face, upright in (('italic', 'normal'), ('boldItalic', 'bold')):
+        name = f"{family}-{face[0].upper()}{face[1:]}"
+        if paths[face] and _register(name, paths[face]):
+            faces[face] = name
+            used.append(paths[face])
+        else:
+            faces[face] = faces[upright]
+    # <b> and <i> inside paragraphs switch between these faces
+    pdfmetrics.registerFontFamily(family, **faces)
+    return faces
+
+@functools.lru_cache(maxsize=None)
+def load_fonts():
+    """Find, parse and register the guide fonts once per process"""
+    files = _find_files([name for faces in FAMILIES.values() for name in faces.values()] + list(FALLBACK_FONTS))
+    used = []
+    heading = _register_family('Poppins', files, used)
+    body = _register_family('Inter', files, used)
+    fallbacks = []
+    for filename in FALLBACK_FONTS:
+        name = os.path.splitext(filename)[0]
+        if filename in files and _register(name, files[filename]):
+            # A fallback has no bold or italic face; markup inside <b>/<i> still needs the mapping
+            pdfmetrics.registerFontFamily(name, normal=name, bold=name, italic=name, boldItalic=name)
+            fallbacks.append(name)
+            used.append(files[filename])
+    return FontSet(heading, body, fallbacks, used)
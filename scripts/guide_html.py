@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Web & EPUB Guide
+Renders the same content model as the PDF guide (guide_content.json) into a
+single lightweight HTML page for phones on slow connections and an EPUB 3 book
+for e-readers. No web fonts, no JavaScript and one small inline stylesheet;
+photos are cropped to their displayed size and lazy-loaded, and the PDF is only
+linked, never embedded. ReportLab is not needed, so a preview builds in a
+fraction of the time the PDF takes.
+
+Usage: python scripts/guide_html.py [--variant donor-brief] [--format html epub] [-o DIR]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from xml.sax.saxutils import escape, quoteattr
+
+from guide_content import (DEFAULT_CONTENT_PATH, ContentError, Recipient, chapter_titles, ledger_total_row,
+                           load_content, read_ledger)
+from guide_images import ImageCache, file_digest
+
+DEFAULT_CACHE_DIR = ".guide-cache"
+IMAGES_DIR = "images"
+FORMATS = ('html', 'epub')
+
+# Displayed photo sizes in pixels, at 2x for high-density phone screens
+PORTRAIT_PIXELS = (192, 192)
+PROGRAM_PHOTO_PIXELS = (720, 226)
+
+# Same palette as the PDF's default theme
+STYLESHEET = """\
+:root{--primary:#1D4ED8;--secondary:#10B981;--accent:#FBBF24;--text:#374151;--muted:#6B7280;--light:#F3F4F6;--grid:#D1D5DB}
+body{margin:0 auto;max-width:46rem;padding:0 1rem 2rem;font:1rem/1.55 system-ui,-apple-system,"Segoe UI",Roboto,sans-serif;color:var(--text)}
+h1,h2,h3{line-height:1.25;font-weight:700}
+h1{color:var(--primary);text-align:center;font-size:1.9rem;margin:2rem 0 .5rem}
+h2{color:#fff;background:var(--primary);padding:.6rem .8rem;font-size:1.2rem;margin:2.5rem 0 1rem}
+h3{color:var(--secondary);font-size:1.05rem;margin:1.2rem 0 .3rem}
+p{margin:.4rem 0 .8rem}
+a{color:var(--primary)}
+img{max-width:100%;height:auto;background:var(--light)}
+.subtitle{color:var(--secondary);text-align:center;font-weight:700;font-size:1.15rem}
+.tagline{text-align:center;font-style:italic}
+.light,.details,.footer{color:var(--muted);font-size:.9rem}
+.footer{text-align:center;font-style:italic}
+.download{text-align:center}
+.download a{display:inline-block;padding:.5rem 1rem;border:2px solid var(--primary);border-radius:.4rem;text-decoration:none;font-weight:700}
+blockquote{margin:.6rem 0 1rem;padding-left:1rem;border-left:4px solid currentColor;font-style:italic}
+blockquote.primary{color:var(--primary)}blockquote.secondary{color:var(--secondary)}blockquote.accent{color:#B45309}
+.contents ol,.plain{list-style:none;padding:0}
+.contents li{padding:.35rem 0;border-bottom:1px solid var(--light)}
+.person{overflow:hidden;margin-bottom:1rem}
+.person img{float:right;width:96px;height:96px;border-radius:50%;margin:0 0 .5rem 1rem}
+.program img{display:block;width:100%;border-radius:.3rem}
+.table{overflow-x:auto}
+table{border-collapse:collapse;width:100%;font-size:.9rem;margin:.5rem 0 1rem}
+th,td{border:1px solid var(--grid);padding:.45rem .5rem;text-align:left;overflow-wrap:anywhere}
+th{color:#fff;background:var(--primary)}
+th.secondary{background:var(--secondary)}th.accent{background:var(--accent);color:var(--text)}
+tbody tr:nth-child(even){background:var(--light)}
+tfoot td{background:var(--accent);font-weight:700}
+.right{text-align:right}
+"""
+
+# ReportLab accepts a bare "&" in paragraph text; (X)HTML needs it written as &amp;
+BARE_AMPERSAND = re.compile(r'&(?!#?\w+;)')
+
+# ===== IMAGES =====
+
+class _Images:
+    """Photos referenced by a rendered document, resized once and written next to it"""
+    def __init__(self, cache):
+        self.cache = cache
+        self.files = {}
+
+    def src(self, path, size):
+        name = f"{IMAGES_DIR}/{file_digest(path)[:16]}-{size[0]}x{size[1]}.jpg"
+        if name not in self.files:
+            self.files[name] = self.cache.resized(path, size)
+        return name
+
+def _img(ctx, path, size, alt, css_size=None):
+    """<img> with its intrinsic size (no layout shift) that only loads when scrolled near"""
+    width, height = css_size or size
+    return (f'<img src={quoteattr(ctx.images.src(path, size))} width="{width}" height="{height}" '
+            f'alt={quoteattr(alt)} loading="lazy" decoding="async"/>')
+
+# ===== BLOCK RENDERERS =====
+# Content text is ReportLab paragraph markup (<b>, <i>, <br/>), which is also
+# valid XHTML, so it is written through unchanged (bare ampersands aside).
+
+def _render_subheading(block, ctx):
+    return [f"<h3>{block.text}</h3>"]
+
+def _render_paragraph(block, ctx):
+    return [f'<p class="light">{block.text}</p>' if block.style == 'light' else f"<p>{block.text}</p>"]
+
+def _render_quote(block, ctx):
+    return [f'<blockquote class="{block.color}">{block.text}</blockquote>']
+
+def _render_table(block, ctx):
+    def cells(row, tag):
+        return ''.join(f'<{tag} class="right">{cell}</{tag}>' if i in block.align_right else f"<{tag}>{cell}</{tag}>"
+                       for i, cell in enumerate(row))
+    rows, total = (block.rows[:-1], block.rows[-1]) if block.total_row else (block.rows, None)
+    head = ''.join(f'<th class="{block.color}">{column}</th>' for column in block.columns)
+    html = ['<div class="table"><table>', f"<thead><tr>{head}</tr></thead>", "<tbody>"]
+    html += [f"<tr>{cells(row, 'td')}</tr>" for row in rows]
+    html.append("</tbody>")
+    if total:
+        html.append(f"<tfoot><tr>{cells(total, 'td')}</tr></tfoot>")
+    html.append("</table></div>")
+    return html
+
+def _render_ledger(block, ctx):
+    """The whole ledger as one table (the PDF's page totals have no pages to belong to here)"""
+    def cells(row):
+        return ''.join(f'<td class="right">{escape(cell)}</td>' if i in block.align_right else f"<td>{escape(cell)}</td>"
+                       for i, cell in enumerate(row))
+    head = ''.join(f'<th class="{block.color}">{column}</th>' for column in block.columns)
+    html = ['<div class="table"><table>', f"<thead><tr>{head}</tr></thead>", "<tbody>"]
+    totals = [0.0] * len(block.sum_columns)
+    for row, values in read_ledger(block):
+        html.append(f"<tr>{cells(row)}</tr>")
+        totals = [t + v for t, v in zip(totals, values)]
+    html.append("</tbody>")
+    if block.sum_columns:
+        html.append(f"<tfoot><tr>{cells(ledger_total_row(block, 'Total', totals))}</tr></tfoot>")
+    html.append("</table></div>")
+    return html
+
+def _render_people(block, ctx):
+    html = []
+    for person in block.items:
+        html.append('<div class="person">')
+        if person.photo:
+            html.append(_img(ctx, person.photo, PORTRAIT_PIXELS, person.name, (96, 96)))
+        html += [f"<h3>{person.name}</h3>", f'<p class="light"><i>{person.role}</i></p>', f"<p>{person.bio}</p>", "</div>"]
+    return html
+
+def _render_programs(block, ctx):
+    html = []
+    for program in block.items:
+        html.append('<div class="program">')
+        if program.photo:
+            html.append(_img(ctx, program.photo, PROGRAM_PHOTO_PIXELS, program.title))
+        html += [f"<h3>{program.title}</h3>", f'<p class="light"><i>{program.subtitle}</i></p>',
+                 f"<p><b>Activities:</b> {program.activities}</p>", f"<p><b>Impact:</b> {program.impact}</p>", "</div>"]
+    return html
+
+def _render_values(block, ctx):
+    return [f"<p><b>{value.title}:</b> {value.description}</p>" for value in block.items]
+
+def _render_entries(block, ctx):
+    return [part for entry in block.items for part in (f"<h3>{entry.title}</h3>", f"<p>{entry.description}</p>")]
+
+def _render_faq(block, ctx):
+    return [part for i, faq in enumerate(block.items, 1)
+            for part in (f"<h3>Q{i}: {faq.question}</h3>", f"<p><b>A:</b> {faq.answer}</p>")]
+
+def _render_bullets(block, ctx):
+    # Items carry their own markers (✅, ✓, •)
+    return ['<ul class="plain">'] + [f"<li>{item}</li>" for item in block.items] + ["</ul>"]
+
+BLOCK_RENDERERS = {
+    'subheading': _render_subheading,
+    'paragraph': _render_paragraph,
+    'quote': _render_quote,
+    'table': _render_table,
+    'ledger': _render_ledger,
+    'people': _render_people,
+    'programs': _render_programs,
+    'values': _render_values,
+    'entries': _render_entries,
+    'faq': _render_faq,
+    'bullets': _render_bullets,
+}
+
+# ===== SECTION RENDERERS =====
+
+def _render_cover(section, ctx):
+    fields = {'generated': ctx.generated, 'document_type': ctx.variant.document_type}
+    lines = [f"<b>{label}:</b> {value.format(**fields)}" if label else "" for label, value in
+             ((row or (None, None)) for row in section.details)]
+    html = [f"<h1>{'<br/>'.join(section.title_lines)}</h1>",
+            f'<p class="subtitle">{ctx.variant.title}</p>',
+            f'<p class="tagline">{ctx.organization.tagline}</p>']
+    if ctx.pdf:
+        html.append(f'<p class="download"><a href={quoteattr(ctx.pdf)} type="application/pdf">'
+                    f'Download the printable PDF</a></p>')
+    html.append(f'<p class="details">{"<br/>".join(lines)}</p>')
+    return html
+
+def _render_toc(section, ctx):
+    items = [f'<li><a href="{ctx.href(section_id)}">{title}</a></li>' for section_id, title in ctx.chapters.items()]
+    return [f'<nav class="contents"><h2>{section.title}</h2><ol>'] + items + ["</ol></nav>"]
+
+def _render_chapter(section, ctx):
+    html = [f'<h2 id="{section.id}">{ctx.chapters[section.id]}</h2>']
+    for block in section.blocks:
+        html.extend(BLOCK_RENDERERS[block.type](block, ctx))
+    return html
+
+def _render_closing(section, ctx):
+    return [f'<h2 id="{section.id}">{section.title}</h2>', f"<p>{section.text}</p>", f'<p class="footer">{section.footer}</p>']
+
+def _render_letter(section, ctx):
+    """Letter section without a recipient, addressed like the PDF's default"""
+    recipient = Recipient("Friend")
+    fields = {'name': escape(recipient.name), 'child': escape(recipient.sponsored_child)}
+    return [f'<h2 id="{section.id}">{section.title}</h2>', f"<p>{section.greeting.format(**fields)}</p>",
+            f"<p>{section.text.format(**fields)}</p>", f"<p>{section.signature.format(**fields)}</p>"]
+
+SECTION_RENDERERS = {
+    'cover': _render_cover,
+    'toc': _render_toc,
+    'chapter': _render_chapter,
+    'closing': _render_closing,
+    'letter': _render_letter,
+}
+
+def _build_context(content, variant, images, href, pdf=None):
+    sections = content.sections_for(variant)
+    return SimpleNamespace(content=content, organization=content.organization, variant=variant, sections=sections,
+                           chapters=chapter_titles(sections), generated=datetime.now().strftime('%B %d, %Y'),
+                           images=images, href=href, pdf=pdf)
+
+def _document(title, body, stylesheet, epub=False):
+    """Complete (X)HTML document; the EPUB flavour is well-formed XML with the epub namespace"""
+    if epub:
+        head = ['<?xml version="1.0" encoding="utf-8"?>', '<!DOCTYPE html>',
+                '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" '
+                'lang="en" xml:lang="en">', '<head>', '<meta charset="utf-8"/>']
+    else:
+        head = ['<!DOCTYPE html>', '<html lang="en">', '<head>', '<meta charset="utf-8"/>',
+                '<meta name="viewport" content="width=device-width, initial-scale=1"/>']
+    head += [f"<title>{escape(title)}</title>", stylesheet, '</head>', '<body>']
+    return '\n'.join(head + [BARE_AMPERSAND.sub('&amp;', part) for part in body] + ['</body>', '</html>', ''])
+
+# ===== HTML =====
+
+def render_html(content, variant, images, pdf=None):
+    """The whole variant as one HTML page (photos come back in images.files)"""
+    ctx = _build_context(content, variant, images, lambda section_id: f"#{section_id}", pdf)
+    body = []
+    for section in ctx.sections:
+        body.extend(SECTION_RENDERERS[section.kind](section, ctx))
+    title = f"{ctx.organization.name} — {variant.title}"
+    return _document(title, body, f"<style>\n{STYLESHEET}</style>")
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def write_html(content, variant, output_dir, cache):
+    """Write <variant filename>.html and the photos it shows; returns the page path"""
+    images = _Images(cache)
+    page = render_html(content, variant, images, pdf=variant.filename)
+    path = os.path.join(output_dir, os.path.splitext(variant.filename)[0] + '.html')
+    _write(path, page.encode('utf-8'))
+    for name, data in images.files.items():
+        target = os.path.join(output_dir, name)
+        if not os.path.exists(target):  # names are content hashes
+            _write(target, data)
+    return path
+
+# ===== EPUB =====
+
+CONTAINER_XML = """<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>
+</container>
+"""
+
+def render_epub(content, variant, images):
+    """EPUB 3 files of the variant as {path inside the archive: bytes}"""
+    ctx = _build_context(content, variant, images, lambda section_id: f"{section_id}.xhtml#{section_id}")
+    stylesheet = '<link rel="stylesheet" type="text/css" href="style.css"/>'
+    files, spine = {}, []
+    for section in ctx.sections:
+        name = 'nav.xhtml' if section.kind == 'toc' else f"{section.id}.xhtml"
+        body = SECTION_RENDERERS[section.kind](section, ctx)
+        if section.kind == 'toc':
+            body[0] = body[0].replace('<nav class="contents">', '<nav class="contents" epub:type="toc">')
+        files[name] = _document(section.title or variant.title, body, stylesheet, epub=True)
+        spine.append(name)
+    if 'nav.xhtml' not in files:
+        # EPUB 3 requires a navigation document even when the variant has no contents page
+        body = _render_toc(SimpleNamespace(title="Contents"), ctx)
+        body[0] = body[0].replace('<nav class="contents">', '<nav class="contents" epub:type="toc">')
+        files['nav.xhtml'] = _document("Contents", body, stylesheet, epub=True)
+    files['style.css'] = STYLESHEET
+    files.update(images.files)
+
+    book_id = uuid.uuid5(uuid.NAMESPACE_URL, f"angaza-tumaini:{content.digest}:{variant.id}")
+    modified = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    media = {'.xhtml': 'application/xhtml+xml', '.css': 'text/css', '.jpg': 'image/jpeg'}
+    items = []
+    for i, name in enumerate(files):
+        props = ' properties="nav"' if name == 'nav.xhtml' else ''
+        items.append(f'<item id="item{i}" href="{name}" media-type="{media[os.path.splitext(name)[1]]}"{props}/>')
+    ids = {name: f"item{i}" for i, name in enumerate(files)}
+    opf = f"""<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id" xml:lang="en">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:identifier id="book-id">urn:uuid:{book_id}</dc:identifier>
+<dc:title>{escape(f"{ctx.organization.name} — {variant.title}")}</dc:title>
+<dc:creator>{escape(ctx.organization.name)}</dc:creator>
+<dc:language>en</dc:language>
+<meta property="dcterms:modified">{modified}</meta>
+</metadata>
+<manifest>
+{chr(10).join(items)}
+</manifest>
+<spine>
+{chr(10).join(f'<itemref idref="{ids[name]}"/>' for name in spine)}
+</spine>
+</package>
+"""
+    archive = {'META-INF/container.xml': CONTAINER_XML, 'OEBPS/content.opf': opf}
+    archive.update((f"OEBPS/{name}", data) for name, data in files.items())
+    return {name: data.encode('utf-8') if isinstance(data, str) else data for name, data in archive.items()}
+
+def write_epub(content, variant, output_dir, cache):
+    """Write <variant filename>.epub; returns its path"""
+    files = render_epub(content, variant, _Images(cache))
+    path = os.path.join(output_dir, os.path.splitext(variant.filename)[0] + '.epub')
+    os.makedirs(output_dir, exist_ok=True)
+    with zipfile.ZipFile(path, 'w') as book:
+        # The mimetype entry must come first and be stored uncompressed
+        book.writestr('mimetype', 'application/epub+zip', compress_type=zipfile.ZIP_STORED)
+        for name, data in files.items():
+            book.writestr(name, data, compress_type=zipfile.ZIP_STORED if name.endswith('.jpg') else zipfile.ZIP_DEFLATED)
+    return path
+
+# ===== CLI =====
+
+WRITERS = {'html': write_html, 'epub': write_epub}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the web (HTML) and e-book (EPUB) editions of the guide")
+    parser.add_argument('--variant', action='append', help="document variant to build (repeatable, default: full)")
+    parser.add_argument('--all-variants', action='store_true', help="build every variant defined in the content file")
+    parser.add_argument('--format', nargs='+', choices=FORMATS, default=list(FORMATS), help="outputs to build (default: both)")
+    parser.add_argument('-o', '--output-dir', default='.', help="directory to write to (default: current directory)")
+    parser.add_argument('--content', default=DEFAULT_CONTENT_PATH, help="content file to build from")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="directory holding resized photos")
+    parser.add_argument('--no-cache', action='store_true', help="resize photos in memory only")
+    args = parser.parse_args(argv)
+
+    try:
+        content = load_content(args.content)
+        variants = [content.variant(v) for v in (list(content.variants) if args.all_variants else (args.variant or ['full']))]
+    except ContentError as exc:
+        parser.exit(1, f"❌ Invalid guide content: {exc}\n")
+
+    cache = ImageCache(None if args.no_cache else os.path.join(args.cache_dir, IMAGES_DIR))
+    for variant in variants:
+        for fmt in args.format:
+            start = time.perf_counter()
+            path = WRITERS[fmt](content, variant, args.output_dir, cache)
+            print(f"✅ {variant.title} ({fmt.upper()}): {path} — {os.path.getsize(path) / 1024:,.0f} KB "
+                  f"in {(time.perf_counter() - start) * 1000:,.0f} ms")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Images
+Prepares photos for embedding in the guide PDF. ReportLab embeds a JPEG as-is,
+so a 4 MB phone photo drawn as a 1 inch portrait would cost 4 MB per use. Each
+image is cropped to the drawn aspect ratio, resampled to IMAGE_DPI at the drawn
+size and recompressed; results are cached on disk keyed by source hash + size.
+"""
+
+import hashlib
+import io
+import os
+
+from PIL import Image as PILImage, ImageOps
+
+# Resolution and JPEG quality of embedded photos (good for screen and office printing)
+IMAGE_DPI = 150
+JPEG_QUALITY = 80
+
+_digests = {}
+
+def file_digest(path):
+    """SHA-256 of a file, remembered per process until its size or mtime changes"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _digests:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+        _digests[key] = h.hexdigest()
+    return _digests[key]
+
+def _pixels(points):
+    return max(1, round(points / 72 * IMAGE_DPI))
+
+def _encode(path, size):
+    """Crop and resample a photo to exactly size pixels; returns JPEG bytes without metadata"""
+    with PILImage.open(path) as img:
+        img.draft('RGB', size)
+        img = ImageOps.exif_transpose(img)
+        if img.mode != 'RGB':
+            background = PILImage.new('RGB', img.size, 'white')
+            img = img.convert('RGBA')
+            background.paste(img, mask=img.getchannel('A'))
+            img = background
+        img = ImageOps.fit(img, size, PILImage.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+    return buf.getvalue()
+
+class ImageCache:
+    """Prepared photos, kept in directory when given (else only in memory for this process)"""
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._memory = {}
+
+    def prepare(self, path, width, height):
+        """JPEG bytes of path cropped and resampled for drawing at width x height points"""
+        return self.resized(path, (_pixels(width), _pixels(height)))
+
+    def key(self, path, size):
+        """Cache key (and file stem) of path resized to size pixels"""
+        return f"{file_digest(path)}-{size[0]}x{size[1]}-q{JPEG_QUALITY}"
+
+    def resized(self, path, size):
+        """JPEG bytes of path cropped and resampled to exactly size (width, height) pixels"""
+        key = self.key(path, size)
+        if key in self._memory:
+            return self._memory[key]
+
+        cached = os.path.join(self.directory, f"{key}.jpg") if self.directory else None
+        if cached and os.path.exists(cached):
+            with open(cached, 'rb') as f:
+                data = f.read()
+        else:
+            data = _encode(path, size)
+            if cached:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = f"{cached}.{os.getpid()}.tmp"
+                with open(tmp, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, cached)
+        self._memory[key] = data
+        return data
+
+    def flowable(self, path, width, height):
+        """Image flowable drawing the prepared photo at width x height points"""
+        from reportlab.platypus import Image  # only PDF builds need ReportLab
+        return Image(io.BytesIO(self.prepare(path, width, height)), width=width, height=height)
+
+_shared = {}
+
+def shared_cache(directory=None):
+    """ImageCache for directory that every build in this process reuses (memory stays warm in long-running servers)"""
+    key = directory and os.path.abspath(directory)
+    if key not in _shared:
+        _shared[key] = ImageCache(key)
+    return _shared[key]
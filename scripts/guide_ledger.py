@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Ledgers
+Long tables (donation and expense ledgers) for the guide PDF. A ReportLab Table
+measures every row before it can split, and splits by copying the remaining
+rows into a new Table, so a ledger of n rows costs O(n^2) time and keeps every
+cell in memory. A ledger instead streams its rows from a CSV file or an SQLite
+query, one page at a time:
+  - column widths are fixed up front (given in inches, or measured once from
+    the first MEASURE_ROWS rows), and every row is one line high, so the rows
+    that fit on a page are counted, not measured
+  - each page repeats the header row, starts with the total brought forward
+    and ends with its page total; the last page ends with the grand total
+  - only the rows of the page being laid out (and the sample that sizes
+    the columns) are held in memory
+Build time grows linearly with the number of rows.
+"""
+
+from collections import deque
+
+from reportlab.lib.colors import white
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable
+
+from guide_content import ledger_total_row, read_ledger
+
+MEASURE_ROWS = 500    # rows sampled to size columns when the content gives no widths
+PADDING = 4           # points around cell text
+LEADING = 1.3         # row height as a multiple of the font size
+ELLIPSIS = '…'
+
+# Labels of the total rows, drawn (translated) in the first column that is not summed
+BROUGHT_FORWARD = "Brought forward"
+PAGE_TOTAL = "Page total"
+TOTAL = "Total"
+
+class LedgerStream:
+    """Rows still to be laid out, the running totals and the column widths of one ledger"""
+    def __init__(self, block, st):
+        self.block = block
+        self.st = st
+        self.rows = read_ledger(block)
+        self.pending = deque()
+        self.read = 0
+        self.totals = [0.0] * len(block.sum_columns)
+        self.widths = None
+
+    def _fill(self, count):
+        while len(self.pending) < count:
+            row = next(self.rows, None)
+            if row is None:
+                return
+            self.read += 1
+            self.pending.append(row)
+
+    def take(self, count):
+        """Up to count rows with their summed values"""
+        self._fill(count)
+        return [self.pending.popleft() for _ in range(min(count, len(self.pending)))]
+
+    def done(self):
+        self._fill(1)
+        return not self.pending
+
+    def layout(self, width):
+        """Column widths in points, fixed for every page of the ledger"""
+        if self.widths is not None:
+            return self.widths
+        block = self.block
+        if block.widths:
+            self.widths = [w * inch for w in block.widths]
+            return self.widths
+        self._fill(MEASURE_ROWS)
+        needed = [stringWidth(column, self.st.fonts.body['bold'], block.header_font_size) for column in block.columns]
+        sample = [row for row, _ in self.pending]
+        # Leave room for totals a thousand times the largest amount sampled
+        largest = max((abs(v) for _, values in self.pending for v in values), default=1.0)
+        sample.append(ledger_total_row(block, self.st.tr(BROUGHT_FORWARD), [largest * 1000] * len(block.sum_columns)))
+        for row in sample:
+            for i, cell in enumerate(row):
+                needed[i] = max(needed[i], stringWidth(cell, self.st.fonts.body['normal'], block.font_size))
+        needed = [n + 2 * PADDING for n in needed]
+        # Share the page width out in proportion to the widest cells
+        self.widths = [width * n / sum(needed) for n in needed]
+        return self.widths
+
+class Ledger(Flowable):
+    """Streamed ledger; never drawn itself, it splits into one LedgerPage per frame
+
+    The ledger in the story holds no stream: every layout pass (a table of
+    contents needs several) reads the source again from the start.
+    """
+    def __init__(self, block, st, stream=None):
+        Flowable.__init__(self)
+        self.block = block
+        self.st = st
+        self.stream = stream
+
+    def _row_height(self, size):
+        return size * LEADING + 2 * PADDING
+
+    def wrap(self, availWidth, availHeight):
+        if self.stream is not None and self.stream.done():
+            return availWidth, 0
+        # Taller than any frame, so the document always splits it
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        block = self.block
+        stream = self.stream or LedgerStream(block, self.st)
+        widths = stream.layout(availWidth)
+        if stream.done():
+            # An empty source still shows its header and a zero total
+            zeros = [0.0] * len(block.sum_columns)
+            return [LedgerPage(block, self.st, widths, [], None, zeros, zeros)]
+        started = stream.read > len(stream.pending)
+        row_height = self._row_height(block.font_size)
+        # Header, brought forward (after the first page), page total and grand total rows
+        fixed = self._row_height(block.header_font_size) + row_height * ((2 + started) if block.sum_columns else 0)
+        count = int((availHeight - fixed) // row_height)
+        if count < 1:
+            return []
+        brought = list(stream.totals) if started and block.sum_columns else None
+        rows = stream.take(count)
+        page = [sum(values[i] for _, values in rows) for i in range(len(block.sum_columns))]
+        stream.totals = [t + p for t, p in zip(stream.totals, page)]
+        last = stream.done()
+        part = LedgerPage(block, self.st, widths, [row for row, _ in rows], brought, page,
+                          stream.totals if last else None)
+        return [part] if last else [part, Ledger(block, self.st, stream)]
+
+    def draw(self):
+        pass
+
+class LedgerPage(Flowable):
+    """The rows of a ledger that fit in one frame, drawn straight onto the canvas"""
+    def __init__(self, block, st, widths, rows, brought, page, total):
+        Flowable.__init__(self)
+        self.block = block
+        self.st = st
+        self.widths = widths
+        self.rows = rows
+        self.brought = brought
+        self.page = page
+        self.total = total
+        self.header_height = block.header_font_size * LEADING + 2 * PADDING
+        self.row_height = block.font_size * LEADING + 2 * PADDING
+        # One page holding the whole ledger shows only the grand total
+        footer = 1 + (total is not None and brought is not None) if block.sum_columns else 0
+        self.height = self.header_height + self.row_height * (len(rows) + (brought is not None) + footer)
+        self.width = sum(widths)
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def _row(self, y, height, cells, font, size, color):
+        """Draw one row of text with its baseline inside the band from y down to y - height"""
+        canv = self.canv
+        canv.setFont(font, size)
+        canv.setFillColor(color)
+        baseline = y - height + PADDING + size * 0.25
+        x = 0
+        for i, (cell, width) in enumerate(zip(cells, self.widths)):
+            room = width - 2 * PADDING
+            if cell and stringWidth(cell, font, size) > room:
+                while cell and stringWidth(cell + ELLIPSIS, font, size) > room:
+                    cell = cell[:-1]
+                cell += ELLIPSIS
+            if i in self.block.align_right:
+                canv.drawRightString(x + width - PADDING, baseline, cell)
+            else:
+                canv.drawString(x + PADDING, baseline, cell)
+            x += width
+
+    def draw(self):
+        block, colors, fonts = self.block, self.st.colors, self.st.fonts.body
+        canv = self.canv
+        y = self.height
+        bands = []  # (top, height, background) of every row, drawn before the text
+
+        canv.saveState()
+        canv.setFillColor(colors[block.color])
+        canv.rect(0, y - self.header_height, self.width, self.header_height, stroke=0, fill=1)
+        self._row(y, self.header_height, block.columns, fonts['bold'], block.header_font_size, white)
+        y -= self.header_height
+
+        lines = []
+        if self.brought is not None:
+            lines.append((ledger_total_row(block, self.st.tr(BROUGHT_FORWARD), self.brought), 'light', 'italic'))
+        lines += [(row, 'light' if i % 2 else None, 'normal') for i, row in enumerate(self.rows)]
+        if block.sum_columns and (self.total is None or self.brought is not None):
+            lines.append((ledger_total_row(block, self.st.tr(PAGE_TOTAL), self.page), 'light', 'bold'))
+        if block.sum_columns and self.total is not None:
+            lines.append((ledger_total_row(block, self.st.tr(TOTAL), self.total), 'accent', 'bold'))
+
+        for _, background, _ in lines:
+            if background:
+                bands.append((y, background))
+            y -= self.row_height
+        for top, background in bands:
+            canv.setFillColor(colors[background])
+            canv.rect(0, top - self.row_height, self.width, self.row_height, stroke=0, fill=1)
+
+        y = self.height - self.header_height
+        for cells, background, face in lines:
+            color = colors['dark'] if background == 'accent' else colors['text']
+            self._row(y, self.row_height, cells, fonts[face], block.font_size, color)
+            y -= self.row_height
+
+        # Grid: one path for every line of the page
+        canv.setStrokeColor(colors['grid'])
+        canv.setLineWidth(0.5)
+        path = canv.beginPath()
+        for i in range(len(lines) + 2):
+            top = self.height if i == 0 else self.height - self.header_height - self.row_height * (i - 1)
+            path.moveTo(0, top)
+            path.lineTo(self.width, top)
+        x = 0
+        for width in [0] + self.widths:
+            x += width
+            path.moveTo(x, 0)
+            path.lineTo(x, self.height)
+        canv.drawPath(path, stroke=1, fill=0)
+        canv.restoreState()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Build Profiler
+Records where a guide build spends its time and memory: setup phases, story
+building and layout per section, layout time per flowable type, header/footer
+drawing and the final write, plus page counts. Used by --profile; the JSON
+report is meant to be compared between runs as the content grows.
+"""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import reportlab
+
+def phase(profile, name):
+    """Time a build phase when profiling (does nothing otherwise)"""
+    return nullcontext() if profile is None else profile.phase(name)
+
+class BuildProfile:
+    """Timings, memory and page counts of one variant build"""
+    def __init__(self, variant_id):
+        self.variant_id = variant_id
+        self.phases = {}
+        self.sections = {}
+        self.flowables = {}
+        self.header_footer = [0, 0.0]
+        self.passes = 0
+        self._section_of = {}
+        self._current = None
+        self.report = None
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def section(self, section):
+        """Time building one section's flowables and measure the memory they keep"""
+        stats = self.sections.setdefault(section.id, {
+            'kind': section.kind, 'story_seconds': 0.0, 'layout_seconds': 0.0,
+            'flowables': 0, 'story_bytes': 0, 'pages': None,
+        })
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats['story_seconds'] += time.perf_counter() - start
+            stats['story_bytes'] += tracemalloc.get_traced_memory()[0] - before
+
+    def add_story(self, section, flowables):
+        """Remember which section each top-level flowable came from"""
+        self.sections[section.id]['flowables'] += len(flowables)
+        for flowable in flowables:
+            self._section_of[id(flowable)] = section.id
+
+    def begin_pass(self):
+        self.passes += 1
+        self._current = None
+        for stats in self.sections.values():
+            stats['pages'] = None
+
+    def flowable(self, flowable, seconds, page):
+        """Account wrap/split/draw time of one flowable to its type and section
+
+        page is None for a flowable that draws nothing, such as a page action.
+        """
+        self._current = self._section_of.get(id(flowable), self._current)
+        stats = self.flowables.setdefault(type(flowable).__name__, [0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        if self._current in self.sections:
+            section = self.sections[self._current]
+            section['layout_seconds'] += seconds
+            if page is None:
+                return
+            first, last = section['pages'] or (page, page)
+            section['pages'] = [min(first, page), max(last, page)]
+
+    def page_drawn(self, seconds):
+        self.header_footer[0] += 1
+        self.header_footer[1] += seconds
+
+    def finish(self, pages, output_bytes, web=None):
+        """Stop measuring and return the report entry for this build
+
+        web holds the sizes and times of the plain and web-optimized PDFs of a --web build.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        rounded = lambda seconds: round(seconds, 6)
+        self.report = {
+            'variant': self.variant_id,
+            'total_seconds': rounded(time.perf_counter() - self._started),
+            'pages': pages,
+            'layout_passes': self.passes,
+            'output_bytes': output_bytes,
+            'phases': {name: rounded(seconds) for name, seconds in self.phases.items()},
+            'sections': [dict(stats, id=section_id, story_seconds=rounded(stats['story_seconds']),
+                              layout_seconds=rounded(stats['layout_seconds']))
+                         for section_id, stats in self.sections.items()],
+            'flowables': {name: {'count': count, 'seconds': rounded(seconds)}
+                          for name, (count, seconds) in sorted(self.flowables.items(), key=lambda item: -item[1][1])},
+            'header_footer': {'pages': self.header_footer[0], 'seconds': rounded(self.header_footer[1])},
+            'memory': {'peak_bytes': peak, 'retained_bytes': current},
+        }
+        if web:
+            self.report['web'] = {
+                'build_bytes': web['input_bytes'], 'build_seconds': rounded(web['build_seconds']),
+                'web_bytes': web['output_bytes'], 'web_seconds': rounded(web['seconds']),
+            }
+        return self.report
+
+def write_report(builds, path):
+    """Write the JSON report for one or more builds"""
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'reportlab': reportlab.Version,
+        'platform': sys.platform,
+        'builds': builds,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Server
+Small WSGI app serving the comprehensive guide on demand, straight from memory.
+Built PDFs are kept in an LRU cache keyed by variant + theme + content version, so a
+request only triggers a build when the guide content actually changed.
+
+Usage: python scripts/guide_server.py [--port 8765]
+       GET /guide.pdf                   (full guide)
+       GET /guide.pdf?variant=donor-brief
+       GET /guide.pdf?theme=grayscale   (default, grayscale, high-contrast)
+"""
+
+import argparse
+import io
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs
+from wsgiref.simple_server import make_server
+
+from generate_comprehensive_guide import (DEFAULT_CACHE_DIR, DEFAULT_THEME, STREAM_CHUNK, create_comprehensive_guide,
+                                          guide_version)
+from guide_content import DEFAULT_CONTENT_PATH, ContentError, load_content
+
+class LRUCache:
+    """Byte-bounded least-recently-used cache"""
+    def __init__(self, max_items=8, max_bytes=64 * 1024 * 1024):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._items:
+                self.size -= len(self._items.pop(key))
+            self._items[key] = value
+            self.size += len(value)
+            while self._items and (len(self._items) > self.max_items or self.size > self.max_bytes):
+                self.size -= len(self._items.popitem(last=False)[1])
+
+def _chunks(data):
+    for start in range(0, len(data), STREAM_CHUNK):
+        yield data[start:start + STREAM_CHUNK]
+
+def make_app(content_path=DEFAULT_CONTENT_PATH, cache_dir=DEFAULT_CACHE_DIR, cache=None):
+    """Create the WSGI application"""
+    cache = cache or LRUCache()
+    build_lock = threading.Lock()
+
+    def app(environ, start_response):
+        if environ.get('PATH_INFO', '/') not in ('/', '/guide.pdf') or environ['REQUEST_METHOD'] not in ('GET', 'HEAD'):
+            start_response('404 Not Found', [('Content-Type', 'text/plain; charset=utf-8')])
+            return [b"Not found\n"]
+
+        query = parse_qs(environ.get('QUERY_STRING', ''))
+        variant = query.get('variant', ['full'])[0]
+        theme = query.get('theme', [DEFAULT_THEME])[0]
+        try:
+            content = load_content(content_path)
+            version = guide_version(variant, content, theme)
+        except ContentError as exc:
+            start_response('400 Bad Request', [('Content-Type', 'text/plain; charset=utf-8')])
+            return [f"{exc}\n".encode('utf-8')]
+
+        etag = f'"{version[:32]}"'
+        if environ.get('HTTP_IF_NONE_MATCH') == etag:
+            start_response('304 Not Modified', [('ETag', etag)])
+            return []
+
+        key = (variant, theme, version)
+        data = cache.get(key)
+        if data is None:
+            with build_lock:
+                data = cache.get(key)
+                if data is None:
+                    buf = io.BytesIO()
+                    create_comprehensive_guide(buf, variant=variant, content=content, cache_dir=cache_dir, log=None,
+                                               theme=theme)
+                    data = buf.getvalue()
+                    cache.put(key, data)
+
+        start_response('200 OK', [
+            ('Content-Type', 'application/pdf'),
+            ('Content-Length', str(len(data))),
+            ('Content-Disposition', f'inline; filename="{content.variant(variant).filename}"'),
+            ('ETag', etag),
+            ('Cache-Control', 'no-cache'),
+        ])
+        return [] if environ['REQUEST_METHOD'] == 'HEAD' else _chunks(data)
+
+    return app
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the comprehensive guide PDF over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--content', default=DEFAULT_CONTENT_PATH, help="content file to build from")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="on-disk build cache shared with the CLI")
+    parser.add_argument('--max-cached', type=int, default=8, help="PDFs kept in memory")
+    args = parser.parse_args(argv)
+
+    app = make_app(args.content, args.cache_dir, LRUCache(max_items=args.max_cached))
+    with make_server(args.host, args.port, app) as server:
+        print(f"📄 Serving the guide on http://{args.host}:{args.port}/guide.pdf")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
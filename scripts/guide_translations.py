@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Guide Translations
+Language editions of the guide. guide_content.json is written in English, the
+source locale; every other locale has a translation memory in
+scripts/translations/<locale>.json that maps the hash of an English string to
+its translation:
+  "76e73c4eebc86294": {"source": "Our Five Core Programs", "text": "Programu Zetu Tano za Msingi"}
+Keys depend on nothing but the English text, so a translation follows its
+string wherever the content moves it, and an edited English string counts as
+missing until it is translated again. A missing translation falls back to the
+English text and is reported; it never stops a build. A name, address or
+other string that reads the same in every language is translated to itself.
+
+Usage: python scripts/guide_translations.py [--update] [locale ...]
+  lists the strings each locale is missing; --update adds them to its memory
+  with an empty "text" for the translators
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from guide_content import DEFAULT_CONTENT_PATH, Content, ContentError, load_content
+
+# Locale code -> name of the language in that language
+LOCALES = {'en': 'English', 'sw': 'Kiswahili'}
+SOURCE_LOCALE = 'en'
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations")
+
+# Content fields that hold text for readers; everything else (ids, kinds, names, styles,
+# file names, queries, number formats) is the same in every edition
+TEXT_FIELDS = {'tagline', 'title', 'header', 'document_type', 'role', 'bio', 'subtitle', 'activities', 'impact',
+               'description', 'question', 'answer', 'text', 'footer', 'greeting', 'sponsorship', 'giving_title',
+               'signature', 'title_lines', 'details', 'columns', 'rows', 'items'}
+
+# Text without words to translate: numbers, phone numbers, a bare URL, email address or placeholder
+UNTRANSLATED = re.compile(r"^(?:[^A-Za-z]*|\S+@\S+|\S+://\S+|\{\w+\})$")
+
+# Fixed text drawn by the generator itself rather than taken from the content
+DATE_FORMAT = "{month} {day}, {year}"
+MONTHS = ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October",
+          "November", "December")
+DATE_LABELS = (DATE_FORMAT,) + MONTHS
+
+def string_key(text):
+    """Translation memory key of an English string"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+class TranslationMemory:
+    """Translations of one locale, and the strings a build looked up without finding one"""
+    def __init__(self, locale, directory=TRANSLATIONS_DIR):
+        if locale not in LOCALES:
+            raise ContentError(f"unknown locale {locale!r} (available: {', '.join(LOCALES)})")
+        self.locale = locale
+        self.path = os.path.join(directory, f"{locale}.json")
+        self.entries = {} if locale == SOURCE_LOCALE else self._read()
+        self.missing = {}  # key -> English text, in the order they were met
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as exc:
+            raise ContentError(f"{os.path.basename(self.path)}: invalid JSON: {exc}") from None
+        if not isinstance(entries, dict) or not all(isinstance(e, dict) for e in entries.values()):
+            raise ContentError(f"{os.path.basename(self.path)}: expected an object of {{source, text}} entries")
+        return entries
+
+    def translate(self, text):
+        """Translation of an English string; the string itself when there is none"""
+        if self.locale == SOURCE_LOCALE or UNTRANSLATED.match(text):
+            return text
+        key = string_key(text)
+        translated = self.entries.get(key, {}).get('text')
+        if translated:
+            return translated
+        self.missing.setdefault(key, text)
+        return text
+
+    def translate_data(self, value, key=None):
+        """Copy of parsed content JSON with the text of every TEXT_FIELDS field translated"""
+        if isinstance(value, dict):
+            return {k: self.translate_data(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.translate_data(v, key) for v in value]
+        if isinstance(value, str) and key in TEXT_FIELDS:
+            return self.translate(value)
+        return value
+
+    def format_date(self, day):
+        """A date as the cover and footer print it ("October 18, 2026" in English)"""
+        return self.translate(DATE_FORMAT).format(month=self.translate(MONTHS[day.month - 1]),
+                                                  day=f"{day.day:02d}", year=day.year)
+
+    def save(self):
+        """Add the missing strings with an empty text for the translators; kept entries are never dropped"""
+        for key, text in self.missing.items():
+            self.entries.setdefault(key, {'source': text, 'text': ''})
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write('\n')
+        os.replace(tmp, self.path)
+
+def load_edition(path, memory):
+    """Content of the memory's language edition; its missing strings are left in memory.missing"""
+    if memory.locale == SOURCE_LOCALE:
+        return load_content(path)
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except OSError as exc:
+        raise ContentError(f"cannot read content file: {exc}") from None
+    except ValueError as exc:
+        raise ContentError(f"{os.path.basename(path)}: invalid JSON: {exc}") from None
+    try:
+        return Content(memory.translate_data(data), os.path.abspath(path))
+    except ContentError as exc:
+        raise ContentError(f"{memory.locale} translation: {exc}") from None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report (and add) the guide strings a translation memory is missing")
+    parser.add_argument('locales', nargs='*', help="locales to check (default: every locale but English)")
+    parser.add_argument('--content', default=DEFAULT_CONTENT_PATH, help="content file to translate")
+    parser.add_argument('--update', action='store_true', help="add missing strings to the memory with an empty text")
+    args = parser.parse_args(argv)
+
+    from generate_comprehensive_guide import LABELS  # the page chrome and ledger labels it draws
+
+    missing = 0
+    for locale in args.locales or [locale for locale in LOCALES if locale != SOURCE_LOCALE]:
+        try:
+            memory = TranslationMemory(locale)
+            load_edition(args.content, memory)
+        except ContentError as exc:
+            print(f"❌ {exc}", file=sys.stderr)
+            return 1
+        for text in LABELS:
+            memory.translate(text)
+        missing += len(memory.missing)
+        if not memory.missing:
+            print(f"✅ {LOCALES[locale]} ({locale}): every string is translated")
+            continue
+        print(f"⚠️  {LOCALES[locale]} ({locale}): {len(memory.missing)} string(s) without a translation")
+        for key, text in memory.missing.items():
+            print(f"   {key}  {text[:90]}")
+        if args.update:
+            memory.save()
+            print(f"   📝 Added to {os.path.relpath(memory.path)}")
+    return 1 if missing and not args.update else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Web-Optimized Guide PDF
+Rewrites a finished guide PDF for download from the website:
+  - identical objects are stored once (the same photo, font file, ToUnicode map
+    or encoding embedded again by every section part of a parallel build)
+  - every stream is Flate-compressed, and streams that already are get recompressed
+    at the highest level
+  - small objects are packed into compressed object streams, and the
+    cross-reference table becomes a compressed cross-reference stream
+  - the file is linearized ("fast web view"): page 1 and the objects it needs
+    come first, followed by hint tables, so a browser shows the first page while
+    the rest is still downloading
+Deduplication uses pypdf; compression and linearization use qpdf through pikepdf.
+
+Usage: python scripts/guide_webpdf.py guide.pdf [web.pdf]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+def require():
+    """pikepdf and pypdf, or exit with how to install them"""
+    try:
+        import pikepdf
+        import pypdf
+    except ImportError:
+        raise SystemExit("❌ Web-optimized PDFs need pikepdf and pypdf: pip install pikepdf pypdf") from None
+    return pikepdf, pypdf
+
+def optimize(source, output):
+    """Write the web-optimized copy of the PDF at source to the path output
+
+    Returns the sizes before and after and the seconds it took.
+    """
+    pikepdf, pypdf = require()
+    started = time.perf_counter()
+    input_bytes = os.path.getsize(source)
+    writer = pypdf.PdfWriter(clone_from=source)
+    writer.compress_identical_objects()
+    deduplicated = io.BytesIO()
+    writer.write(deduplicated)
+    deduplicated.seek(0)
+
+    # Written next to the output and moved into place, so a failure never leaves half a PDF
+    tmp = output + '.tmp'
+    with pikepdf.open(deduplicated) as pdf:
+        pdf.save(tmp, linearize=True, object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                 compress_streams=True, recompress_flate=True, deterministic_id=True)
+    os.replace(tmp, output)
+    return {
+        'input_bytes': input_bytes,
+        'output_bytes': os.path.getsize(output),
+        'seconds': time.perf_counter() - started,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a linearized, compressed copy of a guide PDF for the website")
+    parser.add_argument('pdf', help="PDF to optimize")
+    parser.add_argument('output', nargs='?', help="where to write the copy (default: replace the PDF)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.pdf):
+        parser.error(f"no such PDF: {args.pdf}")
+    stats = optimize(args.pdf, args.output or args.pdf)
+    saved = 1 - stats['output_bytes'] / stats['input_bytes']
+    print(f"✅ {args.output or args.pdf}: {stats['input_bytes'] / 1024:,.0f} KB → "
+          f"{stats['output_bytes'] / 1024:,.0f} KB ({saved:.0%} smaller), linearized in {stats['seconds']:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
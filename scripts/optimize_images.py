@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Image Optimizer
+Turns every source photo under filez/ into 320/800/1200/1600px JPG + WebP variants
+(plus AVIF when Pillow supports it) next to the original: filez/6-29-1200.webp
+Replaces scripts/optimize-images.ps1 (Windows + ImageMagick, nine images only).
+
+Sources are processed in parallel; a source whose content hash is unchanged since
+the last run is skipped. filez/image-variants.json records every variant with its
+pixel size so the pages can reference them.
+
+Usage: python scripts/optimize_images.py [--force] [-j N] [filez/6-25.jpg ...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # the pages and the site build only read sizes (image_size)
+    Image = ImageOps = features = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGE_DIR = os.path.join(REPO_ROOT, "filez")
+MANIFEST_PATH = os.path.join(IMAGE_DIR, "image-variants.json")
+
+# Variant widths and encoder settings; changing any of them re-encodes every source
+WIDTHS = (320, 800, 1200, 1600)
+QUALITY = {'jpg': 82, 'webp': 80, 'avif': 60}
+FORMATS = ('jpg', 'webp', 'avif') if features and features.check('avif') else ('jpg', 'webp')
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.jfif', '.png')
+SETTINGS = json.dumps({'widths': WIDTHS, 'quality': QUALITY, 'formats': FORMATS}, sort_keys=True)
+
+# Files we generated ourselves (name-800.jpg, name-1200.webp, ...) are never sources
+VARIANT_NAME = re.compile(r"-(%s)\.(jpg|webp|avif)$" % "|".join(str(w) for w in WIDTHS), re.IGNORECASE)
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def image_size(path):
+    """(width, height) in pixels read from the header of a JPEG, PNG, GIF, WebP or AVIF file
+
+    Standard library only, so the site build needs no Pillow. Returns None for
+    anything else; like Pillow, it ignores the EXIF orientation.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        if head.startswith(b'\x89PNG\r\n\x1a\n'):
+            return struct.unpack('>II', head[16:24])
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', head[6:10])
+        if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+            chunk = head[12:16]
+            if chunk == b'VP8 ':
+                width, height = struct.unpack('<HH', head[26:30])
+                return width & 0x3fff, height & 0x3fff
+            if chunk == b'VP8L':
+                bits = int.from_bytes(head[21:25], 'little')
+                return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+            if chunk == b'VP8X':
+                return int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+            return None
+        if head[4:12] in (b'ftypavif', b'ftypavis'):
+            # The image spatial extents property: box header, version/flags, width, height
+            data = head + f.read(64 * 1024)
+            at = data.find(b'ispe')
+            return struct.unpack('>II', data[at + 8:at + 16]) if at >= 4 else None
+        if not head.startswith(b'\xff\xd8'):
+            return None
+        # JPEG: walk the marker segments up to the start-of-frame that holds the size
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xff:
+                return None
+            while marker[1] == 0xff:  # fill bytes
+                marker = marker[1:] + f.read(1)
+            kind = marker[1]
+            if kind in (0xd8, 0x01) or 0xd0 <= kind <= 0xd7:
+                continue
+            length = f.read(2)
+            if len(length) < 2:
+                return None
+            if 0xc0 <= kind <= 0xcf and kind not in (0xc4, 0xc8, 0xcc):
+                height, width = struct.unpack('>xHH', f.read(5))
+                return width, height
+            f.seek(struct.unpack('>H', length)[0] - 2, os.SEEK_CUR)
+
+def require_pillow():
+    """Exit with how to install Pillow, which encoding the variants needs"""
+    if Image is None:
+        raise SystemExit("❌ Optimizing images needs Pillow: pip install Pillow")
+
+def find_sources(image_dir=IMAGE_DIR):
+    """Every original image below image_dir, in a stable order"""
+    sources = []
+    for root, dirs, files in os.walk(image_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(SOURCE_EXTENSIONS) and not VARIANT_NAME.search(name):
+                sources.append(os.path.join(root, name))
+    return sources
+
+def _file_hash(path):
+    h = hashlib.sha256(SETTINGS.encode('utf-8'))
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _file_stamp(path):
+    """Cheap identity of a file (size + mtime) so unchanged sources are not even re-hashed"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def load_manifest():
+    """Source image (repo-relative path) -> hash, pixel size and variant files"""
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest):
+    """Write the manifest atomically so an interrupted run never leaves it half-written"""
+    tmp = MANIFEST_PATH + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, MANIFEST_PATH)
+
+def _save(img, path, fmt):
+    """Encode one variant without metadata (EXIF can carry the GPS position of a photo)"""
+    if fmt == 'jpg':
+        if img.mode != 'RGB':
+            background = Image.new('RGB', img.size, 'white')
+            background.paste(img, mask=img.getchannel('A') if 'A' in img.getbands() else None)
+            img = background
+        img.save(path, 'JPEG', quality=QUALITY['jpg'], optimize=True, progressive=True)
+    elif fmt == 'webp':
+        img.save(path, 'WEBP', quality=QUALITY['webp'], method=5)
+    else:
+        img.save(path, 'AVIF', quality=QUALITY['avif'])
+
+def optimize_image(path, digest):
+    """Process pool task: write every variant of one source and return its manifest entry"""
+    with Image.open(path) as img:
+        # Decode large JPEGs at a reduced scale when that still covers the widest variant
+        img.draft('RGB', (max(WIDTHS), max(WIDTHS)))
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+        width, height = img.size
+
+    # Never upscale: a source narrower than a variant width does not get that variant
+    stem = os.path.splitext(path)[0]
+    variants = {}
+    for w in sorted((w for w in WIDTHS if w <= width), reverse=True):
+        size = (w, max(1, round(height * w / width)))
+        resized = img if size == img.size else img.resize(size, Image.LANCZOS, reducing_gap=3.0)
+        files = {}
+        for fmt in FORMATS:
+            out = f"{stem}-{w}.{fmt}"
+            _save(resized, out, fmt)
+            files[fmt] = _relpath(out)
+        variants[str(w)] = {'width': size[0], 'height': size[1], 'files': files}
+        img = resized
+
+    return {'hash': digest, 'width': width, 'height': height, 'variants': variants}
+
+def _variant_files(entry):
+    return [os.path.join(REPO_ROOT, name) for v in entry.get('variants', {}).values() for name in v['files'].values()]
+
+def optimize_images(paths=None, force=False, jobs=None):
+    """Bring the variants of the given sources (default: all of filez/) up to date
+
+    Returns the number of sources that were re-encoded.
+    """
+    require_pillow()
+    sources = [os.path.abspath(p) for p in paths] if paths else find_sources()
+    manifest = load_manifest()
+
+    todo = []
+    for path in sources:
+        key = _relpath(path)
+        entry = manifest.get(key, {})
+        stamp = _file_stamp(path)
+        if not force and entry.get('stamp') == stamp and all(map(os.path.exists, _variant_files(entry))):
+            continue
+        digest = _file_hash(path)
+        if not force and entry.get('hash') == digest and all(map(os.path.exists, _variant_files(entry))):
+            entry['stamp'] = stamp
+            continue
+        todo.append((path, key, digest, stamp))
+
+    if not paths:
+        # Forget sources that were deleted (their variants are left for review)
+        for key in [key for key in manifest if not os.path.exists(os.path.join(REPO_ROOT, key))]:
+            del manifest[key]
+
+    if not todo:
+        _save_manifest(manifest)
+        print(f"✅ All {len(sources)} image(s) are up to date")
+        return 0
+
+    print(f"🖼️  Optimizing {len(todo)} of {len(sources)} image(s) ({', '.join(f.upper() for f in FORMATS)})")
+    saved = 0
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(optimize_image, path, digest): (path, key, stamp) for path, key, digest, stamp in todo}
+            for future in as_completed(futures):
+                path, key, stamp = futures[future]
+                entry = future.result()
+                entry['stamp'] = stamp
+                manifest[key] = entry
+                files = _variant_files(entry)
+                before = os.path.getsize(path)
+                smallest = min((os.path.getsize(f) for f in files if f.endswith('.webp')), default=before)
+                saved += 1
+                print(f"   ✓ {key}: {len(files)} variant(s), {before / 1024:,.0f} KB → {smallest / 1024:,.0f} KB (smallest WebP)")
+    finally:
+        # Keep the work of finished images even if a later one fails
+        _save_manifest(manifest)
+
+    print(f"✅ {saved} image(s) optimized; manifest: {_relpath(MANIFEST_PATH)}")
+    return saved
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate responsive JPG/WebP/AVIF variants of the site images")
+    parser.add_argument('images', nargs='*', help="source images to process (default: everything under filez/)")
+    parser.add_argument('--force', action='store_true', help="re-encode even if the source did not change")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    for path in args.images:
+        if not os.path.isfile(path):
+            parser.error(f"no such image: {path}")
+    optimize_images(args.images, force=args.force, jobs=args.jobs)
+
+if __name__ == "__main__":
+    sys.exit(main())
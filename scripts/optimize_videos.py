@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Video Optimizer
+Turns every source video under filez/ into a bitrate ladder of H.264 MP4
+renditions plus a WebP poster frame, next to the original:
+  filez/joram.mp4 -> filez/joram-360p.mp4, filez/joram-720p.mp4, filez/joram-poster.webp
+responsive_images.py then points the <video> tags at them with preload="none",
+so a page downloads no video bytes until the visitor presses play.
+
+Needs ffmpeg and ffprobe on the PATH (or FFMPEG / FFPROBE set to their paths).
+Encodes run in a worker pool; a source whose content hash is unchanged since the
+last run is skipped. filez/video-variants.json records every output.
+
+Usage: python scripts/optimize_videos.py [--force] [-j N] [filez/joram.mp4 ...]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image
+except ImportError:  # the pages and the site build only read the manifest
+    Image = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VIDEO_DIR = os.path.join(REPO_ROOT, "filez")
+MANIFEST_PATH = os.path.join(VIDEO_DIR, "video-variants.json")
+
+# The ladder, smallest first: height -> bitrates, and the widest viewport a rendition is picked for
+# (the largest serves every other viewport). Changing any setting re-encodes every source.
+RENDITIONS = {
+    360: {'video_bitrate': '600k', 'audio_bitrate': '64k', 'max_viewport': 800},
+    720: {'video_bitrate': '1800k', 'audio_bitrate': '96k', 'max_viewport': None},
+}
+POSTER_TIME = 1.0     # seconds into the video; a shorter video uses its first frame
+POSTER_WIDTH = 1280
+POSTER_QUALITY = 80
+SOURCE_EXTENSIONS = ('.mp4', '.mov', '.m4v', '.webm')
+SETTINGS = json.dumps({'renditions': RENDITIONS, 'poster': [POSTER_TIME, POSTER_WIDTH, POSTER_QUALITY]},
+                      sort_keys=True)
+
+# Files we generated ourselves (name-360p.mp4, name-poster.webp) are never sources
+VARIANT_NAME = re.compile(r"-(?:\d+p\.mp4|poster\.webp)$", re.IGNORECASE)
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def _tool(name):
+    """Path of ffmpeg/ffprobe, from the environment or the PATH"""
+    path = os.environ.get(name.upper()) or shutil.which(name)
+    if not path:
+        raise SystemExit(f"❌ Video optimization needs {name}: install ffmpeg (https://ffmpeg.org) "
+                         f"or set {name.upper()} to its path")
+    return path
+
+def _run(args):
+    """Run an ffmpeg tool; returns its stdout. Raises RuntimeError with ffmpeg's message on failure."""
+    result = subprocess.run(args, capture_output=True)
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip().splitlines()[-3:]
+        raise RuntimeError(f"{os.path.basename(args[0])} failed on {_relpath(args[args.index('-i') + 1])}: "
+                           + " / ".join(message))
+    return result.stdout
+
+def find_sources(video_dir=VIDEO_DIR):
+    """Every original video below video_dir, in a stable order"""
+    sources = []
+    for root, dirs, files in os.walk(video_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(SOURCE_EXTENSIONS) and not VARIANT_NAME.search(name):
+                sources.append(os.path.join(root, name))
+    return sources
+
+def _file_hash(path):
+    h = hashlib.sha256(SETTINGS.encode('utf-8'))
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _file_stamp(path):
+    """Cheap identity of a file (size + mtime) so unchanged sources are not even re-hashed"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def load_manifest():
+    """Source video (repo-relative path) -> hash, size, renditions and poster"""
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest):
+    """Write the manifest atomically so an interrupted run never leaves it half-written"""
+    tmp = MANIFEST_PATH + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, MANIFEST_PATH)
+
+def probe(path):
+    """Pixel size of a video's first video stream"""
+    out = _run([_tool('ffprobe'), '-v', 'error', '-select_streams', 'v:0',
+                '-show_entries', 'stream=width,height', '-of', 'json', '-i', path])
+    stream = json.loads(out)['streams'][0]
+    return stream['width'], stream['height']
+
+def _renditions(height):
+    """Ladder heights for a source: never upscaled, but always at least the smallest rendition"""
+    return [h for h in RENDITIONS if h <= height] or [min(RENDITIONS)]
+
+def encode_rendition(path, height):
+    """Process pool task: one H.264/AAC MP4 rendition, streamable before it has fully downloaded"""
+    settings = RENDITIONS[height]
+    out = f"{os.path.splitext(path)[0]}-{height}p.mp4"
+    tmp = out + '.tmp.mp4'
+    bitrate = int(settings['video_bitrate'].rstrip('k'))
+    _run([_tool('ffmpeg'), '-y', '-v', 'error', '-i', path,
+          '-map', '0:v:0', '-map', '0:a:0?',
+          '-vf', f"scale=-2:'min({height},ih)'", '-c:v', 'libx264', '-preset', 'slow', '-profile:v', 'main',
+          '-pix_fmt', 'yuv420p', '-b:v', settings['video_bitrate'],
+          '-maxrate', f"{bitrate * 3 // 2}k", '-bufsize', f"{bitrate * 2}k",
+          '-c:a', 'aac', '-b:a', settings['audio_bitrate'], '-ac', '2',
+          '-movflags', '+faststart', tmp])
+    os.replace(tmp, out)
+    return {'file': _relpath(out), 'height': height, 'bitrate': settings['video_bitrate']}
+
+def extract_poster(path):
+    """Process pool task: a frame of the video as a WebP poster, without metadata"""
+    frame = b''
+    for seek in (POSTER_TIME, 0):
+        frame = _run([_tool('ffmpeg'), '-v', 'error', '-ss', str(seek), '-i', path, '-frames:v', '1',
+                      '-f', 'image2pipe', '-vcodec', 'png', '-'])
+        if frame:
+            break
+    with Image.open(io.BytesIO(frame)) as img:
+        img = img.convert('RGB')
+        if img.width > POSTER_WIDTH:
+            img = img.resize((POSTER_WIDTH, round(img.height * POSTER_WIDTH / img.width)), Image.LANCZOS)
+        out = f"{os.path.splitext(path)[0]}-poster.webp"
+        img.save(out, 'WEBP', quality=POSTER_QUALITY, method=5)
+        return {'file': _relpath(out), 'width': img.width, 'height': img.height}
+
+def _variant_files(entry):
+    files = [r['file'] for r in entry.get('renditions', {}).values()]
+    if entry.get('poster'):
+        files.append(entry['poster']['file'])
+    return [os.path.join(REPO_ROOT, name) for name in files]
+
+def optimize_videos(paths=None, force=False, jobs=None):
+    """Bring the renditions and posters of the given sources (default: all of filez/) up to date
+
+    Returns the number of sources that were re-encoded.
+    """
+    if Image is None:
+        raise SystemExit("❌ Video posters need Pillow: pip install Pillow")
+    sources = [os.path.abspath(p) for p in paths] if paths else find_sources()
+    if not sources:
+        # A checkout without the videos (they are not committed) must not wipe the manifest
+        print(f"ℹ️  No videos found under {_relpath(VIDEO_DIR)}/; {_relpath(MANIFEST_PATH)} left as it is")
+        return 0
+    manifest = load_manifest()
+    saved_manifest = json.dumps(manifest, sort_keys=True)
+
+    todo = []
+    for path in sources:
+        key = _relpath(path)
+        entry = manifest.get(key, {})
+        stamp = _file_stamp(path)
+        if not force and entry.get('stamp') == stamp and all(map(os.path.exists, _variant_files(entry))):
+            continue
+        digest = _file_hash(path)
+        if not force and entry.get('hash') == digest and all(map(os.path.exists, _variant_files(entry))):
+            entry['stamp'] = stamp
+            continue
+        todo.append((path, key, digest, stamp))
+
+    if not paths:
+        # Forget sources that were deleted (their renditions are left for review)
+        for key in [key for key in manifest if not os.path.exists(os.path.join(REPO_ROOT, key))]:
+            del manifest[key]
+
+    if not todo:
+        if json.dumps(manifest, sort_keys=True) != saved_manifest:
+            _save_manifest(manifest)
+        print(f"✅ All {len(sources)} video(s) are up to date")
+        return 0
+    # Fail before anything is written when the tools are missing
+    _tool('ffprobe')
+    _tool('ffmpeg')
+
+    # One pool job per rendition and poster, so a single long video still uses every worker
+    entries, pending = {}, {}
+    for path, key, digest, stamp in todo:
+        width, height = probe(path)
+        entries[key] = {'hash': digest, 'stamp': stamp, 'width': width, 'height': height, 'renditions': {}}
+        pending[key] = len(_renditions(height)) + 1
+    print(f"🎬 Optimizing {len(todo)} of {len(sources)} video(s) "
+          f"({', '.join(f'{h}p' for h in RENDITIONS)} + WebP poster)")
+    saved = 0
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {}
+            for path, key, digest, stamp in todo:
+                futures[pool.submit(extract_poster, path)] = (path, key, None)
+                for height in _renditions(entries[key]['height']):
+                    futures[pool.submit(encode_rendition, path, height)] = (path, key, height)
+            for future in as_completed(futures):
+                path, key, height = futures[future]
+                result = future.result()
+                if height is None:
+                    entries[key]['poster'] = result
+                else:
+                    entries[key]['renditions'][str(height)] = result
+                pending[key] -= 1
+                if pending[key]:
+                    continue
+                # Every output of this source is written: record it
+                manifest[key] = entries[key]
+                before = os.path.getsize(path)
+                sizes = ", ".join(f"{h}p {os.path.getsize(os.path.join(REPO_ROOT, r['file'])) / 1024 / 1024:,.1f} MB"
+                                  for h, r in sorted(entries[key]['renditions'].items(), key=lambda i: int(i[0])))
+                saved += 1
+                print(f"   ✓ {key}: {before / 1024 / 1024:,.1f} MB → {sizes}")
+    finally:
+        # Keep the work of finished videos even if a later one fails
+        _save_manifest(manifest)
+
+    print(f"✅ {saved} video(s) optimized; manifest: {_relpath(MANIFEST_PATH)}")
+    return saved
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate MP4 renditions and WebP posters of the site videos")
+    parser.add_argument('videos', nargs='*', help="source videos to process (default: everything under filez/)")
+    parser.add_argument('--force', action='store_true', help="re-encode even if the source did not change")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    for path in args.videos:
+        if not os.path.isfile(path):
+            parser.error(f"no such video: {path}")
+    try:
+        optimize_videos(args.videos, force=args.force, jobs=args.jobs)
+    except RuntimeError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
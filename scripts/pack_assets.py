@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Asset Packer
+Gives every file of the built site's filez/ and assets/ a content-hashed copy
+under static/ (filez/6-29.jpg -> static/filez/6-29.1a2b3c4d5e.jpg) that can be
+cached forever, writes .gz (and, with the brotli package, .br) siblings of the
+text files, and keeps the matching Cache-Control entries in vercel.json.
+build_site.py runs it and points the pages at the hashed names; the original
+paths stay available for links from outside the site (og:image, JSON-LD).
+Unchanged files are skipped (dist/.asset-manifest.json); the rest are hashed
+and compressed in parallel.
+
+Usage: python scripts/pack_assets.py [--out DIR] [--force] [-j N]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from urllib.parse import quote, unquote
+
+try:
+    import brotli
+except ImportError:  # .gz siblings only
+    brotli = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERCEL_CONFIG = os.path.join(REPO_ROOT, 'vercel.json')
+MANIFEST_NAME = '.asset-manifest.json'
+
+# Directories of the built site that are fingerprinted, and where the hashed copies go
+PACKED_DIRS = ('filez', 'assets')
+STATIC_DIR = 'static'
+HASH_LENGTH = 10
+
+# Only text formats shrink; images and video are compressed already
+COMPRESSIBLE = ('.css', '.js', '.mjs', '.html', '.svg', '.json', '.xml', '.txt', '.ico', '.webmanifest')
+MIN_SAVING = 0.9  # siblings that are not at least 10% smaller are not written
+
+# Cache-Control written to vercel.json. Later entries win where sources overlap.
+CACHE_HEADERS = [
+    ('/(.*)', 'public, max-age=0, must-revalidate'),                 # pages: always revalidate
+    ('/filez/(.*)', 'public, max-age=86400'),                         # unhashed originals
+    (f'/{STATIC_DIR}/(.*)', 'public, max-age=31536000, immutable'),  # content-hashed: never changes
+]
+
+# References to packed files in HTML/CSS: relative or site-absolute, never part of a full URL
+REFERENCE = re.compile(r"""(?<![\w/.:%%-])(/?)((?:%s)/[^"'\s()<>,]+)""" % '|'.join(PACKED_DIRS))
+
+def _relpath(path, root):
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def fingerprinted_name(rel, digest):
+    """static/ path of a file with the content hash in its name"""
+    stem, ext = os.path.splitext(rel)
+    return f"{STATIC_DIR}/{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+def siblings(path):
+    return [path + '.gz', path + '.br']
+
+def compress(path):
+    """Write the .gz/.br siblings of a text file; returns the sibling paths written"""
+    for sibling in siblings(path):
+        if os.path.exists(sibling):
+            os.remove(sibling)
+    if not path.lower().endswith(COMPRESSIBLE):
+        return []
+    with open(path, 'rb') as f:
+        data = f.read()
+    written = []
+    encoders = [('.gz', lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append(('.br', lambda d: brotli.compress(d, quality=11)))
+    for suffix, encode in encoders:
+        packed = encode(data)
+        if len(packed) < len(data) * MIN_SAVING:
+            with open(path + suffix, 'wb') as f:
+                f.write(packed)
+            written.append(path + suffix)
+    return written
+
+def _link(src, dst):
+    """Hard-link (else copy) src to dst"""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, the hash in its fingerprinted name"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def pack_file(out_dir, rel):
+    """Hash one file, make its fingerprinted copy and compressed siblings; returns its manifest entry"""
+    path = os.path.join(out_dir, rel)
+    digest = file_digest(path)
+    target = fingerprinted_name(rel, digest)
+    _link(path, os.path.join(out_dir, target))
+    compressed = [_relpath(p, out_dir) for p in compress(os.path.join(out_dir, target))]
+    return {'hash': digest, 'file': target, 'compressed': compressed}
+
+def _remove_outputs(out_dir, entry):
+    for rel in [entry['file']] + entry.get('compressed', []):
+        path = os.path.join(out_dir, rel)
+        if os.path.exists(path):
+            os.remove(path)
+
+def find_files(out_dir):
+    """Files of the packed directories of the built site, in a stable order"""
+    found = []
+    for name in PACKED_DIRS:
+        for root, dirs, files in os.walk(os.path.join(out_dir, name)):
+            dirs.sort()
+            found += [_relpath(os.path.join(root, f), out_dir) for f in sorted(files)
+                      if not f.endswith(('.gz', '.br'))]
+    return found
+
+def load_manifest(out_dir):
+    """Built-site file -> hash, fingerprinted copy and compressed siblings"""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+def pack(out_dir, force=False, jobs=None):
+    """Bring the fingerprinted copies in out_dir up to date; returns {file: fingerprinted file}"""
+    manifest = {} if force else load_manifest(out_dir)
+    files = find_files(out_dir)
+
+    todo = []
+    for rel in files:
+        entry = manifest.get(rel, {})
+        stamp = _file_stamp(os.path.join(out_dir, rel))
+        outputs = [entry.get('file', '')] + entry.get('compressed', [])
+        if entry.get('stamp') == stamp and all(os.path.exists(os.path.join(out_dir, p)) for p in outputs):
+            continue
+        todo.append((rel, stamp))
+
+    # Forget files that are gone, with their hashed copies
+    for rel in set(manifest) - set(files):
+        _remove_outputs(out_dir, manifest.pop(rel))
+
+    if todo:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {pool.submit(pack_file, out_dir, rel): (rel, stamp) for rel, stamp in todo}
+                for future in as_completed(futures):
+                    rel, stamp = futures[future]
+                    entry = future.result()
+                    old = manifest.get(rel)
+                    if old and old['file'] != entry['file']:
+                        _remove_outputs(out_dir, old)
+                    entry['stamp'] = stamp
+                    manifest[rel] = entry
+        finally:
+            # Keep the work of finished files even if a later one fails
+            _save_manifest(out_dir, manifest)
+        compressed = sum(len(manifest[rel]['compressed']) for rel, _ in todo)
+        print(f"📦 Fingerprinted {len(todo)} of {len(files)} asset(s), {compressed} compressed sibling(s)"
+              f"{'' if brotli else ' (gzip only: pip install brotli for .br)'}")
+    else:
+        _save_manifest(out_dir, manifest)
+        print(f"📦 All {len(files)} asset(s) are fingerprinted")
+    return {rel: entry['file'] for rel, entry in manifest.items()}
+
+def rewrite_references(text, assets):
+    """Point every reference to a packed file at its fingerprinted copy"""
+    def replace(match):
+        ref = match.group(2)
+        path, suffix = re.match(r'([^?#]*)(.*)', ref).groups()
+        target = assets.get(unquote(path))
+        if target is None:
+            return match.group(0)
+        return match.group(1) + quote(target) + suffix
+    return REFERENCE.sub(replace, text)
+
+# ===== VERCEL =====
+
+def update_vercel_config(path=VERCEL_CONFIG):
+    """Put the Cache-Control entries into vercel.json; True when the file changed.
+
+    Vercel reads vercel.json before the build runs, so a changed file has to be committed.
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    ours = {source for source, _ in CACHE_HEADERS}
+    entries = [{'source': source, 'headers': [{'key': 'Cache-Control', 'value': value}]}
+               for source, value in CACHE_HEADERS]
+    # Our entries come first so the hand-written ones (sitemap.xml, robots.txt) still override them
+    headers = entries + [entry for entry in config.get('headers', []) if entry.get('source') not in ours]
+    if headers == config.get('headers'):
+        return False
+    config['headers'] = headers
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress the built site's assets")
+    parser.add_argument('--out', default=os.path.join(REPO_ROOT, 'dist'), help="built site (default: dist/)")
+    parser.add_argument('--force', action='store_true', help="re-hash every file, ignoring the manifest")
+    parser.add_argument('-j', '--jobs', type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.out):
+        parser.error(f"no built site in {args.out}: run scripts/build_site.py first")
+    pack(os.path.abspath(args.out), force=args.force, jobs=args.jobs)
+    if update_vercel_config():
+        print(f"✅ Updated the Cache-Control headers in {_relpath(VERCEL_CONFIG, REPO_ROOT)}: commit it")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Responsive Image Rewriter
+Points the HTML pages at the resized variants made by optimize_images.py:
+  <img src>                         -> <picture> with AVIF/WebP sources, srcset, width/height
+  style="background-image: url()"   -> per-width image-set() picked by a media query
+  <link rel="preload" as="image">   -> one preload per viewport range
+  <video poster>                    -> a resized JPG
+  <video>                           -> preload="none", whether or not it was optimized
+  <video><source>                   -> the optimize_videos.py renditions and, when the video
+                                       has no local poster, its WebP poster
+Each page is rewritten in a single pass; running it again changes nothing.
+
+Usage: python scripts/responsive_images.py [--check] [index.html ...]
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+
+from optimize_images import IMAGE_DIR, REPO_ROOT, VARIANT_NAME, WIDTHS, image_size, load_manifest
+from optimize_videos import RENDITIONS, load_manifest as load_video_manifest
+
+# Preferred format first; JPG is the fallback every browser can show
+FORMATS = ('avif', 'webp', 'jpg')
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'jpg': 'image/jpeg'}
+
+# Width of the single file used where no choice is possible (<img src>, <video poster>)
+FALLBACK_WIDTH = 1200
+
+# Markers on rewritten elements, holding the original image so a re-run starts from it
+PICTURE_MARKER = 'data-responsive-src'
+BACKGROUND_MARKER = 'data-responsive-bg'
+BACKGROUND_STYLE_ID = 'responsive-backgrounds'
+VIDEO_MARKER = 'data-video-src'
+
+def _min_width(i):
+    return f"(min-width: {WIDTHS[i - 1] + 1}px)"
+
+def _media(i, last=None):
+    """Viewport range served by the i-th variant width (through the last-th)"""
+    last = i if last is None else last
+    lower = _min_width(i) if i else ""
+    upper = f"(max-width: {WIDTHS[last]}px)" if last < len(WIDTHS) - 1 else ""
+    return " and ".join(part for part in (lower, upper) if part)
+
+def _background_css():
+    """Stylesheet choosing the --bg-WIDTH custom properties set on each background element"""
+    def rules(suffix, indent):
+        lines = []
+        for i in range(len(WIDTHS)):
+            # This range's width, else the next smaller one, else (an image without small variants) the next larger
+            order = list(reversed(WIDTHS[:i + 1])) + list(WIDTHS[i + 1:])
+            chain = f"var(--bg-{order[-1]}{suffix})"
+            for w in reversed(order[:-1]):
+                chain = f"var(--bg-{w}{suffix}, {chain})"
+            rule = f"[{BACKGROUND_MARKER}] {{ background-image: {chain}; }}"
+            lines.append(f"{indent}@media {_min_width(i)} {{ {rule} }}" if i else f"{indent}{rule}")
+        return lines
+    supports = 'background-image: image-set(url("x.jpg") type("image/jpeg"))'
+    lines = [f'    <style id="{BACKGROUND_STYLE_ID}">',
+             "        /* Generated by scripts/responsive_images.py */"]
+    lines += rules('-jpg', "        ")
+    lines.append(f"        @supports ({supports}) {{")
+    lines += rules('', "            ")
+    lines += ["        }", "    </style>", ""]
+    return "\n".join(lines)
+
+# ===== VARIANTS =====
+
+def _relpath(path):
+    return os.path.relpath(path, REPO_ROOT).replace(os.sep, '/')
+
+def load_variants():
+    """Image path without extension -> source size and {width: {width, height, files}}
+
+    Uses the optimize_images.py manifest, plus variants already on disk without a
+    manifest entry (for instance ones made by the old PowerShell script). Files
+    missing on disk are left out.
+    """
+    found = {}
+    for root, dirs, files in os.walk(IMAGE_DIR):
+        for name in files:
+            match = VARIANT_NAME.search(name)
+            if match:
+                stem = _relpath(os.path.join(root, name[:match.start()]))
+                fmt = match.group(2).lower()
+                found.setdefault(stem, {}).setdefault(int(match.group(1)), {})[fmt] = _relpath(os.path.join(root, name))
+
+    index = {}
+    manifest = {os.path.splitext(key)[0]: entry for key, entry in load_manifest().items()}
+    for stem, widths in found.items():
+        entry = manifest.get(stem, {})
+        known = entry.get('variants', {})
+        variants = {}
+        for w, files in sorted(widths.items()):
+            if 'jpg' not in files:
+                continue
+            if str(w) in known:
+                size = known[str(w)]['width'], known[str(w)]['height']
+            else:
+                size = image_size(os.path.join(REPO_ROOT, files['jpg']))
+                if size is None:
+                    continue
+            variants[w] = {'width': size[0], 'height': size[1], 'files': files}
+        if variants:
+            largest = variants[max(variants)]
+            index[stem] = {'width': entry.get('width', largest['width']),
+                           'height': entry.get('height', largest['height']), 'variants': variants}
+    return index
+
+def load_videos():
+    """Source video path -> its manifest entry, for videos whose outputs are all on disk"""
+    videos = {}
+    for key, entry in load_video_manifest().items():
+        files = [r['file'] for r in entry.get('renditions', {}).values()] + [entry.get('poster', {}).get('file')]
+        if entry.get('renditions') and all(f and os.path.exists(os.path.join(REPO_ROOT, f)) for f in files):
+            videos[key] = entry
+    return videos
+
+# ===== HTML =====
+
+# One pass over the page: comments and scripts are copied as they are, our own
+# <picture> output and background stylesheet are regenerated, start tags inspected
+ATTRS = r"""(?P<attrs>(?:\s+[^\s=/>]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?)*)\s*(?P<close>/?)>"""
+TOKEN = re.compile(r"""
+    (?P<skip><!--.*?-->|<script\b.*?</script\s*>)
+  | (?P<picture><picture\s[^>]*\bdata-responsive-src=[^>]*>.*?</picture>)
+  | (?P<style>[ \t]*<style\s+id="responsive-backgrounds">.*?</style>\n?)
+  | (?P<video><video\b.*?</video\s*>)
+  | (?P<tag><(?P<name>[a-z][a-z0-9-]*)""" + ATTRS + ")", re.S | re.I | re.X)
+IMG = re.compile(r"<(?P<name>img)" + ATTRS, re.I)
+VIDEO = re.compile(r"<(?P<name>video)" + ATTRS, re.I)
+SOURCE = re.compile(r"(?P<indent>\n[ \t]*)?<(?P<name>source)" + ATTRS, re.I)
+EXTERNAL = re.compile(r'^[a-z][a-z0-9+.-]*:|^//', re.I)
+
+ATTR = re.compile(r"""([^\s=/>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+BACKGROUND_URL = re.compile(r"""background-image:\s*url\((['"]?)([^'")]+)\1\)\s*;?\s*""", re.I)
+BACKGROUND_VARS = re.compile(r"--bg-[\w-]+:[^;]*;?\s*")
+
+class _Tag:
+    """Start tag with its attributes in source order"""
+    def __init__(self, name, attrs, close=''):
+        self.name = name
+        self.close = close
+        self.attrs = [[m.group(1), m.group(2)] for m in ATTR.finditer(attrs)]
+
+    def get(self, name):
+        for key, raw in self.attrs:
+            if key.lower() == name:
+                return raw[1:-1] if raw and raw[0] in '"\'' else (raw or '')
+        return None
+
+    def set(self, name, value):
+        for attr in self.attrs:
+            if attr[0].lower() == name:
+                attr[1] = f'"{value}"'
+                return
+        self.attrs.append([name, f'"{value}"'])
+
+    def __str__(self):
+        attrs = ''.join(f" {key}={raw}" if raw is not None else f" {key}" for key, raw in self.attrs)
+        return f"<{self.name}{attrs}{' /' if self.close else ''}>"
+
+class _Page:
+    """Resolves image references of one page against the variants"""
+    def __init__(self, path, variants, videos=None):
+        self.dir = os.path.dirname(os.path.abspath(path))
+        self.variants = variants
+        self.videos = videos or {}
+        self.backgrounds = 0
+        self.preloaded = set()
+
+    def resolve(self, ref):
+        """Repo-relative path of a local reference, or None for external URLs"""
+        if not ref or EXTERNAL.match(ref):
+            return None
+        path = os.path.join(REPO_ROOT, ref.lstrip('/')) if ref.startswith('/') else os.path.join(self.dir, ref)
+        return _relpath(os.path.normpath(path))
+
+    def lookup(self, ref):
+        """Variants of an image reference (original or already-rewritten), or None"""
+        rel = self.resolve(ref)
+        if rel is None:
+            return None
+        stem, ext = os.path.splitext(rel)
+        match = VARIANT_NAME.search(stem + ext)
+        if match:
+            stem = (stem + ext)[:match.start()]
+        return self.variants.get(stem)
+
+    def url(self, ref, file):
+        """URL of a variant file written the same way (site-absolute or relative) as ref"""
+        if ref.startswith('/'):
+            return '/' + file
+        return os.path.relpath(os.path.join(REPO_ROOT, file), self.dir).replace(os.sep, '/')
+
+    def fallback(self, entry):
+        widths = sorted(entry['variants'])
+        return next((w for w in widths if w >= FALLBACK_WIDTH), widths[-1])
+
+    def srcset(self, ref, entry, fmt):
+        return ", ".join(f"{self.url(ref, v['files'][fmt])} {v['width']}w"
+                         for w, v in sorted(entry['variants'].items()) if fmt in v['files'])
+
+def _sizes(tag, entry):
+    """Rendered width of an image from its Tailwind size classes or inline style (default: viewport)"""
+    classes = (tag.get('class') or '').split()
+    style = tag.get('style') or ''
+    for cls in classes:
+        match = re.fullmatch(r'w-(\d+)', cls)
+        if match:
+            return f"{int(match.group(1)) * 4}px"
+    match = re.search(r'(?<![\w-])width:\s*(\d+)px', style)
+    if match:
+        return f"{match.group(1)}px"
+    height = None
+    for cls in classes:
+        match = re.fullmatch(r'h-(\d+)', cls)
+        if match:
+            height = int(match.group(1)) * 4
+    match = re.search(r'(?<![\w-])height:\s*(\d+)px', style)
+    if match:
+        height = int(match.group(1))
+    if height:
+        return f"{round(height * entry['width'] / entry['height'])}px"
+    return "100vw"
+
+def _rewrite_img(tag, page, original=None):
+    ref = original or tag.get('src')
+    entry = page.lookup(ref)
+    if entry is None:
+        return None
+    sizes = tag.get('sizes') or _sizes(tag, entry)
+    sources = "".join(f'<source type="{MIME_TYPES[fmt]}" srcset="{page.srcset(ref, entry, fmt)}" sizes="{sizes}">'
+                      for fmt in FORMATS[:-1] if page.srcset(ref, entry, fmt))
+    fallback = entry['variants'][page.fallback(entry)]
+    tag.set('src', page.url(ref, fallback['files']['jpg']))
+    tag.set('srcset', page.srcset(ref, entry, 'jpg'))
+    tag.set('sizes', sizes)
+    # The size of the file src points at; one set by an earlier run (the original's or another
+    # variant's) is replaced, one written by hand is kept
+    ours = [(str(entry['width']), str(entry['height']))] + \
+        [(str(v.get('width')), str(v.get('height'))) for v in entry['variants'].values()]
+    if (tag.get('width'), tag.get('height')) in ours + [(None, None)]:
+        tag.set('width', fallback.get('width', entry['width']))
+        tag.set('height', fallback.get('height', entry['height']))
+    return f'<picture {PICTURE_MARKER}="{ref}">{sources}{tag}</picture>'
+
+def _rewrite_poster(tag, page):
+    """Point a local poster image at a resized JPG; True when it was changed"""
+    entry = page.lookup(tag.get('poster'))
+    if entry is None:
+        return False
+    tag.set('poster', page.url(tag.get('poster'), entry['variants'][page.fallback(entry)]['files']['jpg']))
+    return True
+
+def _rewrite_video(block, page):
+    """preload="none" for every <video>; renditions and poster for one whose source was optimized"""
+    start = VIDEO.match(block)
+    tag = _Tag(start.group('name'), start.group('attrs'), start.group('close'))
+    body = block[start.end():]
+    sources = [(m, _Tag(m.group('name'), m.group('attrs'), m.group('close'))) for m in SOURCE.finditer(body)]
+    ref = entry = None
+    for _, source in sources:
+        ref = source.get(VIDEO_MARKER) or source.get('src')
+        entry = page.videos.get(page.resolve(ref) or '')
+        if entry:
+            break
+    if entry is None:
+        # No renditions (yet): the original file is still fetched only on play
+        changed = _rewrite_poster(tag, page)
+        if tag.get('preload') != 'none':
+            tag.set('preload', 'none')
+            changed = True
+        return str(tag) + body if changed else block
+
+    # Smallest rendition first, each limited to the viewports it is meant for; the largest takes the rest
+    new_sources = []
+    for height, rendition in sorted(entry['renditions'].items(), key=lambda item: int(item[0])):
+        source = _Tag('source', '')
+        source.set('src', page.url(ref, rendition['file']))
+        source.set('type', 'video/mp4')
+        max_viewport = RENDITIONS.get(int(height), {}).get('max_viewport')
+        if max_viewport and height != max(entry['renditions'], key=int):
+            source.set('media', f"(max-width: {max_viewport}px)")
+        source.set(VIDEO_MARKER, ref)
+        new_sources.append(source)
+
+    # The first source of this video becomes the renditions, any others (earlier runs) go
+    out, pos, placed = [], 0, False
+    for match, source in sources:
+        if (source.get(VIDEO_MARKER) or source.get('src')) != ref:
+            continue
+        indent = match.group('indent') or ''
+        out.append(body[pos:match.start()])
+        if not placed:
+            out.append(indent + indent.join(str(s) for s in new_sources))
+            placed = True
+        pos = match.end()
+    out.append(body[pos:])
+
+    # Nothing is fetched before play; a video without a local poster shows a frame of itself
+    tag.set('preload', 'none')
+    if page.resolve(tag.get('poster')) is None:
+        tag.set('poster', page.url(ref, entry['poster']['file']))
+    else:
+        _rewrite_poster(tag, page)
+    return str(tag) + ''.join(out)
+
+def _rewrite_background(tag, page):
+    style = tag.get('style') or ''
+    ref = tag.get(BACKGROUND_MARKER)
+    if ref is None:
+        match = BACKGROUND_URL.search(style)
+        if not match:
+            return False
+        ref = match.group(2)
+    entry = page.lookup(ref)
+    if entry is None:
+        return False
+    style = BACKGROUND_VARS.sub('', BACKGROUND_URL.sub('', style, count=1))
+    declarations = []
+    for w, v in sorted(entry['variants'].items()):
+        options = ", ".join(f"url('{page.url(ref, v['files'][fmt])}') type('{MIME_TYPES[fmt]}')"
+                            for fmt in FORMATS if fmt in v['files'])
+        declarations.append(f"--bg-{w}: image-set({options}); --bg-{w}-jpg: url('{page.url(ref, v['files']['jpg'])}');")
+    tag.set(BACKGROUND_MARKER, ref)
+    tag.set('style', " ".join(declarations + ([style.strip()] if style.strip() else [])))
+    page.backgrounds += 1
+    return True
+
+def _rewrite_preload(tag, page):
+    ref = tag.get(PICTURE_MARKER) or tag.get('href')
+    entry = page.lookup(ref)
+    if entry is None:
+        return None
+    if ref in page.preloaded:
+        return ""  # the rest of a group written on an earlier run
+    page.preloaded.add(ref)
+    widths = sorted(entry['variants'])
+    picks = []  # [first, last, file, format]: neighbouring viewport ranges served by the same file share one link
+    for i, w in enumerate(WIDTHS):
+        files = entry['variants'][max([v for v in widths if v <= w] or widths[:1])]['files']
+        fmt = next(fmt for fmt in FORMATS if fmt in files)
+        if picks and picks[-1][2] == files[fmt]:
+            picks[-1][1] = i
+        else:
+            picks.append([i, i, files[fmt], fmt])
+    links = []
+    for first, last, file, fmt in picks:
+        link = _Tag(tag.name, "", tag.close)
+        link.attrs = [attr[:] for attr in tag.attrs if attr[0].lower() not in ('href', 'type', 'media', PICTURE_MARKER)]
+        link.set('href', page.url(ref, file))
+        link.set('type', MIME_TYPES[fmt])
+        link.set('media', _media(first, last))
+        link.set(PICTURE_MARKER, ref)
+        links.append(str(link))
+    return "".join(links)
+
+def rewrite_html(html, path, variants, videos=None):
+    """Rewrite every image and video reference of one page; returns the new HTML"""
+    page = _Page(path, variants, videos)
+
+    def replace(match):
+        if match.group('skip'):
+            return match.group(0)
+        if match.group('style'):
+            return ""
+        if match.group('video'):
+            return _rewrite_video(match.group(0), page)
+        if match.group('picture'):
+            # Our own earlier output: rebuild it from the original image
+            block = match.group(0)
+            ref = _Tag('picture', re.match(r'<picture([^>]*)>', block).group(1)).get(PICTURE_MARKER)
+            img = IMG.search(block)
+            if img is None:
+                return block
+            tag = _Tag(img.group('name'), img.group('attrs'), img.group('close'))
+            return _rewrite_img(tag, page, ref) or block
+
+        tag = _Tag(match.group('name'), match.group('attrs'), match.group('close'))
+        name = tag.name.lower()
+        if name == 'img':
+            return _rewrite_img(tag, page) or match.group(0)
+        if name == 'link' and (tag.get('rel') or '').lower() == 'preload' and (tag.get('as') or '').lower() == 'image':
+            result = _rewrite_preload(tag, page)
+            return match.group(0) if result is None else result
+        if 'background-image' in (tag.get('style') or '') or tag.get(BACKGROUND_MARKER) is not None:
+            return str(tag) if _rewrite_background(tag, page) else match.group(0)
+        return match.group(0)
+
+    html = TOKEN.sub(replace, html)
+    if page.backgrounds:
+        html = html.replace("</head>", _background_css() + "</head>", 1)
+    return html
+
+def rewrite_pages(paths, check=False):
+    """Rewrite the given pages in place (or only report with check=True); returns the changed paths"""
+    variants = load_variants()
+    videos = load_videos()
+    changed = []
+    for path in paths:
+        with open(path, encoding='utf-8', newline='') as f:
+            html = f.read()
+        result = rewrite_html(html, path, variants, videos)
+        if result == html:
+            continue
+        changed.append(path)
+        if not check:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(result)
+    return changed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Point the HTML pages at the responsive image variants")
+    parser.add_argument('pages', nargs='*', help="pages to rewrite (default: every .html file in the site root)")
+    parser.add_argument('--check', action='store_true', help="only report pages that would change (exit 1 if any)")
+    args = parser.parse_args(argv)
+
+    pages = args.pages or sorted(glob.glob(os.path.join(REPO_ROOT, '*.html')))
+    changed = rewrite_pages(pages, check=args.check)
+    for path in changed:
+        print(f"{'✗ Needs rewriting' if args.check else '✅ Rewrote'}: {_relpath(os.path.abspath(path))}")
+    if not changed:
+        print(f"✅ All {len(pages)} page(s) already use the responsive images")
+    return 1 if args.check and changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
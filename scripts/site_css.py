@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Angaza Tumaini Mission Center - Site Stylesheet
+Static replacement for the Tailwind Play CDN the pages used to load: the CDN
+ships a JIT compiler to every visitor and generates the CSS in the browser.
+This module scans page markup (and scripts, for classes added at runtime) the
+way Tailwind does, and writes Tailwind v3 preflight plus the CSS of only the
+utilities actually found. It covers the utilities, variants (sm:, md:, lg:,
+hover:, focus:, dark:, ...), colour palettes and arbitrary values the site uses
+or is likely to; a token it does not know is simply not generated, as in
+Tailwind. Also minifies CSS.
+
+Usage: python scripts/site_css.py index.html [...]  (prints the generated CSS)
+"""
+
+import argparse
+import re
+import sys
+
+# ===== THEME (Tailwind v3 defaults) =====
+
+SCREENS = {'sm': '640px', 'md': '768px', 'lg': '1024px', 'xl': '1280px', '2xl': '1536px'}
+
+PSEUDO_CLASSES = {
+    'hover': ':hover', 'focus': ':focus', 'focus-visible': ':focus-visible', 'focus-within': ':focus-within',
+    'active': ':active', 'visited': ':visited', 'disabled': ':disabled', 'first': ':first-child',
+    'last': ':last-child', 'odd': ':nth-child(odd)', 'even': ':nth-child(even)',
+}
+
+SPACING = {'0': '0px', 'px': '1px'}
+for _n in (0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 16, 20, 24, 28, 32, 36, 40, 44,
+           48, 52, 56, 60, 64, 72, 80, 96):
+    SPACING[f"{_n:g}"] = f"{_n / 4:g}rem"
+
+FRACTIONS = {f"{a}/{b}": f"{a / b * 100:.6f}".rstrip('0').rstrip('.') + '%'
+             for b in (2, 3, 4, 5, 6, 12) for a in range(1, b)}
+
+COLORS = {'white': '#ffffff', 'black': '#000000'}
+_PALETTES = {
+    'gray': 'f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712',
+    'red': 'fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a',
+    'orange': 'fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407',
+    'yellow': 'fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006',
+    'green': 'f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16',
+    'emerald': 'ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22',
+    'blue': 'eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554',
+    'indigo': 'eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b',
+    'purple': 'faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764',
+    'pink': 'fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724',
+}
+for _name, _values in _PALETTES.items():
+    for _shade, _hex in zip((50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 950), _values.split()):
+        COLORS[f"{_name}-{_shade}"] = '#' + _hex
+SPECIAL_COLORS = {'transparent': 'transparent', 'current': 'currentColor', 'inherit': 'inherit'}
+
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'), '6xl': ('3.75rem', '1'),
+    '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1'),
+}
+FONT_WEIGHTS = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+                'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+FONT_FAMILIES = {
+    'sans': 'ui-sans-serif,system-ui,sans-serif,"Apple Color Emoji","Segoe UI Emoji","Segoe UI Symbol","Noto Color Emoji"',
+    'serif': 'ui-serif,Georgia,Cambria,"Times New Roman",Times,serif',
+    'mono': 'ui-monospace,SFMono-Regular,Menlo,Monaco,Consolas,"Liberation Mono","Courier New",monospace',
+}
+LEADING = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2',
+           **{str(n): f"{n / 4:g}rem" for n in range(3, 11)}}
+TRACKING = {'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em', 'wide': '0.025em', 'wider': '0.05em',
+            'widest': '0.1em'}
+RADII = {'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem', 'xl': '0.75rem',
+         '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px'}
+SHADOWS = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+    'none': '0 0 #0000',
+}
+MAX_WIDTHS = {'none': 'none', 'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem',
+              '2xl': '42rem', '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem',
+              'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content', 'prose': '65ch'}
+Z_INDEX = {'0': '0', '10': '10', '20': '20', '30': '30', '40': '40', '50': '50', 'auto': 'auto'}
+DURATIONS = ('0', '75', '100', '150', '200', '300', '500', '700', '1000')
+EASINGS = {'linear': 'linear', 'in': 'cubic-bezier(0.4, 0, 1, 1)', 'out': 'cubic-bezier(0, 0, 0.2, 1)',
+           'in-out': 'cubic-bezier(0.4, 0, 0.2, 1)'}
+SCALES = ('0', '50', '75', '90', '95', '100', '105', '110', '125', '150')
+OPACITIES = tuple(str(n) for n in range(0, 101, 5))
+
+TRANSFORM = ('translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate)) '
+             'skewX(var(--tw-skew-x)) skewY(var(--tw-skew-y)) scaleX(var(--tw-scale-x)) scaleY(var(--tw-scale-y))')
+BOX_SHADOW = 'var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)'
+TRANSITIONS = {
+    '': 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, box-shadow, '
+        'transform, filter, backdrop-filter',
+    'all': 'all', 'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity', 'shadow': 'box-shadow', 'transform': 'transform', 'none': 'none',
+}
+
+# Tailwind v3 preflight (modern-normalize plus resets), and the defaults of the --tw-* variables
+PREFLIGHT = """
+*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+::before,::after{--tw-content:''}
+html,:host{line-height:1.5;-webkit-text-size-adjust:100%%;-moz-tab-size:4;tab-size:4;font-family:%(sans)s;font-feature-settings:normal;font-variation-settings:normal;-webkit-tap-highlight-color:transparent}
+body{margin:0;line-height:inherit}
+hr{height:0;color:inherit;border-top-width:1px}
+abbr:where([title]){text-decoration:underline dotted}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+code,kbd,samp,pre{font-family:%(mono)s;font-feature-settings:normal;font-variation-settings:normal;font-size:1em}
+small{font-size:80%%}
+sub,sup{font-size:75%%;line-height:0;position:relative;vertical-align:baseline}
+sub{bottom:-0.25em}
+sup{top:-0.5em}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,optgroup,select,textarea{font-family:inherit;font-feature-settings:inherit;font-variation-settings:inherit;font-size:100%%;font-weight:inherit;line-height:inherit;letter-spacing:inherit;color:inherit;margin:0;padding:0}
+button,select{text-transform:none}
+button,input:where([type='button']),input:where([type='reset']),input:where([type='submit']){-webkit-appearance:button;background-color:transparent;background-image:none}
+:-moz-focusring{outline:auto}
+:-moz-ui-invalid{box-shadow:none}
+progress{vertical-align:baseline}
+::-webkit-inner-spin-button,::-webkit-outer-spin-button{height:auto}
+[type='search']{-webkit-appearance:textfield;outline-offset:-2px}
+::-webkit-search-decoration{-webkit-appearance:none}
+::-webkit-file-upload-button{-webkit-appearance:button;font:inherit}
+summary{display:list-item}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+fieldset{margin:0;padding:0}
+legend{padding:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+dialog{padding:0}
+textarea{resize:vertical}
+input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}
+button,[role="button"]{cursor:pointer}
+:disabled{cursor:default}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%%;height:auto}
+[hidden]:where(:not([hidden="until-found"])){display:none}
+*,::before,::after,::backdrop{--tw-translate-x:0;--tw-translate-y:0;--tw-rotate:0;--tw-skew-x:0;--tw-skew-y:0;--tw-scale-x:1;--tw-scale-y:1;--tw-ring-inset: ;--tw-ring-offset-width:0px;--tw-ring-offset-color:#fff;--tw-ring-color:rgb(59 130 246 / 0.5);--tw-ring-offset-shadow:0 0 #0000;--tw-ring-shadow:0 0 #0000;--tw-shadow:0 0 #0000;--tw-shadow-colored:0 0 #0000}
+""".strip() % FONT_FAMILIES
+
+# ===== CLASS CANDIDATES =====
+
+# Anything between quotes, whitespace and tag punctuation may be a class name;
+# arbitrary values ([...]) keep their colons and parentheses
+CANDIDATE = re.compile(r"""[^\s"'`<>={};,]*\[[^\s"'`\]]+\][^\s"'`<>=;,)]*|[^\s"'`<>=(){};,\\]+""")
+
+def candidates(text):
+    """Possible class names in markup or script text"""
+    return set(CANDIDATE.findall(text))
+
+# ===== UTILITIES =====
+
+def _arbitrary(value):
+    """Value of an arbitrary [..] value (underscores are spaces), or None"""
+    if value.startswith('[') and value.endswith(']') and len(value) > 2:
+        return value[1:-1].replace('_', ' ')
+    return None
+
+def _color(value):
+    """CSS colour of a palette name with an optional /opacity, or None"""
+    value, _, alpha = value.partition('/')
+    if value in SPECIAL_COLORS:
+        return None if alpha else SPECIAL_COLORS[value]
+    arbitrary = _arbitrary(value)
+    if arbitrary is not None:
+        if arbitrary.startswith('color:'):
+            arbitrary = arbitrary[6:]
+        elif not arbitrary.startswith(('#', 'rgb', 'hsl', 'var(')):
+            return None
+        return None if alpha else arbitrary
+    if value not in COLORS:
+        return None
+    hex_ = COLORS[value]
+    if not alpha:
+        return hex_
+    if alpha.isdigit() and int(alpha) <= 100:
+        opacity = f"{int(alpha) / 100:g}"
+    else:
+        opacity = _arbitrary(alpha)
+        if opacity is None:
+            return None
+    r, g, b = (int(hex_[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgb({r} {g} {b} / {opacity})"
+
+def _length(value, scale, negative=False):
+    """Value from a scale or an arbitrary length"""
+    result = scale.get(value)
+    if result is None:
+        result = _arbitrary(value)
+    if result is None:
+        return None
+    if negative:
+        return None if result in ('auto', 'none') or not result[0].isdigit() else '-' + result
+    return result
+
+def _sizes(extra):
+    return {**SPACING, **FRACTIONS, 'auto': 'auto', 'full': '100%', 'min': 'min-content', 'max': 'max-content',
+            'fit': 'fit-content', **extra}
+
+WIDTHS = _sizes({'screen': '100vw'})
+HEIGHTS = _sizes({'screen': '100vh'})
+INSETS = {**SPACING, **FRACTIONS, 'auto': 'auto', 'full': '100%'}
+
+STATIC = [
+    ('sr-only', {'position': 'absolute', 'width': '1px', 'height': '1px', 'padding': '0', 'margin': '-1px',
+                 'overflow': 'hidden', 'clip': 'rect(0, 0, 0, 0)', 'white-space': 'nowrap', 'border-width': '0'}),
+    ('pointer-events-none', {'pointer-events': 'none'}),
+    ('pointer-events-auto', {'pointer-events': 'auto'}),
+    ('visible', {'visibility': 'visible'}),
+    ('invisible', {'visibility': 'hidden'}),
+] + [(name, {'position': name}) for name in ('static', 'fixed', 'absolute', 'relative', 'sticky')] + [
+    ('mx-auto', {'margin-left': 'auto', 'margin-right': 'auto'}),
+] + [(name, {'display': name}) for name in ('block', 'inline-block', 'inline', 'flex', 'inline-flex', 'table',
+                                           'grid', 'inline-grid', 'contents', 'list-item')] + [
+    ('hidden', {'display': 'none'}),
+    ('flex-1', {'flex': '1 1 0%'}),
+    ('flex-auto', {'flex': '1 1 auto'}),
+    ('flex-none', {'flex': 'none'}),
+    ('flex-shrink-0', {'flex-shrink': '0'}),
+    ('shrink-0', {'flex-shrink': '0'}),
+    ('flex-grow', {'flex-grow': '1'}),
+    ('grow', {'flex-grow': '1'}),
+    ('flex-grow-0', {'flex-grow': '0'}),
+    ('transform', {'transform': TRANSFORM}),
+    ('transform-none', {'transform': 'none'}),
+    ('cursor-pointer', {'cursor': 'pointer'}),
+    ('cursor-default', {'cursor': 'default'}),
+    ('list-disc', {'list-style-type': 'disc'}),
+    ('list-decimal', {'list-style-type': 'decimal'}),
+    ('list-none', {'list-style-type': 'none'}),
+    ('flex-row', {'flex-direction': 'row'}),
+    ('flex-row-reverse', {'flex-direction': 'row-reverse'}),
+    ('flex-col', {'flex-direction': 'column'}),
+    ('flex-col-reverse', {'flex-direction': 'column-reverse'}),
+    ('flex-wrap', {'flex-wrap': 'wrap'}),
+    ('flex-nowrap', {'flex-wrap': 'nowrap'}),
+] + [(f"items-{name}", {'align-items': value}) for name, value in (
+    ('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'), ('baseline', 'baseline'),
+    ('stretch', 'stretch'))] + [(f"justify-{name}", {'justify-content': value}) for name, value in (
+    ('start', 'flex-start'), ('end', 'flex-end'), ('center', 'center'), ('between', 'space-between'),
+    ('around', 'space-around'), ('evenly', 'space-evenly'))] + [
+    (f"overflow-{name}", {'overflow': name}) for name in ('auto', 'hidden', 'visible', 'scroll')] + [
+    (f"overflow-{axis}-{name}", {f"overflow-{axis}": name}) for axis in 'xy' for name in ('auto', 'hidden', 'scroll')] + [
+    ('truncate', {'overflow': 'hidden', 'text-overflow': 'ellipsis', 'white-space': 'nowrap'}),
+    ('whitespace-normal', {'white-space': 'normal'}),
+    ('whitespace-nowrap', {'white-space': 'nowrap'}),
+    ('whitespace-pre-line', {'white-space': 'pre-line'}),
+    ('break-words', {'overflow-wrap': 'break-word'}),
+    ('object-contain', {'object-fit': 'contain'}),
+    ('object-cover', {'object-fit': 'cover'}),
+    ('object-center', {'object-position': 'center'}),
+] + [(f"text-{name}", {'text-align': name}) for name in ('left', 'center', 'right', 'justify')] + [
+    ('uppercase', {'text-transform': 'uppercase'}),
+    ('lowercase', {'text-transform': 'lowercase'}),
+    ('capitalize', {'text-transform': 'capitalize'}),
+    ('normal-case', {'text-transform': 'none'}),
+    ('italic', {'font-style': 'italic'}),
+    ('not-italic', {'font-style': 'normal'}),
+    ('underline', {'text-decoration-line': 'underline'}),
+    ('line-through', {'text-decoration-line': 'line-through'}),
+    ('no-underline', {'text-decoration-line': 'none'}),
+    ('antialiased', {'-webkit-font-smoothing': 'antialiased', '-moz-osx-font-smoothing': 'grayscale'}),
+    ('outline-none', {'outline': '2px solid transparent', 'outline-offset': '2px'}),
+    ('ring-inset', {'--tw-ring-inset': 'inset'}),
+    ('ease-linear', {'transition-timing-function': 'linear'}),
+]
+STATIC_ORDER = {name: i for i, (name, _) in enumerate(STATIC)}
+STATIC_RULES = dict(STATIC)
+
+def _sides(prefix, prop, value):
+    """margin/padding style declarations of m, mx, mt, ..."""
+    sides = {'': ('',), 'x': ('-left', '-right'), 'y': ('-top', '-bottom'), 't': ('-top',), 'r': ('-right',),
+             'b': ('-bottom',), 'l': ('-left',), 's': ('-inline-start',), 'e': ('-inline-end',)}[prefix]
+    return {prop + side: value for side in sides}
+
+def _ring(width):
+    return {'--tw-ring-offset-shadow': 'var(--tw-ring-inset) 0 0 0 var(--tw-ring-offset-width) var(--tw-ring-offset-color)',
+            '--tw-ring-shadow': f"var(--tw-ring-inset) 0 0 0 calc({width} + var(--tw-ring-offset-width)) var(--tw-ring-color)",
+            'box-shadow': 'var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)'}
+
+# Within one utility, all sides come before two, and those before a single side (p, px, py, pt, ...)
+SIDE_ORDER = {'': 0, 'inset': 0, 'x': 1, 'inset-x': 1, 'y': 2, 'inset-y': 2, 's': 3, 'e': 4,
+              't': 5, 'top': 5, 'r': 6, 'right': 6, 'b': 7, 'bottom': 7, 'l': 8, 'left': 8}
+
+# Dynamic utilities, in the order Tailwind emits them: (pattern, handler)
+# A handler gets the match and whether the class had a leading - and returns declarations
+# (or (child selector, declarations)) or None when the value is not valid
+def _dynamic():
+    rules = []
+
+    def rule(pattern, handler):
+        rules.append((re.compile(pattern + '$'), handler))
+
+    rule(r'(?P<side>inset-x|inset-y|inset|top|right|bottom|left)-(.+)', lambda m, neg: (
+        lambda v: v and {'inset': {'top': v, 'right': v, 'bottom': v, 'left': v},
+                         'inset-x': {'left': v, 'right': v}, 'inset-y': {'top': v, 'bottom': v}}.get(
+            m[1], {m[1]: v}))(_length(m[2], INSETS, neg)))
+    rule(r'z-(.+)', lambda m, neg: (lambda v: v and {'z-index': v})(_length(m[1], Z_INDEX, neg)))
+    rule(r'order-(\d+|first|last|none)', lambda m, neg: {'order': {'first': '-9999', 'last': '9999', 'none': '0'}.get(
+        m[1], ('-' if neg else '') + m[1])})
+    rule(r'col-span-(\d+|full)', lambda m, neg: None if neg else {
+        'grid-column': '1 / -1' if m[1] == 'full' else f"span {m[1]} / span {m[1]}"})
+    rule(r'm(?P<side>[xytrblse]?)-(.+)', lambda m, neg: (lambda v: v and _sides(m[1], 'margin', v))(
+        _length(m[2], {**SPACING, 'auto': 'auto'}, neg)))
+    rule(r'h-(.+)', lambda m, neg: None if neg else (lambda v: v and {'height': v})(_length(m[1], HEIGHTS)))
+    rule(r'max-h-(.+)', lambda m, neg: None if neg else (lambda v: v and {'max-height': v})(
+        _length(m[1], {**SPACING, 'full': '100%', 'screen': '100vh', 'none': 'none'})))
+    rule(r'min-h-(.+)', lambda m, neg: None if neg else (lambda v: v and {'min-height': v})(
+        _length(m[1], {'0': '0px', 'full': '100%', 'screen': '100vh'})))
+    rule(r'w-(.+)', lambda m, neg: None if neg else (lambda v: v and {'width': v})(_length(m[1], WIDTHS)))
+    rule(r'min-w-(.+)', lambda m, neg: None if neg else (lambda v: v and {'min-width': v})(
+        _length(m[1], {'0': '0px', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'})))
+    rule(r'max-w-(.+)', lambda m, neg: None if neg else (lambda v: v and {'max-width': v})(_length(m[1], MAX_WIDTHS)))
+    rule(r'(translate-[xy])-(.+)', lambda m, neg: (lambda v: v and {f"--tw-{m[1]}": v, 'transform': TRANSFORM})(
+        _length(m[2], INSETS, neg)))
+    rule(r'rotate-(\d+)', lambda m, neg: {'--tw-rotate': f"{'-' if neg else ''}{m[1]}deg", 'transform': TRANSFORM})
+    rule(r'scale(-[xy])?-(\d+)', lambda m, neg: None if neg or m[2] not in SCALES else {
+        **{f"--tw-scale-{axis}": f"{int(m[2]) / 100:g}" for axis in (m[1][1:] if m[1] else 'xy')},
+        'transform': TRANSFORM})
+    rule(r'grid-cols-(\d+|none)', lambda m, neg: None if neg else {
+        'grid-template-columns': 'none' if m[1] == 'none' else f"repeat({m[1]}, minmax(0, 1fr))"})
+    rule(r'gap(-[xy])?-(.+)', lambda m, neg: None if neg else (lambda v: v and {
+        {'': 'gap', '-x': 'column-gap', '-y': 'row-gap'}[m[1] or '']: v})(_length(m[2], SPACING)))
+    rule(r'space-([xy])-(.+)', lambda m, neg: (lambda v: v and (
+        ' > :not([hidden]) ~ :not([hidden])', {'margin-left' if m[1] == 'x' else 'margin-top': v}))(
+        _length(m[2], SPACING, neg)))
+    rule(r'rounded(?:-(?P<side>[trbl]{1,2}))?(?:-(.+))?', lambda m, neg: None if neg or (m[2] or '') not in RADII else {
+        f"border{corner}-radius": RADII[m[2] or ''] for corner in _corners(m[1])})
+    rule(r'border(?:-(?P<side>[xytrbl]))?(?:-(\d+))?', lambda m, neg: None if neg else {
+        prop: f"{m[2] or 1}px" for prop in _border_props(m[1], 'width')})
+    rule(r'border(?:-(?P<side>[xytrbl]))?-(.+)', lambda m, neg: None if neg else (lambda c: c and {
+        prop: c for prop in _border_props(m[1], 'color')})(_color(m[2])))
+    rule(r'bg-(.+)', lambda m, neg: None if neg else (lambda c: c and {'background-color': c})(_color(m[1])))
+    rule(r'p(?P<side>[xytrblse]?)-(.+)', lambda m, neg: None if neg else (lambda v: v and _sides(m[1], 'padding', v))(
+        _length(m[2], SPACING)))
+    rule(r'font-(sans|serif|mono)', lambda m, neg: None if neg else {'font-family': FONT_FAMILIES[m[1]]})
+    rule(r'text-(xs|sm|base|lg|\d?xl)', lambda m, neg: None if neg or m[1] not in FONT_SIZES else {
+        'font-size': FONT_SIZES[m[1]][0], 'line-height': FONT_SIZES[m[1]][1]})
+    rule(r'font-(\w+)', lambda m, neg: None if neg or m[1] not in FONT_WEIGHTS else {'font-weight': FONT_WEIGHTS[m[1]]})
+    rule(r'leading-(.+)', lambda m, neg: None if neg else (lambda v: v and {'line-height': v})(_length(m[1], LEADING)))
+    rule(r'tracking-(.+)', lambda m, neg: None if neg else (lambda v: v and {'letter-spacing': v})(
+        _length(m[1], TRACKING)))
+    rule(r'text-(.+)', lambda m, neg: None if neg else (lambda c: c and {'color': c})(_color(m[1])))
+    rule(r'opacity-(\d+)', lambda m, neg: None if neg or m[1] not in OPACITIES else {'opacity': f"{int(m[1]) / 100:g}"})
+    rule(r'shadow(?:-(.+))?', lambda m, neg: None if neg or (m[1] or '') not in SHADOWS else {
+        '--tw-shadow': SHADOWS[m[1] or ''], 'box-shadow': BOX_SHADOW})
+    rule(r'ring(?:-(\d+))?', lambda m, neg: None if neg else _ring(f"{3 if m[1] is None else m[1]}px"))
+    rule(r'ring-(.+)', lambda m, neg: None if neg else (lambda c: c and {'--tw-ring-color': c})(_color(m[1])))
+    rule(r'transition(?:-(.+))?', lambda m, neg: None if neg or (m[1] or '') not in TRANSITIONS else {
+        'transition-property': TRANSITIONS[m[1] or ''],
+        **({} if m[1] == 'none' else {'transition-timing-function': 'cubic-bezier(0.4, 0, 0.2, 1)',
+                                      'transition-duration': '150ms'})})
+    rule(r'duration-(\d+)', lambda m, neg: None if neg or m[1] not in DURATIONS else {
+        'transition-duration': f"{m[1]}ms"})
+    rule(r'ease-(.+)', lambda m, neg: None if neg or m[1] not in EASINGS else {
+        'transition-timing-function': EASINGS[m[1]]})
+    return rules
+
+def _corners(side):
+    return {None: [''], 't': ['-top-left', '-top-right'], 'r': ['-top-right', '-bottom-right'],
+            'b': ['-bottom-right', '-bottom-left'], 'l': ['-top-left', '-bottom-left'],
+            'tl': ['-top-left'], 'tr': ['-top-right'], 'br': ['-bottom-right'], 'bl': ['-bottom-left']}.get(side, [])
+
+def _border_props(side, what):
+    sides = {None: [''], 'x': ['-left', '-right'], 'y': ['-top', '-bottom'], 't': ['-top'], 'r': ['-right'],
+             'b': ['-bottom'], 'l': ['-left']}[side]
+    return [f"border{s}-{what}" for s in sides]
+
+DYNAMIC = _dynamic()
+
+def _escape(name):
+    """Class name as a CSS selector"""
+    return re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', name)
+
+def _split_variants(token):
+    """'md:hover:bg-white/50' -> (['md', 'hover'], 'bg-white/50'); colons inside [..] do not split"""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(token):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ':' and depth == 0:
+            parts.append(token[start:i])
+            start = i + 1
+    return parts, token[start:]
+
+def utility(token):
+    """Sort key and CSS rule of one class name, or None if it is not a utility"""
+    variants, name = _split_variants(token)
+    important = name.startswith('!')
+    name = name.lstrip('!')
+    negative = name.startswith('-')
+    name = name[1:] if negative else name
+
+    child, declarations, order = '', None, None
+    if name in STATIC_RULES and not negative:
+        declarations, order = STATIC_RULES[name], (STATIC_ORDER[name], 0)
+    else:
+        for i, (pattern, handler) in enumerate(DYNAMIC):
+            match = pattern.match(name)
+            if match:
+                declarations = handler(match, negative)
+                if declarations:
+                    order = (len(STATIC) + i, SIDE_ORDER.get(match.groupdict().get('side') or '', 9))
+                    break
+    if not declarations:
+        return None
+    if isinstance(declarations, tuple):
+        child, declarations = declarations
+
+    selector, media = '.' + _escape(token), []
+    screen = 0
+    for variant in variants:
+        if variant in SCREENS:
+            if screen:
+                return None
+            screen = list(SCREENS).index(variant) + 1
+            media.append(f"(min-width:{SCREENS[variant]})")
+        elif variant == 'dark':
+            media.append('(prefers-color-scheme:dark)')
+        elif variant in PSEUDO_CLASSES:
+            selector += PSEUDO_CLASSES[variant]
+        elif variant.startswith('group-') and variant[6:] in PSEUDO_CLASSES:
+            selector = f".group{PSEUDO_CLASSES[variant[6:]]} {selector}"
+        else:
+            return None
+    suffix = '!important' if important else ''
+    body = ';'.join(f"{prop}:{value}{suffix}" for prop, value in declarations.items())
+    # Plain utilities first, then state variants, then each breakpoint in turn
+    return (screen, 'dark' in variants, len(variants) - bool(screen), order, token), ' and '.join(media), \
+        f"{selector}{child}{{{body}}}"
+
+def generate(classes):
+    """CSS of every utility among the class names, in Tailwind's order"""
+    blocks = []
+    for _, media, css in sorted(filter(None, map(utility, classes))):
+        if blocks and blocks[-1][0] == media:
+            blocks[-1][1].append(css)
+        else:
+            blocks.append((media, [css]))
+    return '\n'.join(f"@media {media}{{{''.join(rules)}}}" if media else '\n'.join(rules)
+                     for media, rules in blocks)
+
+def stylesheet(classes):
+    """Preflight followed by the utilities used"""
+    return PREFLIGHT + '\n' + generate(classes) + '\n'
+
+# ===== MINIFY / CRITICAL =====
+
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+CSS_SPACE = re.compile(r'\s*([{}:;,>~])\s*')
+
+def minify_css(css):
+    """Drop comments and the whitespace around CSS punctuation"""
+    css = CSS_COMMENT.sub('', css)
+    # Protect strings and url()/image-set() arguments from the space squeezing
+    kept = []
+    def keep(match):
+        kept.append(match.group(0))
+        return f"\0{len(kept) - 1}\0"
+    css = re.sub(r'"[^"]*"|\'[^\']*\'', keep, css)
+    css = re.sub(r'\s+', ' ', css)
+    css = CSS_SPACE.sub(r'\1', css)
+    # An empty custom property (--tw-ring-inset: ;) needs its space
+    css = css.replace(':;', ': ;').replace(';}', '}').strip()
+    return re.sub(r'\0(\d+)\0', lambda m: kept[int(m.group(1))], css)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the Tailwind-compatible CSS the given pages use")
+    parser.add_argument('pages', nargs='+', help="HTML (or script) files to scan for class names")
+    parser.add_argument('--utilities-only', action='store_true', help="leave out the preflight base styles")
+    args = parser.parse_args(argv)
+    classes = set()
+    for path in args.pages:
+        with open(path, encoding='utf-8') as f:
+            classes |= candidates(f.read())
+    sys.stdout.write(generate(classes) + '\n' if args.utilities_only else stylesheet(classes))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
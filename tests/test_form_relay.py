@@ -0,0 +1,121 @@
+"""
+Angaza Tumaini Mission Center - Form Relay Tests
+Malformed requests and incomplete submissions against a relay on a temporary queue.
+
+Usage: python -m unittest discover tests
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import form_relay  # noqa: E402
+
+FORM = form_relay.FORM_IDS[0]
+
+class RelayTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = form_relay.SubmissionQueue(os.path.join(self.tmp.name, 'queue.sqlite3'))
+        # Nothing is forwarded in these tests; the upstream is never contacted
+        self.relay = form_relay.Relay(self.queue, 'http://127.0.0.1:9', log=open(os.devnull, 'w'))
+        self.server = await asyncio.start_server(
+            lambda r, w: form_relay.serve_connection(r, w, self.relay.handle), '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.relay.log.close()
+        self.queue.close()
+        self.tmp.cleanup()
+
+    async def request(self, head, body=b''):
+        """Status and JSON body of the answer to one raw request"""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+        status_line, headers = await form_relay.read_head(reader)
+        data = await form_relay.read_body(reader, headers)
+        writer.close()
+        return int(status_line.split(' ')[1]), json.loads(data) if data else None
+
+    def post(self, fields, length=None):
+        body = json.dumps(fields).encode('utf-8')
+        length = len(body) if length is None else length
+        head = (f"POST /f/{FORM} HTTP/1.1\r\nHost: relay\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {length}\r\n\r\n")
+        return self.request(head, body)
+
+    async def test_bad_content_length_is_answered_400(self):
+        for value in ('abc', '-5', '1e3', ' 12x'):
+            with self.subTest(value=value):
+                status, data = await self.post({'email': 'a@example.org', 'message': 'Hi'}, value)
+                self.assertEqual(status, 400)
+                self.assertIn('Content-Length', data['errors'][0]['message'])
+        self.assertEqual(self.queue.counts()['queued'], 0)
+
+    async def test_oversized_content_length_is_answered_413(self):
+        status, _ = await self.post({}, form_relay.MAX_BODY + 1)
+        self.assertEqual(status, 413)
+
+    async def test_bad_chunk_size_is_answered_400(self):
+        head = f"POST /f/{FORM} HTTP/1.1\r\nHost: relay\r\nTransfer-Encoding: chunked\r\n\r\n"
+        status, _ = await self.request(head, b"zz\r\n")
+        self.assertEqual(status, 400)
+        status, _ = await self.request(head, b"1" * 100000 + b"\r\n")
+        self.assertEqual(status, 400)
+
+    async def test_chunk_without_trailing_crlf_is_answered_400(self):
+        head = f"POST /f/{FORM} HTTP/1.1\r\nHost: relay\r\nTransfer-Encoding: chunked\r\n\r\n"
+        status, data = await self.request(head, b"2\r\n{}XX0\r\n\r\n")
+        self.assertEqual(status, 400)
+        self.assertIn('CRLF', data['errors'][0]['message'])
+        self.assertEqual(self.queue.counts()['queued'], 0)
+
+    async def test_chunked_submission_is_queued(self):
+        body = json.dumps({'name': 'Amina', 'email': 'amina@example.org', 'message': 'Habari'}).encode('utf-8')
+        head = (f"POST /f/{FORM} HTTP/1.1\r\nHost: relay\r\nContent-Type: application/json\r\n"
+                f"Transfer-Encoding: chunked\r\n\r\n")
+        chunks = b"".join(b"%x\r\n%s\r\n" % (len(part), part) for part in (body[:10], body[10:]))
+        status, _ = await self.request(head, chunks + b"0\r\n\r\n")
+        self.assertEqual(status, 200)
+        self.assertEqual(self.queue.counts()['queued'], 1)
+
+    async def test_cancelled_connection_ends_quietly(self):
+        tasks = []
+        async def accept(reader, writer):
+            tasks.append(asyncio.current_task())
+            await form_relay.serve_connection(reader, writer, self.relay.handle)
+        server = await asyncio.start_server(accept, '127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+        writer.write(f"POST /f/{FORM} HTTP/1.1\r\nHost: relay\r\nContent-Length: 10\r\n\r\nab".encode('latin-1'))
+        await writer.drain()
+        while not tasks:
+            await asyncio.sleep(0.01)
+        # As on shutdown: the request is half read when the connection's task is cancelled
+        tasks[0].cancel()
+        await asyncio.wait(tasks)
+        self.assertFalse(tasks[0].cancelled())
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    async def test_missing_fields_are_answered_422_and_not_queued(self):
+        status, data = await self.post({'name': 'Amina', 'email': 'not an address', 'message': ''})
+        self.assertEqual(status, 422)
+        self.assertEqual({e['field'] for e in data['errors']}, {'email', 'message'})
+        self.assertEqual(self.queue.counts()['queued'], 0)
+
+    async def test_complete_submission_is_queued(self):
+        status, data = await self.post({'name': 'Amina', 'email': 'amina@example.org', 'message': 'Habari'})
+        self.assertEqual((status, data), (200, {'ok': True, 'queued': True}))
+        self.assertEqual(self.queue.counts()['queued'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
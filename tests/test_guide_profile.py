@@ -0,0 +1,32 @@
+"""
+Angaza Tumaini Mission Center - Build Profile Tests
+Page accounting of --profile: every page belongs to exactly one section.
+
+Usage: python -m unittest discover tests
+"""
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import generate_comprehensive_guide as generator  # noqa: E402
+from guide_profile import BuildProfile  # noqa: E402
+
+class ProfilePagesTest(unittest.TestCase):
+    def test_section_page_ranges_are_disjoint_and_cover_the_document(self):
+        for variant in ('full', 'donor-brief'):
+            with self.subTest(variant=variant):
+                profile = BuildProfile(variant)
+                generator.create_comprehensive_guide(io.BytesIO(), variant=variant, cache_dir=None, log=None,
+                                                     profile=profile)
+                ranges = [stats['pages'] for stats in profile.report['sections']]
+                self.assertEqual(ranges[0][0], 1)
+                for (_, last), (first, _) in zip(ranges, ranges[1:]):
+                    self.assertEqual(first, last + 1, ranges)
+                self.assertEqual(ranges[-1][1], profile.report['pages'])
+
+if __name__ == '__main__':
+    unittest.main()